@@ -0,0 +1,86 @@
+"""
+Memory held by repeated dialog/project responses with and without `kwork.identity.IdentityMap`.
+
+Run: uv run python benchmarks/identity_map.py [--users 2000] [--refreshes 20]
+
+Simulates a bot that refreshes its dialog list and the project feed `--refreshes` times and
+keeps every parsed page (as caches and handler state tend to do). Each response is freshly
+decoded JSON, as from the API. Prints the memory retained (tracemalloc) and the parse time per
+refresh.
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from typing import Any
+
+from kwork.identity import IdentityMap
+from kwork.schema import DialogMessage, WantWorker
+from kwork.schema.adapters import parse_list
+
+
+def _payloads(users: int) -> tuple[str, str]:
+    dialogs = [
+        {
+            "user_id": n,
+            "username": f"user_{n}",
+            "profilepicture": f"https://cdn.kwork.ru/files/avatar/large/{n % 97}/{n}-1.jpg",
+            "last_message": "Здравствуйте! Подскажите, пожалуйста, по срокам",
+            "time": 1_700_000_000 + n,
+            "status": "active",
+            "link": f"https://kwork.ru/inbox/user_{n}",
+        }
+        for n in range(users)
+    ]
+    projects = [
+        {
+            "id": n,
+            "user_id": n,
+            "username": f"user_{n}",
+            "profile_picture": f"https://cdn.kwork.ru/files/avatar/large/{n % 97}/{n}-1.jpg",
+            "title": f"Проект {n % 50}",
+            "status": "active",
+            "price": 1000 + n,
+        }
+        for n in range(users // 2)
+    ]
+    return json.dumps(dialogs), json.dumps(projects)
+
+
+def _run(users: int, refreshes: int, identity: IdentityMap | None) -> tuple[int, float]:
+    dialogs_json, projects_json = _payloads(users)
+    kept: list[Any] = []
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    for _ in range(refreshes):
+        dialogs = parse_list(DialogMessage, json.loads(dialogs_json))
+        projects = parse_list(WantWorker, json.loads(projects_json))
+        if identity is not None:
+            dialogs = identity.canonical_all(dialogs)
+            projects = identity.canonical_all(projects)
+        kept.append((dialogs, projects))
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    retained, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return retained, elapsed / refreshes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--refreshes", type=int, default=20)
+    args = parser.parse_args()
+
+    for name, identity in (("plain", None), ("identity map", IdentityMap())):
+        retained, per_refresh = _run(args.users, args.refreshes, identity)
+        print(
+            f"{name:<13} retained {retained / 2**20:7.1f} MiB  {per_refresh * 1e3:6.1f} ms/refresh"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Cold import time of the package entry points.
+
+Run: uv run python benchmarks/import_time.py [--runs 15]
+
+Every statement is executed in a fresh interpreter, so nothing is shared between runs except the
+bytecode cache; the median wall time of the statement itself is reported.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SOURCE = Path(__file__).resolve().parents[1] / "source"
+
+STATEMENTS = (
+    "import kwork",
+    "from kwork.api import KworkAPI",
+    "from kwork import Kwork",
+    "from kwork import KworkBot",
+    "from kwork import Kwork; Kwork('x', 'y').web",
+)
+
+_TIMER = "import time; _t = time.perf_counter(); {stmt}; print(time.perf_counter() - _t)"
+
+
+def _measure(stmt: str, runs: int) -> float:
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join([str(SOURCE), os.environ.get("PYTHONPATH", "")]),
+    }
+    samples: list[float] = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", _TIMER.format(stmt=stmt)],
+            capture_output=True,
+            check=True,
+            env=env,
+            text=True,
+        )
+        samples.append(float(out.stdout.strip().splitlines()[-1]))
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=15)
+    args = parser.parse_args()
+
+    _measure("import kwork", 1)  # make sure .pyc files exist
+    print(f"median of {args.runs} fresh interpreters")
+    for stmt in STATEMENTS:
+        print(f"{_measure(stmt, args.runs) * 1000:8.1f} ms  {stmt}")
+
+
+if __name__ == "__main__":
+    main()
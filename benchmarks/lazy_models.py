@@ -0,0 +1,96 @@
+"""
+Eager (per-item / TypeAdapter) vs lazy response models: CPU and memory per 10k items.
+
+Run: uv run python benchmarks/lazy_models.py [--items 10000]
+
+Every scenario parses a list of `WantWorker`-shaped dicts and reads `id` and `title` of each
+item, which is the typical "list projects and filter" access pattern.
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from kwork.schema import WantWorker
+from kwork.schema.adapters import parse_list
+from kwork.schema.lazy import LazyModel
+
+
+def _make_items(n: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": i,
+            "status": "active",
+            "user_id": 1000 + i,
+            "username": f"user{i}",
+            "profile_picture": f"https://cdn.kwork.ru/files/avatar/{i}.jpg",
+            "price": 5000,
+            "title": f"Project {i}",
+            "description": "Нужно сделать сайт " * 20,
+            "offers": 3,
+            "time_left": 86400,
+            "parent_category_id": 11,
+            "category_id": 79,
+            "date_confirm": 1700000000,
+            "achievements_list": [{"id": 1, "name": "badge", "image_url": "https://x/y.png"}],
+            "is_viewed": False,
+            "allow_higher_price": True,
+        }
+        for i in range(n)
+    ]
+
+
+def _eager(items: list[dict[str, Any]]) -> list[Any]:
+    return [WantWorker(**item) for item in items]
+
+
+def _adapter(items: list[dict[str, Any]]) -> list[Any]:
+    return parse_list(WantWorker, items)
+
+
+def _lazy(items: list[dict[str, Any]]) -> list[Any]:
+    return [LazyModel(WantWorker, item) for item in items]
+
+
+def _measure(name: str, build: Callable[[list[dict[str, Any]]], list[Any]], n: int) -> None:
+    items = _make_items(n)
+    build(items[:10])  # warm up adapters / validators
+
+    gc.collect()
+    started = time.perf_counter()
+    models = build(items)
+    for m in models:
+        _ = (m.id, m.title)
+    cpu = time.perf_counter() - started
+    del models
+
+    gc.collect()
+    tracemalloc.start()
+    models = build(items)
+    for m in models:
+        _ = (m.id, m.title)
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"{name:<6} {cpu * 1000:8.1f} ms  {cpu / n * 1e6:6.2f} us/item  "
+        f"{current / 1024 / 1024:7.2f} MiB retained"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=10_000)
+    args = parser.parse_args()
+
+    print(f"{args.items} items, reading id + title")
+    _measure("eager", _eager, args.items)
+    _measure("batch", _adapter, args.items)
+    _measure("lazy", _lazy, args.items)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Ingest and search speed of `kwork.archive.MessageArchive`.
+
+Run: uv run python benchmarks/message_archive.py [--messages 100000] [--queries 2000] [--path :memory:]
+
+Fills the archive with synthetic dialog messages (words drawn from a Zipf-distributed vocabulary,
+like real text), then measures the latency of local searches (`archive.search`, including the
+hop to the worker thread) for one-word, two-word, prefix and per-dialog queries. Query words are
+drawn from the same distribution, so common words are searched more often.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from kwork.archive import MessageArchive
+
+SEED_WORDS = [
+    "логотип",
+    "сайт",
+    "бот",
+    "парсер",
+    "дизайн",
+    "верстка",
+    "текст",
+    "перевод",
+    "правки",
+    "оплата",
+    "заказ",
+    "срок",
+    "макет",
+    "landing",
+    "telegram",
+    "python",
+    "api",
+    "scraping",
+    "figma",
+    "tilda",
+    "wordpress",
+    "deadline",
+    "invoice",
+    "draft",
+]
+
+
+def _vocabulary(size: int) -> tuple[list[str], list[float]]:
+    words = SEED_WORDS + [f"{SEED_WORDS[n % len(SEED_WORDS)]}{n}" for n in range(size)]
+    weights = [1 / rank for rank in range(1, len(words) + 1)]
+    return words, weights
+
+
+def _messages(
+    count: int, dialogs: int, words: list[str], weights: list[float], rng: random.Random
+) -> list[dict]:
+    return [
+        {
+            "message_id": n,
+            "from_id": 1 + n % dialogs,
+            "to_id": 0,
+            "message": " ".join(rng.choices(words, weights, k=12)),
+            "time": 1_700_000_000 + n,
+        }
+        for n in range(1, count + 1)
+    ]
+
+
+async def _run(args: argparse.Namespace) -> None:
+    rng = random.Random(0)
+    archive = MessageArchive(args.path, batch_size=5000)
+    words, weights = _vocabulary(args.vocabulary)
+    items = _messages(args.messages, args.dialogs, words, weights, rng)
+
+    started = time.perf_counter()
+    archive.add_messages(items)
+    await archive.flush()
+    elapsed = time.perf_counter() - started
+    print(f"ingest   {args.messages} messages in {elapsed:.2f}s ({args.messages / elapsed:,.0f}/s)")
+
+    def word() -> str:
+        return rng.choices(words, weights)[0]
+
+    cases = {
+        "one word": lambda: {"query": word()},
+        "two words": lambda: {"query": f"{word()} {word()}"},
+        "prefix": lambda: {"query": word()[:5], "prefix": True},
+        "one dialog": lambda: {"query": word(), "user_id": rng.randint(1, args.dialogs)},
+    }
+    for name, make in cases.items():
+        timings: list[float] = []
+        for _ in range(args.queries):
+            kwargs = make()
+            started = time.perf_counter()
+            await archive.search(kwargs.pop("query"), limit=20, **kwargs)
+            timings.append(time.perf_counter() - started)
+        timings.sort()
+        p95 = timings[int(0.95 * (len(timings) - 1))]
+        print(f"{name:<10} p50 {statistics.median(timings) * 1e6:7.0f} us  p95 {p95 * 1e6:7.0f} us")
+    await archive.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=100_000)
+    parser.add_argument("--dialogs", type=int, default=500)
+    parser.add_argument("--vocabulary", type=int, default=20_000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--path", default=":memory:")
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
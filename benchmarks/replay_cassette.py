@@ -0,0 +1,93 @@
+"""
+Offline profile of response handling on recorded, production-shaped payloads.
+
+Record a cassette first, e.g.:
+
+    client = Kwork(login, password, cassette=Cassette.record("traffic.jsonl.gz"))
+
+Run: uv run python benchmarks/replay_cassette.py traffic.jsonl.gz [--repeat 200] [--profile]
+
+Every recorded response is fed through `KworkAPI._handle_json_payload` (JSON decoding and the
+success check); endpoints with a known model additionally validate `response` into it.
+"""
+
+import argparse
+import asyncio
+import cProfile
+import pstats
+import time
+from collections import defaultdict
+from typing import Any
+
+from kwork.api import KworkAPI
+from kwork.cassette import Cassette, Interaction, ReplayResponse
+from kwork.exceptions import KworkException
+from kwork.schema import Actor, DialogMessage, InboxMessage, User, WantWorker
+from kwork.schema.adapters import parse_list
+from pydantic import BaseModel
+
+MODELS: dict[str, type[BaseModel]] = {
+    "actor": Actor,
+    "user": User,
+    "dialogs": DialogMessage,
+    "inboxes": InboxMessage,
+    "projects": WantWorker,
+}
+
+
+async def _handle(api: KworkAPI, item: Interaction) -> None:
+    resp: Any = ReplayResponse(item.status, item.content_type, item.body, item.headers)
+    try:
+        data = await api._handle_json_payload(
+            resp, item.endpoint, method=item.method, request_params=None, request_body=None
+        )
+    except KworkException:
+        return
+    model = MODELS.get(item.endpoint)
+    response = data.get("response")
+    if model is None or response is None:
+        return
+    if isinstance(response, list):
+        parse_list(model, response)
+    else:
+        model.model_validate(response)
+
+
+async def _run(interactions: list[Interaction], repeat: int) -> dict[str, list[float]]:
+    api = KworkAPI("bench", "bench")
+    timings: dict[str, list[float]] = defaultdict(list)
+    for _ in range(repeat):
+        for item in interactions:
+            started = time.perf_counter()
+            await _handle(api, item)
+            timings[item.endpoint].append(time.perf_counter() - started)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("cassette")
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--profile", action="store_true", help="print top cProfile entries")
+    args = parser.parse_args()
+
+    interactions = Cassette.load(args.cassette)
+    print(f"{len(interactions)} interactions x {args.repeat}")
+
+    profiler = cProfile.Profile() if args.profile else None
+    if profiler is not None:
+        profiler.enable()
+    timings = asyncio.run(_run(interactions, args.repeat))
+    if profiler is not None:
+        profiler.disable()
+
+    for endpoint, samples in sorted(timings.items(), key=lambda kv: -sum(kv[1])):
+        mean = sum(samples) / len(samples)
+        print(f"{endpoint:<24} {len(samples):7d} calls  {mean * 1e6:9.1f} us/call")
+
+    if profiler is not None:
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(20)
+
+
+if __name__ == "__main__":
+    main()
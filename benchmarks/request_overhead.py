@@ -0,0 +1,93 @@
+"""
+Per-call client overhead of `KworkAPI.request` (no network), in microseconds per request.
+
+Run: uv run python benchmarks/request_overhead.py [--calls 50000] [--profile]
+
+Requests go to an in-process fake transport that answers immediately with a small JSON body,
+so the numbers cover parameter filtering, token lookup, headers/URL/timeout handling, the retry
+loop bookkeeping and JSON decoding of the response.
+"""
+
+import argparse
+import asyncio
+import cProfile
+import json
+import pstats
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any, ClassVar
+
+from kwork.api import KworkAPI
+
+BODY = json.dumps({"success": True, "response": {"id": 1, "title": "x"}})
+
+
+class FakeResponse:
+    status = 200
+    content_type = "application/json"
+    headers: ClassVar[dict[str, str]] = {}
+
+    async def text(self, *, errors: str = "strict") -> str:
+        return BODY
+
+
+class FakeTransport:
+    """Minimal `kwork.transport.Transport` that never touches the network."""
+
+    closed = False
+    cookie_jar = None
+    _response = FakeResponse()
+
+    @asynccontextmanager
+    async def request(self, method: str, url: Any, **kwargs: Any) -> AsyncIterator[FakeResponse]:
+        yield self._response
+
+    async def close(self) -> None:
+        pass
+
+
+CASES: dict[str, dict[str, Any]] = {
+    "plain": {},
+    "token": {"use_token": True},
+    "token+params": {"use_token": True, "page": 1, "categories": "11,79", "empty": None},
+    "token+timeout": {"use_token": True, "timeout": 10.0},
+}
+
+
+async def _run(calls: int) -> dict[str, float]:
+    api = KworkAPI("bench", "bench")
+    api._session = FakeTransport()  # type: ignore[assignment]
+    api._token = "token"
+    results: dict[str, float] = {}
+    for name, kwargs in CASES.items():
+        for _ in range(1000):  # warm-up
+            await api.request("post", "projects", **kwargs)
+        started = time.perf_counter()
+        for _ in range(calls):
+            await api.request("post", "projects", **kwargs)
+        results[name] = (time.perf_counter() - started) / calls * 1e6
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=50_000)
+    parser.add_argument("--profile", action="store_true", help="print top cProfile entries")
+    args = parser.parse_args()
+
+    profiler = cProfile.Profile() if args.profile else None
+    if profiler is not None:
+        profiler.enable()
+    results = asyncio.run(_run(args.calls))
+    if profiler is not None:
+        profiler.disable()
+
+    for name, us in results.items():
+        print(f"{name:<14} {us:7.2f} us/request")
+    if profiler is not None:
+        pstats.Stats(profiler).sort_stats("tottime").print_stats(20)
+
+
+if __name__ == "__main__":
+    main()
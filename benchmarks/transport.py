@@ -0,0 +1,101 @@
+"""
+Compare the aiohttp and httpx transports of `KworkAPI` under concurrent load.
+
+Run: uv run python benchmarks/transport.py [--requests 2000] [--concurrency 100] [--latency 0.01]
+
+By default a local aiohttp server is started; it answers every call after `--latency` seconds
+and counts the TCP connections each backend opened. The local server speaks HTTP/1.1 only, so
+HTTP/2 multiplexing shows up only against a TLS endpoint that negotiates h2, e.g.
+`--api-host "https://h2.example.test/{}"` (connections are not counted then).
+
+Needs `pip install "kwork[http2]"` for the httpx backend.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any
+
+from aiohttp import web
+from kwork.api import KworkAPI
+
+BACKENDS = ("aiohttp", "httpx")
+
+
+def _make_app(latency: float, peers: set[Any]) -> web.Application:
+    payload = {"success": True, "response": [{"id": n, "title": f"project {n}"} for n in range(20)]}
+
+    async def handler(request: web.Request) -> web.Response:
+        if request.transport is not None:
+            peers.add(request.transport.get_extra_info("peername"))
+        if latency:
+            await asyncio.sleep(latency)
+        return web.json_response(payload)
+
+    app = web.Application()
+    app.router.add_route("*", "/{endpoint}", handler)
+    return app
+
+
+async def _bench(backend: str, api_host: str, requests: int, concurrency: int) -> list[float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    timings: list[float] = []
+
+    async with KworkAPI("bench", "bench", api_host=api_host, http_backend=backend) as api:
+
+        async def one() -> None:
+            async with semaphore:
+                started = time.perf_counter()
+                await api.request("post", "projects")
+                timings.append(time.perf_counter() - started)
+
+        await one()  # warm-up: connection setup is not measured
+        timings.clear()
+        await asyncio.gather(*(one() for _ in range(requests)))
+    return timings
+
+
+async def _main(args: argparse.Namespace) -> None:
+    runner: web.AppRunner | None = None
+    peers: set[Any] = set()
+    api_host = args.api_host
+    if api_host is None:
+        runner = web.AppRunner(_make_app(args.latency, peers))
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        api_host = f"http://127.0.0.1:{port}/{{}}"
+
+    print(f"{args.requests} requests, concurrency {args.concurrency}, {api_host}")
+    try:
+        for backend in BACKENDS:
+            peers.clear()
+            started = time.perf_counter()
+            timings = await _bench(backend, api_host, args.requests, args.concurrency)
+            elapsed = time.perf_counter() - started
+            timings.sort()
+            p95 = timings[int(0.95 * (len(timings) - 1))]
+            connections = f"{len(peers):>4} conns" if runner is not None else ""
+            print(
+                f"{backend:<8} {args.requests / elapsed:>8.0f} req/s  "
+                f"p50 {statistics.median(timings) * 1000:6.1f} ms  "
+                f"p95 {p95 * 1000:6.1f} ms  {connections}"
+            )
+    finally:
+        if runner is not None:
+            await runner.cleanup()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.01, help="local server delay, s")
+    parser.add_argument("--api-host", default=None, help='e.g. "https://host/{}"; default: local')
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
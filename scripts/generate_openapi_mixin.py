@@ -0,0 +1,466 @@
+"""
+Generate OpenAPI-derived code from docs/openapi.json.
+
+Outputs:
+- source/kwork/openapi_mixin.py        raw `dict` wrappers for every endpoint
+- source/kwork/schema/openapi_models.py typed, slotted response models for components.schemas
+- source/kwork/openapi_typed_mixin.py   `<method>_typed()` wrappers returning those models
+- source/kwork/openapi_policies.py      per-endpoint `EndpointPolicy` registry
+
+Run from the repository root: python3 scripts/generate_openapi_mixin.py
+Generated files are formatted with ruff when it is available (e.g. `uv run python3 ...`).
+"""
+
+from __future__ import annotations
+
+import json
+import keyword
+import re
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+SPEC_PATH = ROOT / "docs" / "openapi.json"
+MIXIN_PATH = ROOT / "source" / "kwork" / "openapi_mixin.py"
+MODELS_PATH = ROOT / "source" / "kwork" / "schema" / "openapi_models.py"
+TYPED_MIXIN_PATH = ROOT / "source" / "kwork" / "openapi_typed_mixin.py"
+POLICIES_PATH = ROOT / "source" / "kwork" / "openapi_policies.py"
+
+HEADER = (
+    "# This file is auto-generated. Do not edit by hand.\n"
+    "# Regenerate with: python3 scripts/generate_openapi_mixin.py\n"
+)
+
+SCHEMA_REF_PREFIX = "#/components/schemas/"
+
+PRIMITIVES = {
+    "integer": "int",
+    "number": "float",
+    "string": "str",
+    "boolean": "bool",
+}
+
+
+# Wrappers whose natural name clashes with a hand-written `KworkClient` method.
+NAME_OVERRIDES = {
+    "get_channel": "get_channel_api",
+}
+
+
+# Every operation is a POST, so reads are recognised by name or by the (Russian) summary.
+READ_NAME = re.compile(r"^(get|search|is|check)[A-Z]")
+READ_SUMMARY_PREFIXES = (
+    "Список",
+    "Получ",
+    "Плучение",
+    "Возвращает",
+    "Информация",
+    "Данные",
+    "Вывод",
+    "Поиск",
+    "Ключевая",
+    "Рубрики",
+    "Предоставленные",
+    "Предложения пользователя",
+    "Разрешен ли",
+    "Требуется ли",
+)
+
+# Endpoints the rules above get wrong.
+IDEMPOTENT_OVERRIDES = {
+    # Create payment links / orders despite the "get" wording.
+    "rechargeBalance": False,
+    "getBillRefillUrl": False,
+    # Pops unread push events from a queue: a repeated call loses events.
+    "notificationsFetch": False,
+    # Issues a new token; signing in twice is harmless and must survive network errors.
+    "signIn": True,
+}
+
+AUTH_ENDPOINT = re.compile(r"(SignIn|SignUp)|^(signIn|signUp|logout)$", re.IGNORECASE)
+
+UPLOAD_TIMEOUT = 120.0
+
+
+def snake_case(name: str) -> str:
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+
+def class_name(schema_name: str) -> str:
+    parts = re.split(r"[^0-9A-Za-z]+", schema_name)
+    return "".join(p[:1].upper() + p[1:] for p in parts if p)
+
+
+def field_name(prop: str) -> str:
+    name = re.sub(r"[^0-9A-Za-z_]", "_", prop).lstrip("_")
+    if not name or name[0].isdigit():
+        name = f"f_{name}"
+    if keyword.iskeyword(name) or keyword.issoftkeyword(name):
+        name += "_"
+    return name
+
+
+def load_spec() -> dict[str, Any]:
+    return json.loads(SPEC_PATH.read_text(encoding="utf-8"))
+
+
+def iter_operations(spec: dict[str, Any]) -> list[tuple[str, str, str, dict[str, Any]]]:
+    """(method_name, http_method, endpoint, operation) sorted by method name."""
+    ops: list[tuple[str, str, str, dict[str, Any]]] = []
+    for path, item in spec["paths"].items():
+        endpoint = path.lstrip("/")
+        for http_method, op in item.items():
+            name = snake_case(endpoint)
+            ops.append((NAME_OVERRIDES.get(name, name), http_method, endpoint, op))
+    ops.sort(key=lambda o: o[0])
+    return ops
+
+
+def content_kind(op: dict[str, Any]) -> str | None:
+    content = op.get("requestBody", {}).get("content", {})
+    if "multipart/form-data" in content:
+        return "multipart"
+    if "application/x-www-form-urlencoded" in content or "application/json" in content:
+        return "form"
+    return None
+
+
+def uses_token(op: dict[str, Any]) -> bool:
+    return any("token" in s for s in op.get("security") or [])
+
+
+def is_idempotent(endpoint: str, op: dict[str, Any]) -> bool:
+    if endpoint in IDEMPOTENT_OVERRIDES:
+        return IDEMPOTENT_OVERRIDES[endpoint]
+    if content_kind(op) == "multipart":
+        return False
+    summary = op.get("summary", "").strip()
+    return bool(READ_NAME.match(endpoint)) or summary.startswith(READ_SUMMARY_PREFIXES)
+
+
+def rate_limit_class(endpoint: str, op: dict[str, Any]) -> str:
+    if AUTH_ENDPOINT.search(endpoint):
+        return "auth"
+    if content_kind(op) == "multipart":
+        return "upload"
+    return "read" if is_idempotent(endpoint, op) else "write"
+
+
+# --- raw mixin ---------------------------------------------------------------------------
+
+
+def render_raw_method(name: str, http_method: str, endpoint: str, op: dict[str, Any]) -> str:
+    kind = content_kind(op)
+    token = uses_token(op)
+    # Backslashes would turn into escape sequences inside the generated docstring.
+    summary = op.get("summary", "").strip().replace("\\", "/")
+    doc = f"{http_method.upper()} /{endpoint} - {summary}"
+    if kind is not None:
+        doc += f" - content: {kind}"
+    doc += f" - auth: {'token+basic' if token else 'basic'}"
+
+    args = ["        self,", "        *,", f"        use_token: bool = {token},"]
+    if kind == "form":
+        args.append("        body: dict[str, Any] | None = None,")
+        call = f'self.request_with_body("{endpoint}", use_token=use_token, body=body, **params)'
+    elif kind == "multipart":
+        args.append("        fields: dict[str, Any] | None = None,")
+        args.append("        files: dict[str, Any] | None = None,")
+        call = (
+            f'self.request_multipart("{endpoint}", use_token=use_token, '
+            "fields=fields, files=files, **params)"
+        )
+    else:
+        call = f'self.request("{http_method}", "{endpoint}", use_token=use_token, **params)'
+    args.append("        **params: Any,")
+
+    return (
+        f"    async def {name}(\n"
+        + "\n".join(args)
+        + "\n    ) -> dict[str, Any]:\n"
+        + f'        """{doc}"""\n'
+        + f"        return await {call}\n"
+    )
+
+
+RAW_PRELUDE = '''from __future__ import annotations
+
+from typing import Any, Protocol
+
+
+class _OpenAPIClientProto(Protocol):
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        use_token: bool = False,
+        _headers: dict[str, str] | None = None,
+        _cookies: dict[str, str] | None = None,
+        **params: Any,
+    ) -> dict[str, Any]: ...
+    async def request_with_body(
+        self,
+        endpoint: str,
+        use_token: bool = False,
+        _headers: dict[str, str] | None = None,
+        _cookies: dict[str, str] | None = None,
+        body: dict[str, Any] | None = None,
+        **params: Any,
+    ) -> dict[str, Any]: ...
+    async def request_multipart(
+        self,
+        endpoint: str,
+        use_token: bool = False,
+        _headers: dict[str, str] | None = None,
+        _cookies: dict[str, str] | None = None,
+        fields: dict[str, Any] | None = None,
+        files: dict[str, Any] | None = None,
+        **params: Any,
+    ) -> dict[str, Any]: ...
+
+
+class OpenAPIMethodsMixin(_OpenAPIClientProto):
+    """Auto-generated wrappers for every endpoint from docs/openapi.json."""
+'''
+
+
+def render_raw_mixin(spec: dict[str, Any]) -> str:
+    methods = [render_raw_method(*op) for op in iter_operations(spec)]
+    return HEADER + RAW_PRELUDE + "\n" + "\n".join(methods)
+
+
+# --- models ------------------------------------------------------------------------------
+
+
+class ModelRenderer:
+    def __init__(self, schemas: dict[str, Any]) -> None:
+        self.schemas = schemas
+        self.names = {name: class_name(name) for name in schemas}
+        seen: dict[str, str] = {}
+        for schema_name, cls in self.names.items():
+            if cls in seen:
+                raise SystemExit(f"Class name clash: {schema_name!r} and {seen[cls]!r} -> {cls}")
+            seen[cls] = schema_name
+
+    def is_model(self, schema: dict[str, Any]) -> bool:
+        return bool(self.properties(schema))
+
+    def properties(self, schema: dict[str, Any]) -> dict[str, Any]:
+        props: dict[str, Any] = {}
+        for part in schema.get("allOf", []):
+            if "$ref" in part:
+                props.update(self.properties(self.resolve(part["$ref"])))
+            else:
+                props.update(self.properties(part))
+        props.update(schema.get("properties", {}))
+        return props
+
+    def resolve(self, ref: str) -> dict[str, Any]:
+        return self.schemas[ref.removeprefix(SCHEMA_REF_PREFIX)]
+
+    def type_of(self, schema: dict[str, Any]) -> str:
+        if "$ref" in schema:
+            return self.names[schema["$ref"].removeprefix(SCHEMA_REF_PREFIX)]
+        if "allOf" in schema and len(schema["allOf"]) == 1 and not schema.get("properties"):
+            return self.type_of(schema["allOf"][0])
+        variants = schema.get("oneOf") or schema.get("anyOf")
+        if variants:
+            types = list(dict.fromkeys(self.type_of(v) for v in variants))
+            return "Any" if "Any" in types else " | ".join(types)
+        t = schema.get("type")
+        if t in PRIMITIVES:
+            return PRIMITIVES[t]
+        if t == "array":
+            return f"list[{self.type_of(schema.get('items', {}))}]"
+        if t == "object" or "properties" in schema or "additionalProperties" in schema:
+            extra = schema.get("additionalProperties")
+            value = self.type_of(extra) if isinstance(extra, dict) and extra else "Any"
+            return f"dict[str, {value}]"
+        return "Any"
+
+    def render(self) -> str:
+        out = [
+            HEADER,
+            '"""Typed response models for `components.schemas` of docs/openapi.json."""\n\n',
+            "from __future__ import annotations\n\n",
+            "from typing import Any\n\n",
+            "from pydantic import ConfigDict, Field\n",
+            "from pydantic.dataclasses import dataclass, rebuild_dataclass\n\n",
+            '_CONFIG = ConfigDict(extra="ignore")\n',
+        ]
+        aliases: list[str] = []
+        models: list[str] = []
+        for schema_name in sorted(self.schemas, key=lambda n: self.names[n]):
+            schema = self.schemas[schema_name]
+            cls = self.names[schema_name]
+            if not self.is_model(schema):
+                aliases.append(f"{cls} = {self.type_of(schema)}\n")
+                continue
+            models.append(cls)
+            doc = (schema.get("description") or schema_name).strip().replace('"""', "'''")
+            lines = [
+                "\n\n@dataclass(slots=True, config=_CONFIG)\n",
+                f"class {cls}:\n",
+                f'    """{doc}"""\n\n',
+            ]
+            for prop, prop_schema in self.properties(schema).items():
+                name = field_name(prop)
+                annotation = self.type_of(prop_schema)
+                if annotation != "Any":
+                    annotation += " | None"
+                default = "None" if name == prop else f'Field(default=None, alias="{prop}")'
+                lines.append(f"    {name}: {annotation} = {default}\n")
+            out.append("".join(lines))
+        out.append("\n\n" + "".join(aliases))
+        out.append("\nfor _model in (\n")
+        out.extend(f"    {cls},\n" for cls in models)
+        # Type checkers don't see the attributes that @dataclass adds for pydantic.
+        out.append("):\n    rebuild_dataclass(_model)  # pyright: ignore[reportArgumentType]\n")
+        return "".join(out)
+
+
+# --- typed mixin -------------------------------------------------------------------------
+
+
+def typed_response(op: dict[str, Any], renderer: ModelRenderer) -> tuple[str, bool] | None:
+    """(model class, is_list) when the 200 `response` field references a component schema."""
+    ok = op["responses"].get("200", {})
+    schema = ok.get("content", {}).get("application/json", {}).get("schema", {})
+    response = schema.get("properties", {}).get("response")
+    if not isinstance(response, dict):
+        return None
+    ref = response.get("$ref")
+    is_list = False
+    if ref is None and response.get("type") == "array":
+        ref = response.get("items", {}).get("$ref")
+        is_list = True
+    if ref is None:
+        return None
+    return renderer.names[ref.removeprefix(SCHEMA_REF_PREFIX)], is_list
+
+
+def render_typed_mixin(spec: dict[str, Any], renderer: ModelRenderer) -> str:
+    methods: list[str] = []
+    for name, http_method, endpoint, op in iter_operations(spec):
+        typed = typed_response(op, renderer)
+        if typed is None:
+            continue
+        cls, is_list = typed
+        ret = f"list[m.{cls}]" if is_list else f"m.{cls}"
+        shown = f"list[{cls}]" if is_list else cls
+        kind = content_kind(op)
+        passthrough = {"form": "body=body, ", "multipart": "fields=fields, files=files, "}.get(
+            kind or "", ""
+        )
+        args = ["        self,", "        *,", f"        use_token: bool = {uses_token(op)},"]
+        if kind == "form":
+            args.append("        body: dict[str, Any] | None = None,")
+        elif kind == "multipart":
+            args.append("        fields: dict[str, Any] | None = None,")
+            args.append("        files: dict[str, Any] | None = None,")
+        args.append("        **params: Any,")
+        methods.append(
+            f"    async def {name}_typed(\n"
+            + "\n".join(args)
+            + f"\n    ) -> {ret}:\n"
+            + f'        """`{name}()` with `response` validated as `{shown}`."""\n'
+            + "        from kwork.schema import openapi_models as m\n\n"
+            + f"        data = await self.{name}(use_token=use_token, {passthrough}**params)\n"
+            + f'        return _adapter({ret}).validate_python(data.get("response"))\n'
+        )
+
+    prelude = '''from __future__ import annotations
+
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+from pydantic import TypeAdapter
+
+from kwork.openapi_mixin import OpenAPIMethodsMixin
+
+if TYPE_CHECKING:
+    from kwork.schema import openapi_models as m
+
+
+@cache
+def _adapter(tp: Any) -> TypeAdapter[Any]:
+    return TypeAdapter(tp)
+
+
+class OpenAPITypedMethodsMixin(OpenAPIMethodsMixin):
+    """
+    Auto-generated typed variants of endpoints whose response references a component schema.
+
+    Models live in `kwork.schema.openapi_models` and are imported on first call only.
+    """
+'''
+    return HEADER + prelude + "\n" + "\n".join(methods)
+
+
+# --- endpoint policies -------------------------------------------------------------------
+
+
+def render_policy(endpoint: str, op: dict[str, Any]) -> str:
+    kind = content_kind(op) or "query"
+    rate_limit = rate_limit_class(endpoint, op)
+    idempotent = is_idempotent(endpoint, op)
+    token = uses_token(op)
+    # Only public reads are cached: their responses don't depend on the account.
+    cacheable = idempotent and not token and rate_limit == "read"
+    timeout = UPLOAD_TIMEOUT if kind == "multipart" else None
+    return (
+        f'    "{endpoint}": EndpointPolicy(\n'
+        f'        "{endpoint}",\n'
+        f"        idempotent={idempotent},\n"
+        f'        auth="{"token" if token else "basic"}",\n'
+        f'        content="{kind}",\n'
+        f"        timeout={timeout},\n"
+        f"        cacheable={cacheable},\n"
+        f'        rate_limit="{rate_limit}",\n'
+        "    ),\n"
+    )
+
+
+def render_policies(spec: dict[str, Any]) -> str:
+    entries = sorted(((e, op) for _, _, e, op in iter_operations(spec)), key=lambda x: x[0])
+    return (
+        HEADER
+        + '"""Per-endpoint policies derived from docs/openapi.json (see `kwork.endpoint_policy`)."""\n\n'
+        + "from __future__ import annotations\n\n"
+        + "from kwork.endpoint_policy import EndpointPolicy\n\n"
+        + "ENDPOINT_POLICIES: dict[str, EndpointPolicy] = {\n"
+        + "".join(render_policy(endpoint, op) for endpoint, op in entries)
+        + "}\n"
+    )
+
+
+def _format(paths: list[Path]) -> None:
+    ruff = shutil.which("ruff")
+    cmd = [ruff] if ruff else [sys.executable, "-m", "ruff"]
+    try:
+        subprocess.run([*cmd, "format", *map(str, paths)], check=True, cwd=ROOT)
+    except (OSError, subprocess.CalledProcessError):
+        print("ruff not available: generated files are left unformatted", file=sys.stderr)
+
+
+def main() -> None:
+    spec = load_spec()
+    renderer = ModelRenderer(spec["components"]["schemas"])
+    outputs = {
+        MIXIN_PATH: render_raw_mixin(spec),
+        MODELS_PATH: renderer.render(),
+        TYPED_MIXIN_PATH: render_typed_mixin(spec, renderer),
+        POLICIES_PATH: render_policies(spec),
+    }
+    for path, text in outputs.items():
+        path.write_text(text, encoding="utf-8")
+    _format(list(outputs))
+    for path in outputs:
+        print(f"wrote {path.relative_to(ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,47 @@
-from kwork.api import KworkAPI
-from kwork.bot import KworkBot
-from kwork.client import KworkClient
-from kwork.web_client import KworkWebClient, WebLoginResult
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-Kwork = KworkClient
+if TYPE_CHECKING:
+    from kwork.api import KworkAPI
+    from kwork.bot import KworkBot
+    from kwork.client import KworkClient
+    from kwork.multi_bot import KworkMultiBot
+    from kwork.web_client import KworkWebClient, WebLoginResult
+
+    Kwork = KworkClient
+
+# Public name -> module that defines it. Submodules are imported on first attribute access, so
+# `import kwork` stays cheap and e.g. `websockets` is loaded only by code that uses `KworkBot`.
+_LAZY_ATTRS: dict[str, tuple[str, str]] = {
+    "Kwork": ("kwork.client", "KworkClient"),
+    "KworkAPI": ("kwork.api", "KworkAPI"),
+    "KworkBot": ("kwork.bot", "KworkBot"),
+    "KworkClient": ("kwork.client", "KworkClient"),
+    "KworkMultiBot": ("kwork.multi_bot", "KworkMultiBot"),
+    "KworkWebClient": ("kwork.web_client", "KworkWebClient"),
+    "WebLoginResult": ("kwork.web_client", "WebLoginResult"),
+}
 
 __all__ = (
     "Kwork",
     "KworkAPI",
     "KworkBot",
     "KworkClient",
+    "KworkMultiBot",
     "KworkWebClient",
     "WebLoginResult",
 )
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
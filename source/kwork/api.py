@@ -1,19 +1,48 @@
 import logging
-import mimetypes
 import asyncio
+import copy
 import json
 import random
-from contextlib import ExitStack
+import time
+from collections.abc import Mapping
+from contextlib import AbstractAsyncContextManager
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
-from pathlib import Path
+from functools import lru_cache
 from types import TracebackType
-from typing import Any, Self
+from typing import TYPE_CHECKING, Any, Self
+from urllib.parse import urlparse
 
 import aiohttp
 from aiohttp import ClientResponse
-
-from kwork.exceptions import KworkException, KworkHTTPException, KworkRetryExceeded
+from yarl import URL
+
+from kwork.batch import LookupCache
+from kwork.circuit import NULL_PERMIT, CircuitBreaker, CircuitPermit
+from kwork.cookies import KworkCookieJar
+from kwork.deadline import current_deadline
+from kwork.deadline import deadline as deadline_scope
+from kwork.endpoint_policy import EndpointPolicies, EndpointPolicy
+from kwork.exceptions import (
+    KworkDeadlineExceeded,
+    KworkException,
+    KworkHTTPException,
+    KworkRetryExceeded,
+)
+from kwork.retry_budget import RetryBudget
+from kwork.token_store import StoredToken, TokenStore
+from kwork.uploads import (
+    DEFAULT_CHUNK_SIZE,
+    ProgressCallback,
+    StreamingFilePayload,
+    attach_progress,
+    build_file_part,
+)
+
+if TYPE_CHECKING:
+    from kwork.cassette import Cassette
+    from kwork.hedging import RequestHedger
+    from kwork.transport import HttpBackend, Transport
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -59,6 +88,12 @@ def _redact_sensitive(value: str | Any, *, _depth: int = 0) -> Any:
     return value
 
 
+@lru_cache(maxsize=64)
+def _client_timeout(total: float) -> aiohttp.ClientTimeout:
+    # ClientTimeout is frozen, so per-call `timeout=<seconds>` values can share instances.
+    return aiohttp.ClientTimeout(total=total)
+
+
 def _format_exception_short(err: BaseException) -> str:
     """
     Return a non-empty, low-noise description of an exception.
@@ -89,14 +124,33 @@ class KworkAPI:
         retry_jitter: float = 0.1,
         retry_statuses: set[int] | frozenset[int] | None = None,
         relogin_on_auth_error: bool = False,
+        token_store: TokenStore | None = None,
+        token_refresh_margin: float | None = None,
+        cassette: "Cassette | None" = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        retry_budget: RetryBudget | None = None,
+        hedging: "RequestHedger | None" = None,
+        http_backend: "HttpBackend" = "aiohttp",
+        endpoint_policies: EndpointPolicies | None = None,
     ) -> None:
-        self._session: aiohttp.ClientSession | None = None
+        if http_backend not in ("aiohttp", "httpx"):
+            raise ValueError("http_backend must be 'aiohttp' or 'httpx'")
+        self._http_backend = http_backend
+        self._session: Transport | None = None
         self._proxy = proxy
         self._api_host = api_host
+        # endpoint -> parsed request URL, so `api_host.format()` and URL parsing run once.
+        self._urls: dict[str, URL] = {}
+        # Sent as is (never mutated) by every request without extra headers.
+        self._default_headers: Mapping[str, str] = {"Authorization": AUTH_HEADER}
         self._login = login
         self._password = password
         self._phone_last = phone_last
         self._token: str | None = None
+        self._token_expires_at: float | None = None
+        # Single-flight sign in: concurrent callers wait for one `signIn` instead of racing.
+        self._token_lock = asyncio.Lock()
+        self._token_store = token_store
         self._timeout = self._normalize_timeout(timeout)
 
         if retry_max_attempts < 1:
@@ -117,6 +171,32 @@ class KworkAPI:
         )
         self._relogin_on_auth_error = relogin_on_auth_error
 
+        if token_refresh_margin is not None and token_refresh_margin < 0:
+            raise ValueError("token_refresh_margin must be >= 0")
+        # Re-login this many seconds before the token expires (None: only on demand / auth errors).
+        self._token_refresh_margin = token_refresh_margin
+        # Record/replay of API traffic (see kwork.cassette); None sends requests as is.
+        self._cassette = cassette
+        # Fail fast while the API is degraded (see kwork.circuit); None disables it.
+        self._circuit_breaker = circuit_breaker
+        self._circuit_host = urlparse(api_host.format("")).netloc or api_host
+        # Caps retries to a share of successful requests (see kwork.retry_budget).
+        self._retry_budget = retry_budget
+        # Duplicate slow idempotent reads (see kwork.hedging); None sends one request per attempt.
+        self._hedging = hedging
+        # Per-endpoint retries/timeouts/caching from docs/openapi.json (see kwork.endpoint_policy).
+        # Without explicit policies the registry only keeps mutations to a single send: reads get
+        # `retry_max_attempts`, the client-wide timeout applies and nothing is cached.
+        self._default_policies = endpoint_policies is None
+        if endpoint_policies is None:
+            endpoint_policies = EndpointPolicies(read_max_attempts=1, cache_maxsize=0)
+        self._endpoint_policies = endpoint_policies
+        self._response_cache: LookupCache[str, dict[str, Any]] | None = (
+            LookupCache(maxsize=endpoint_policies.cache_maxsize, ttl=endpoint_policies.cache_ttl)
+            if endpoint_policies.cache_maxsize > 0
+            else None
+        )
+
     @staticmethod
     def _normalize_timeout(
         timeout: aiohttp.ClientTimeout | float | None,
@@ -125,7 +205,13 @@ class KworkAPI:
             return None
         if isinstance(timeout, aiohttp.ClientTimeout):
             return timeout
-        return aiohttp.ClientTimeout(total=float(timeout))
+        return _client_timeout(float(timeout))
+
+    def _endpoint_url(self, endpoint: str) -> URL:
+        url = self._urls.get(endpoint)
+        if url is None:
+            url = self._urls[endpoint] = URL(self._api_host.format(endpoint))
+        return url
 
     @staticmethod
     def _create_connector(proxy: str | None) -> aiohttp.BaseConnector | None:
@@ -144,28 +230,194 @@ class KworkAPI:
 
         return ProxyConnector.from_url(proxy)
 
-    def _create_session(self) -> aiohttp.ClientSession:
+    def _create_session(self) -> "Transport":
+        if self._http_backend == "httpx":
+            from kwork.transport import HttpxTransport
+
+            return HttpxTransport(proxy=self._proxy, timeout=self._timeout)
         connector = self._create_connector(self._proxy)
         # When we pass our own connector we want the session to own and close it.
         # This prevents a closed connector instance being accidentally reused after session.close().
         if connector is None:
-            return aiohttp.ClientSession(timeout=self._timeout)
+            return aiohttp.ClientSession(timeout=self._timeout, cookie_jar=KworkCookieJar())
         return aiohttp.ClientSession(
             connector=connector,
             connector_owner=True,
             timeout=self._timeout,
+            cookie_jar=KworkCookieJar(),
         )
 
     @property
-    def session(self) -> aiohttp.ClientSession:
+    def session(self) -> "Transport":
         if self._session is None or self._session.closed:
             self._session = self._create_session()
         return self._session
 
+    def _send(
+        self, endpoint: str, *, hedge: bool = False, **req_kwargs: Any
+    ) -> AbstractAsyncContextManager[Any]:
+        if self._cassette is None:
+            if (
+                hedge
+                and self._hedging is not None
+                and self._hedging.applies(endpoint, req_kwargs.get("params"))
+            ):
+                return self._hedging.request(
+                    lambda: self.session.request(**req_kwargs), endpoint=endpoint
+                )
+            return self.session.request(**req_kwargs)
+        return self._cassette.request(
+            lambda: self.session.request(**req_kwargs),
+            method=req_kwargs["method"],
+            endpoint=endpoint,
+            params=req_kwargs.get("params"),
+        )
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker | None:
+        return self._circuit_breaker
+
+    def _circuit_permit(self, endpoint: str) -> CircuitPermit:
+        breaker = self._circuit_breaker
+        if breaker is None:
+            return NULL_PERMIT
+        return breaker.acquire(breaker.key(self._circuit_host, endpoint))
+
+    def _report_status(self, permit: CircuitPermit, status: int | None) -> None:
+        breaker = self._circuit_breaker
+        if breaker is not None and breaker.is_failure_status(status):
+            permit.failure()
+        else:
+            permit.success()
+
+    @property
+    def retry_budget(self) -> RetryBudget | None:
+        return self._retry_budget
+
+    @property
+    def hedging(self) -> "RequestHedger | None":
+        return self._hedging
+
+    @property
+    def endpoint_policies(self) -> EndpointPolicies:
+        return self._endpoint_policies
+
+    def _endpoint_policy(self, endpoint: str) -> EndpointPolicy:
+        return self._endpoint_policies.get(endpoint)
+
+    def _default_attempts(self, policy: EndpointPolicy, retry: bool | None) -> int:
+        if policy.idempotent:
+            return max(self._retry_max_attempts, self._endpoint_policies.read_max_attempts)
+        if self._default_policies and policy.endpoint not in self._endpoint_policies:
+            # Not in the spec and no policies were given: keep the client-wide retry setting.
+            return self._retry_max_attempts
+        # A mutation repeated after a lost response may be applied twice: only on explicit opt-in.
+        return self._retry_max_attempts if retry else 1
+
+    def _response_cache_key(
+        self,
+        policy: EndpointPolicy,
+        *,
+        method: str,
+        endpoint: str,
+        headers: Mapping[str, str],
+        params: dict[str, Any] | None,
+        data: Any,
+        cookies: dict[str, str] | None,
+    ) -> str | None:
+        # Only anonymous calls of public reads: nothing account-specific may end up in the cache.
+        if (
+            self._response_cache is None
+            or not policy.cacheable
+            or cookies
+            or headers is not self._default_headers
+            or (params and "token" in params)
+        ):
+            return None
+        try:
+            return json.dumps([method, endpoint, params, data], sort_keys=True, default=str)
+        except TypeError:
+            return None
+
+    def _succeeded(self, permit: CircuitPermit) -> None:
+        permit.success()
+        if self._retry_budget is not None:
+            self._retry_budget.deposit()
+
+    def _take_retry_token(self, method: str, endpoint: str) -> bool:
+        if self._retry_budget is None or self._retry_budget.try_withdraw():
+            return True
+        logger.debug("Retry budget exhausted, not retrying %s /%s", method.upper(), endpoint)
+        return False
+
+    def _check_deadline(
+        self,
+        deadline_at: float | None,
+        *,
+        method: str,
+        endpoint: str,
+        attempts: int,
+        error: BaseException | None = None,
+        needed: float = 0.0,
+    ) -> float | None:
+        """Seconds left until `deadline_at`; raises if fewer than `needed` (or none) are left."""
+        if deadline_at is None:
+            return None
+        remaining = deadline_at - time.monotonic()
+        if remaining <= needed:
+            raise KworkDeadlineExceeded(
+                f"Deadline exceeded for {method.upper()} /{endpoint} after {attempts} attempts",
+                attempts=attempts,
+                last_error=error,
+            ) from error
+        return remaining
+
+    def _attempt_timeout(
+        self, timeout: aiohttp.ClientTimeout | None, remaining: float | None
+    ) -> aiohttp.ClientTimeout | None:
+        # Clip the per-attempt timeout to what is left of the deadline.
+        if remaining is None:
+            return timeout
+        base = timeout or self._timeout
+        if base is None:
+            return aiohttp.ClientTimeout(total=remaining)
+        if base.total is not None and base.total <= remaining:
+            return base
+        return aiohttp.ClientTimeout(
+            total=remaining,
+            connect=base.connect,
+            sock_read=base.sock_read,
+            sock_connect=base.sock_connect,
+        )
+
+    async def _backoff(
+        self,
+        delay: float,
+        deadline_at: float | None,
+        *,
+        method: str,
+        endpoint: str,
+        attempts: int,
+        error: BaseException | None,
+    ) -> None:
+        # Don't sleep into the deadline: if no time would be left for another attempt, give up now.
+        self._check_deadline(
+            deadline_at,
+            method=method,
+            endpoint=endpoint,
+            attempts=attempts,
+            error=error,
+            needed=delay,
+        )
+        if delay > 0:
+            await asyncio.sleep(delay)
+
     async def close(self) -> None:
         if self._session is not None and not self._session.closed:
             await self._session.close()
         self._session = None
+        if self._cassette is not None:
+            await asyncio.to_thread(self._cassette.save)
 
     async def __aenter__(self) -> Self:
         return self
@@ -178,10 +430,51 @@ class KworkAPI:
     ) -> None:
         await self.close()
 
-    async def get_token(self) -> str:
-        if self._token is not None:
-            return self._token
+    @property
+    def _token_store_key(self) -> str:
+        return f"{self._api_host}|{self._login}"
+
+    def _token_is_fresh(self, token: StoredToken) -> bool:
+        if self._token_refresh_margin is None:
+            # Without proactive refresh still drop tokens that are already expired.
+            return not token.expires_within(0.0)
+        return not token.expires_within(self._token_refresh_margin)
+
+    def _current_token(self) -> StoredToken | None:
+        if self._token is None:
+            return None
+        return StoredToken(self._token, self._token_expires_at)
 
+    async def get_token(self) -> str:
+        # Fast path for a token without a known lifetime: nothing to check, nothing to allocate.
+        token = self._token
+        if token is not None and self._token_expires_at is None:
+            return token
+        current = self._current_token()
+        if current is not None and self._token_is_fresh(current):
+            return current.token
+
+        async with self._token_lock:
+            # Another coroutine may have signed in while we were waiting for the lock.
+            current = self._current_token()
+            if current is not None and self._token_is_fresh(current):
+                return current.token
+
+            if self._token_store is not None:
+                stored = await self._token_store.load(self._token_store_key)
+                if stored is not None and self._token_is_fresh(stored):
+                    self._token = stored.token
+                    self._token_expires_at = stored.expires_at
+                    return stored.token
+
+            stored = await self._sign_in()
+            self._token = stored.token
+            self._token_expires_at = stored.expires_at
+            if self._token_store is not None:
+                await self._token_store.save(self._token_store_key, stored)
+            return stored.token
+
+    async def _sign_in(self) -> StoredToken:
         body: dict[str, str] = {
             "login": self._login,
             "password": self._password,
@@ -190,9 +483,27 @@ class KworkAPI:
             body["phone_last"] = self._phone_last
 
         response = await self.request_with_body("signIn", body=body)
-        token: str = response["response"]["token"]
-        self._token = token
-        return token
+        payload = response["response"]
+        lifetime = payload.get("expired")
+        return StoredToken(
+            token=payload["token"],
+            expires_at=time.time() + lifetime if isinstance(lifetime, (int, float)) else None,
+        )
+
+    async def invalidate_token(self, token: str | None = None) -> None:
+        """
+        Forget the current token (and its stored copy).
+
+        When `token` is given, nothing happens unless it is still the current one: a request that
+        failed with a stale token must not throw away a token another coroutine just obtained.
+        """
+        async with self._token_lock:
+            if token is not None and token != self._token:
+                return
+            self._token = None
+            self._token_expires_at = None
+            if self._token_store is not None:
+                await self._token_store.clear(self._token_store_key)
 
     async def request(
         self,
@@ -205,40 +516,40 @@ class KworkAPI:
         retry: bool | None = None,
         timeout: aiohttp.ClientTimeout | float | None = None,
         max_attempts: int | None = None,
+        deadline: float | None = None,
         **params: Any,
     ) -> dict[str, Any]:
-        filtered = {k: v for k, v in params.items() if v is not None}
-
-        if use_token:
-            filtered["token"] = await self.get_token()
-
-        headers = {"Authorization": AUTH_HEADER}
-        if _headers:
-            headers.update(_headers)
-
-        if logger.isEnabledFor(logging.DEBUG):
-            logger.debug(
-                "Request %s /%s params=%s headers=%s cookies=%s",
-                method.upper(),
-                endpoint,
-                _redact_sensitive(filtered),
-                list((_headers or {}).keys()),
-                list((_cookies or {}).keys()),
+        with deadline_scope(deadline):
+            filtered = {k: v for k, v in params.items() if v is not None}
+
+            if use_token:
+                filtered["token"] = await self.get_token()
+
+            headers = {**self._default_headers, **_headers} if _headers else self._default_headers
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Request %s /%s params=%s headers=%s cookies=%s",
+                    method.upper(),
+                    endpoint,
+                    _redact_sensitive(filtered),
+                    list((_headers or {}).keys()),
+                    list((_cookies or {}).keys()),
+                )
+
+            return await self._request_json(
+                method=method,
+                endpoint=endpoint,
+                headers=headers,
+                params=filtered,
+                data=None,
+                cookies=_cookies,
+                retry=retry,
+                timeout=timeout,
+                max_attempts=max_attempts,
+                use_token=use_token,
             )
 
-        return await self._request_json(
-            method=method,
-            endpoint=endpoint,
-            headers=headers,
-            params=filtered,
-            data=None,
-            cookies=_cookies,
-            retry=retry,
-            timeout=timeout,
-            max_attempts=max_attempts,
-            use_token=use_token,
-        )
-
     async def _read_response_body(self, resp: ClientResponse) -> tuple[str, dict[str, Any] | None]:
         # Read the full body as text so we can include it in exceptions.
         text = await resp.text(errors="replace")
@@ -338,7 +649,7 @@ class KworkAPI:
         *,
         method: str,
         endpoint: str,
-        headers: dict[str, str],
+        headers: Mapping[str, str],
         params: dict[str, Any] | None,
         data: Any,
         cookies: dict[str, str] | None,
@@ -347,40 +658,82 @@ class KworkAPI:
         max_attempts: int | None,
         use_token: bool,
     ) -> dict[str, Any]:
+        policy = self._endpoint_policy(endpoint)
+        if timeout is None and not self._default_policies:
+            timeout = policy.timeout
         effective_timeout = self._normalize_timeout(timeout) if timeout is not None else None
-        attempts_limit = max_attempts if max_attempts is not None else self._retry_max_attempts
+        attempts_limit = (
+            max_attempts if max_attempts is not None else self._default_attempts(policy, retry)
+        )
         if attempts_limit < 1:
             raise ValueError("max_attempts must be >= 1")
 
+        cache_key: str | None = None
+        if self._response_cache is not None:
+            cache_key = self._response_cache_key(
+                policy,
+                method=method,
+                endpoint=endpoint,
+                headers=headers,
+                params=params,
+                data=data,
+                cookies=cookies,
+            )
+            cached = self._response_cache.get(cache_key) if cache_key is not None else None
+            if cached is not None:
+                return copy.deepcopy(cached)
+
         enable_retry = retry if retry is not None else attempts_limit > 1
+        # A 401/403 means nothing was applied: the one relogin-and-resend doesn't count against
+        # the cap that keeps mutations to a single send.
+        relogin_allowed = (
+            retry
+            if retry is not None
+            else (max_attempts if max_attempts is not None else self._retry_max_attempts) > 1
+        )
+        deadline_at = current_deadline()
         attempts = 0
         auth_reset_done = False
+        relogin_pending = False
+        stale_token: str | None = None
 
         while True:
+            if relogin_pending:
+                # Re-login (single-flight) outside of the failed response context.
+                relogin_pending = False
+                await self.invalidate_token(stale_token)
+                if params is not None and "token" in params:
+                    params = {**params, "token": await self.get_token()}
+            remaining = self._check_deadline(
+                deadline_at, method=method, endpoint=endpoint, attempts=attempts
+            )
+            attempt_timeout = self._attempt_timeout(effective_timeout, remaining)
+            permit = self._circuit_permit(endpoint)
             attempts += 1
             try:
                 req_kwargs: dict[str, Any] = {
                     "method": method,
-                    "url": self._api_host.format(endpoint),
+                    "url": self._endpoint_url(endpoint),
                     "headers": headers,
                     "params": params,
                     "data": data,
                     "cookies": cookies,
                 }
-                if effective_timeout is not None:
-                    req_kwargs["timeout"] = effective_timeout
+                if attempt_timeout is not None:
+                    req_kwargs["timeout"] = attempt_timeout
 
-                async with self.session.request(**req_kwargs) as resp:
+                async with self._send(endpoint, hedge=True, **req_kwargs) as resp:
                     if (
                         resp.status in {401, 403}
                         and use_token
                         and self._relogin_on_auth_error
                         and not auth_reset_done
-                        and enable_retry
-                        and attempts < attempts_limit
+                        and relogin_allowed
                     ):
                         auth_reset_done = True
-                        self._token = None
+                        attempts_limit = max(attempts_limit, attempts + 1)
+                        permit.success()
+                        stale_token = params.get("token") if params else None
                         body_text, _ = await self._read_response_body(resp)
                         if logger.isEnabledFor(logging.DEBUG):
                             logger.debug(
@@ -390,12 +743,19 @@ class KworkAPI:
                                 self._truncate(body_text),
                             )
                         delay = self._compute_backoff(attempts)
-                        if delay > 0:
-                            await asyncio.sleep(delay)
+                        await self._backoff(
+                            delay,
+                            deadline_at,
+                            method=method,
+                            endpoint=endpoint,
+                            attempts=attempts,
+                            error=None,
+                        )
+                        relogin_pending = True
                         continue
 
                     try:
-                        return await self._handle_json_payload(
+                        result = await self._handle_json_payload(
                             resp,
                             endpoint,
                             method=method,
@@ -403,11 +763,13 @@ class KworkAPI:
                             request_body=data,
                         )
                     except KworkHTTPException as e:
+                        self._report_status(permit, e.status)
                         if (
                             enable_retry
                             and e.status is not None
                             and self._should_retry_status(e.status)
                             and attempts < attempts_limit
+                            and self._take_retry_token(method, endpoint)
                         ):
                             retry_after = (
                                 self._parse_retry_after_seconds(resp) if e.status == 429 else None
@@ -425,12 +787,35 @@ class KworkAPI:
                                     attempts_limit,
                                     delay,
                                 )
-                            if delay > 0:
-                                await asyncio.sleep(delay)
+                            await self._backoff(
+                                delay,
+                                deadline_at,
+                                method=method,
+                                endpoint=endpoint,
+                                attempts=attempts,
+                                error=e,
+                            )
                             continue
                         raise
+                    except KworkException:
+                        # API-level error: the server itself is fine.
+                        self._succeeded(permit)
+                        raise
+                    self._succeeded(permit)
+                    if cache_key is not None and self._response_cache is not None:
+                        self._response_cache.set(cache_key, copy.deepcopy(result))
+                    return result
             except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-                if not enable_retry or attempts >= attempts_limit:
+                permit.failure()
+                # A timeout clipped to the deadline is reported as the deadline, not a network error.
+                self._check_deadline(
+                    deadline_at, method=method, endpoint=endpoint, attempts=attempts, error=e
+                )
+                if (
+                    not enable_retry
+                    or attempts >= attempts_limit
+                    or not self._take_retry_token(method, endpoint)
+                ):
                     err_desc = _format_exception_short(e)
                     raise KworkRetryExceeded(
                         f"Request {method.upper()} /{endpoint} failed after {attempts} attempts: {err_desc}",
@@ -449,9 +834,17 @@ class KworkAPI:
                         attempts_limit,
                         delay,
                     )
-                if delay > 0:
-                    await asyncio.sleep(delay)
+                await self._backoff(
+                    delay,
+                    deadline_at,
+                    method=method,
+                    endpoint=endpoint,
+                    attempts=attempts,
+                    error=e,
+                )
                 continue
+            finally:
+                permit.release()
 
     async def request_with_body(
         self,
@@ -464,37 +857,37 @@ class KworkAPI:
         retry: bool | None = None,
         timeout: aiohttp.ClientTimeout | float | None = None,
         max_attempts: int | None = None,
+        deadline: float | None = None,
         **params: Any,
     ) -> dict[str, Any]:
-        filtered_params = {k: v for k, v in params.items() if v is not None}
+        with deadline_scope(deadline):
+            filtered_params = {k: v for k, v in params.items() if v is not None}
 
-        if use_token:
-            filtered_params["token"] = await self.get_token()
+            if use_token:
+                filtered_params["token"] = await self.get_token()
 
-        headers = {"Authorization": AUTH_HEADER}
-        if _headers:
-            headers.update(_headers)
+            headers = {**self._default_headers, **_headers} if _headers else self._default_headers
 
-        if logger.isEnabledFor(logging.DEBUG):
-            logger.debug(
-                "Request POST /%s params=%s body=%s",
-                endpoint,
-                _redact_sensitive(filtered_params),
-                _redact_sensitive(body),
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Request POST /%s params=%s body=%s",
+                    endpoint,
+                    _redact_sensitive(filtered_params),
+                    _redact_sensitive(body),
+                )
 
-        return await self._request_json(
-            method="post",
-            endpoint=endpoint,
-            headers=headers,
-            params=filtered_params,
-            data=body,
-            cookies=_cookies,
-            retry=retry,
-            timeout=timeout,
-            max_attempts=max_attempts,
-            use_token=use_token,
-        )
+            return await self._request_json(
+                method="post",
+                endpoint=endpoint,
+                headers=headers,
+                params=filtered_params,
+                data=body,
+                cookies=_cookies,
+                retry=retry,
+                timeout=timeout,
+                max_attempts=max_attempts,
+                use_token=use_token,
+            )
 
     async def request_multipart(
         self,
@@ -510,6 +903,9 @@ class KworkAPI:
         retry: bool | None = None,
         timeout: aiohttp.ClientTimeout | float | None = None,
         max_attempts: int | None = None,
+        progress: ProgressCallback | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        deadline: float | None = None,
         **params: Any,
     ) -> dict[str, Any]:
         """
@@ -519,136 +915,165 @@ class KworkAPI:
         `files` - mapping of field name to:
           - path-like (`str`/`Path`)
           - `bytes`
+          - zero-argument callable returning a new binary file object (re-opened on retry)
           - file-like object opened in binary mode
-          - tuple `(filename, data_or_fileobj[, content_type])`
-        """
-        filtered_params = {k: v for k, v in params.items() if v is not None}
-
-        if use_token:
-            filtered_params["token"] = await self.get_token()
-
-        headers = {"Authorization": AUTH_HEADER}
-        if _headers:
-            headers.update(_headers)
-
-        effective_timeout = self._normalize_timeout(timeout) if timeout is not None else None
-        attempts_limit = max_attempts if max_attempts is not None else 1
-        if attempts_limit < 1:
-            raise ValueError("max_attempts must be >= 1")
-        enable_retry = retry if retry is not None else attempts_limit > 1
+          - tuple `(filename, data_or_fileobj_or_opener[, content_type])`
 
-        attempts = 0
-        while True:
-            attempts += 1
-
-            form = aiohttp.FormData()
-            if fields:
-                for k, v in fields.items():
-                    if v is None:
-                        continue
-                    if isinstance(v, bool):
-                        v = int(v)
-                    form.add_field(k, v)
+        Files are streamed in `chunk_size` chunks read in a worker thread, so memory use doesn't
+        depend on file size. `progress(sent_bytes, total_bytes)` is called after every chunk;
+        `total_bytes` is None if the size of some file can't be determined upfront.
 
-            stack = ExitStack()
-            try:
-                if files:
-                    for field, spec in files.items():
-                        if spec is None:
+        `deadline` - seconds the whole call (retries and backoff included) may take, see
+        `kwork.deadline`.
+        """
+        with deadline_scope(deadline):
+            filtered_params = {k: v for k, v in params.items() if v is not None}
+
+            if use_token:
+                filtered_params["token"] = await self.get_token()
+
+            headers = {**self._default_headers, **_headers} if _headers else self._default_headers
+
+            policy = self._endpoint_policy(endpoint)
+            if timeout is None and not self._default_policies:
+                timeout = policy.timeout
+            effective_timeout = self._normalize_timeout(timeout) if timeout is not None else None
+            attempts_limit = max_attempts if max_attempts is not None else 1
+            if attempts_limit < 1:
+                raise ValueError("max_attempts must be >= 1")
+            enable_retry = retry if retry is not None else attempts_limit > 1
+            deadline_at = current_deadline()
+
+            attempts = 0
+            while True:
+                remaining = self._check_deadline(
+                    deadline_at, method="post", endpoint=endpoint, attempts=attempts
+                )
+                attempt_timeout = self._attempt_timeout(effective_timeout, remaining)
+                permit = self._circuit_permit(endpoint)
+                attempts += 1
+
+                form = aiohttp.FormData()
+                if fields:
+                    for k, v in fields.items():
+                        if v is None:
                             continue
-
-                        filename = None
-                        content_type = None
-                        value = spec
-
-                        if isinstance(spec, tuple) and 2 <= len(spec) <= 3:
-                            filename = spec[0]
-                            value = spec[1]
-                            content_type = spec[2] if len(spec) == 3 else None
-                        elif isinstance(spec, (str, Path)):
-                            path = Path(spec)
-                            filename = path.name
-                            content_type = (
-                                mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+                        if isinstance(v, bool):
+                            v = int(v)
+                        form.add_field(k, v)
+
+                parts: list[StreamingFilePayload] = []
+                try:
+                    if files:
+                        for field, spec in files.items():
+                            if spec is None:
+                                continue
+
+                            part, reusable = await build_file_part(
+                                field, spec, chunk_size=chunk_size
                             )
-                            value = stack.enter_context(path.open("rb"))
-                        elif isinstance(spec, bytes):
-                            filename = field
-                            content_type = "application/octet-stream"
-                            value = spec
-                        else:
                             # File-like objects are not safe to retry because they may have been consumed.
-                            if enable_retry and attempts_limit > 1:
+                            if not reusable and enable_retry and attempts_limit > 1:
                                 raise ValueError(
-                                    "Retry for multipart requests requires file specs as paths/bytes/tuples, "
-                                    "not file-like objects."
+                                    "Retry for multipart requests requires file specs as "
+                                    "paths/bytes/openers, not file-like objects."
                                 )
-                            filename = getattr(spec, "name", field)
-                            content_type = "application/octet-stream"
-                            value = spec
-
-                        kwargs: dict[str, Any] = {}
-                        if filename is not None:
-                            kwargs["filename"] = filename
-                        if content_type is not None:
-                            kwargs["content_type"] = content_type
-
-                        form.add_field(field, value, **kwargs)
-
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.debug(
-                        "Request POST(multipart) /%s params=%s fields=%s files=%s headers=%s cookies=%s",
-                        endpoint,
-                        _redact_sensitive(filtered_params),
-                        list((fields or {}).keys()),
-                        list((files or {}).keys()),
-                        list((_headers or {}).keys()),
-                        list((_cookies or {}).keys()),
-                    )
+                            parts.append(part)
+                            form.add_field(
+                                field, part, filename=part.filename, content_type=part.content_type
+                            )
+                    attach_progress(parts, progress)
 
-                async with self.session.post(
-                    url=self._api_host.format(endpoint),
-                    headers=headers,
-                    params=filtered_params,
-                    data=form,
-                    cookies=_cookies,
-                    **({"timeout": effective_timeout} if effective_timeout is not None else {}),
-                ) as resp:
-                    try:
-                        return await self._handle_json_payload(
-                            resp,
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Request POST(multipart) /%s params=%s fields=%s files=%s headers=%s cookies=%s",
                             endpoint,
-                            method="post",
-                            request_params=filtered_params,
-                            request_body=None,
+                            _redact_sensitive(filtered_params),
+                            list((fields or {}).keys()),
+                            list((files or {}).keys()),
+                            list((_headers or {}).keys()),
+                            list((_cookies or {}).keys()),
                         )
-                    except KworkHTTPException as e:
-                        if (
-                            enable_retry
-                            and e.status is not None
-                            and self._should_retry_status(e.status)
-                            and attempts < attempts_limit
-                        ):
-                            retry_after = (
-                                self._parse_retry_after_seconds(resp) if e.status == 429 else None
+
+                    req_kwargs: dict[str, Any] = {
+                        "method": "post",
+                        "url": self._endpoint_url(endpoint),
+                        "headers": headers,
+                        "params": filtered_params,
+                        "data": form,
+                        "cookies": _cookies,
+                    }
+                    if attempt_timeout is not None:
+                        req_kwargs["timeout"] = attempt_timeout
+
+                    async with self._send(endpoint, **req_kwargs) as resp:
+                        try:
+                            result = await self._handle_json_payload(
+                                resp,
+                                endpoint,
+                                method="post",
+                                request_params=filtered_params,
+                                request_body=None,
                             )
-                            delay = self._compute_backoff(attempts)
-                            if retry_after is not None:
-                                delay = min(max(delay, retry_after), self._retry_backoff_max)
-                            if delay > 0:
-                                await asyncio.sleep(delay)
-                            continue
-                        raise
-            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-                if not enable_retry or attempts >= attempts_limit:
-                    raise KworkRetryExceeded(
-                        f"Request POST /{endpoint} failed after {attempts} attempts: {_format_exception_short(e)}",
+                        except KworkHTTPException as e:
+                            self._report_status(permit, e.status)
+                            if (
+                                enable_retry
+                                and e.status is not None
+                                and self._should_retry_status(e.status)
+                                and attempts < attempts_limit
+                                and self._take_retry_token("post", endpoint)
+                            ):
+                                retry_after = (
+                                    self._parse_retry_after_seconds(resp)
+                                    if e.status == 429
+                                    else None
+                                )
+                                delay = self._compute_backoff(attempts)
+                                if retry_after is not None:
+                                    delay = min(max(delay, retry_after), self._retry_backoff_max)
+                                await self._backoff(
+                                    delay,
+                                    deadline_at,
+                                    method="post",
+                                    endpoint=endpoint,
+                                    attempts=attempts,
+                                    error=e,
+                                )
+                                continue
+                            raise
+                        except KworkException:
+                            self._succeeded(permit)
+                            raise
+                        self._succeeded(permit)
+                        return result
+                except (aiohttp.ClientError, TimeoutError) as e:
+                    permit.failure()
+                    # A timeout clipped to the deadline is reported as the deadline, not a network error.
+                    self._check_deadline(
+                        deadline_at, method="post", endpoint=endpoint, attempts=attempts, error=e
+                    )
+                    if (
+                        not enable_retry
+                        or attempts >= attempts_limit
+                        or not self._take_retry_token("post", endpoint)
+                    ):
+                        raise KworkRetryExceeded(
+                            f"Request POST /{endpoint} failed after {attempts} attempts: {_format_exception_short(e)}",
+                            attempts=attempts,
+                            last_error=e,
+                        ) from e
+                    delay = self._compute_backoff(attempts)
+                    await self._backoff(
+                        delay,
+                        deadline_at,
+                        method="post",
+                        endpoint=endpoint,
                         attempts=attempts,
-                        last_error=e,
-                    ) from e
-                delay = self._compute_backoff(attempts)
-                if delay > 0:
-                    await asyncio.sleep(delay)
-                continue
-            finally:
-                stack.close()
+                        error=e,
+                    )
+                    continue
+                finally:
+                    permit.release()
+                    # Closes handles opened for this attempt that were never streamed.
+                    await asyncio.gather(*(part.close() for part in parts))
@@ -0,0 +1,424 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from kwork.schema import Message
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    message_id INTEGER PRIMARY KEY,
+    from_id INTEGER,
+    to_id INTEGER,
+    from_username TEXT,
+    to_username TEXT,
+    time INTEGER,
+    text TEXT NOT NULL DEFAULT ''
+);
+-- Contentless index: rows are read back from `messages` by rowid (= message_id). `peers` holds
+-- "u<from_id> u<to_id>", so a dialog filter is one more short doclist to intersect instead of a
+-- scan over every match; the prefix indexes keep short prefix queries from merging thousands of
+-- terms.
+CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+    text, peers, content='', tokenize='unicode61', prefix='3 4 5'
+);
+CREATE TRIGGER IF NOT EXISTS messages_ai AFTER INSERT ON messages BEGIN
+    INSERT INTO messages_fts (rowid, text, peers)
+    VALUES (new.message_id, new.text, 'u' || new.from_id || ' u' || new.to_id);
+END;
+CREATE TRIGGER IF NOT EXISTS messages_ad AFTER DELETE ON messages BEGIN
+    INSERT INTO messages_fts (messages_fts, rowid, text, peers)
+    VALUES ('delete', old.message_id, old.text, 'u' || old.from_id || ' u' || old.to_id);
+END;
+CREATE TRIGGER IF NOT EXISTS messages_au AFTER UPDATE ON messages BEGIN
+    INSERT INTO messages_fts (messages_fts, rowid, text, peers)
+    VALUES ('delete', old.message_id, old.text, 'u' || old.from_id || ' u' || old.to_id);
+    INSERT INTO messages_fts (rowid, text, peers)
+    VALUES (new.message_id, new.text, 'u' || new.from_id || ' u' || new.to_id);
+END;
+-- `synced_until`: newest message id of the last full history fetch; NULL: never synced.
+CREATE TABLE IF NOT EXISTS dialogs (
+    user_id INTEGER PRIMARY KEY,
+    username TEXT,
+    synced_until INTEGER
+);
+"""
+
+_UPSERT_MESSAGE = """
+INSERT INTO messages (message_id, from_id, to_id, from_username, to_username, time, text)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (message_id) DO UPDATE SET
+    from_id = coalesce(excluded.from_id, from_id),
+    to_id = coalesce(excluded.to_id, to_id),
+    from_username = coalesce(excluded.from_username, from_username),
+    to_username = coalesce(excluded.to_username, to_username),
+    time = coalesce(excluded.time, time),
+    text = excluded.text
+-- Re-synced unchanged messages are skipped instead of being re-indexed.
+WHERE text IS NOT excluded.text
+    OR coalesce(excluded.from_id, from_id) IS NOT from_id
+    OR coalesce(excluded.to_id, to_id) IS NOT to_id
+    OR coalesce(excluded.from_username, from_username) IS NOT from_username
+    OR coalesce(excluded.to_username, to_username) IS NOT to_username
+    OR coalesce(excluded.time, time) IS NOT time
+"""
+
+_UPSERT_DIALOG = """
+INSERT INTO dialogs (user_id, username) VALUES (?, ?)
+ON CONFLICT (user_id) DO UPDATE SET username = coalesce(excluded.username, username)
+"""
+
+_MARK_SYNCED = """
+INSERT INTO dialogs (user_id, username, synced_until) VALUES (?, ?, ?)
+ON CONFLICT (user_id) DO UPDATE SET
+    synced_until = max(coalesce(synced_until, 0), excluded.synced_until),
+    username = coalesce(excluded.username, username)
+"""
+
+_COLUMNS = "m.message_id, m.from_id, m.to_id, m.from_username, m.to_username, m.time, m.text"
+
+_MessageRow = tuple[int, int | None, int | None, str | None, str | None, int | None, str]
+
+
+def _field(item: Any, name: str) -> Any:
+    if isinstance(item, Mapping):
+        return item.get(name)
+    return getattr(item, name, None)
+
+
+def _int_or_none(value: Any) -> int | None:
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _message_row(item: Any) -> _MessageRow | None:
+    message_id = _int_or_none(_field(item, "message_id"))
+    if message_id is None:
+        return None
+    return (
+        message_id,
+        _int_or_none(_field(item, "from_id")),
+        _int_or_none(_field(item, "to_id")),
+        _field(item, "from_username"),
+        _field(item, "to_username"),
+        _int_or_none(_field(item, "time")),
+        _field(item, "message") or "",
+    )
+
+
+def _match_expression(query: str, *, prefix: bool, user_id: int | None) -> str | None:
+    # User input is matched as words, never as FTS5 query syntax.
+    words = [w.replace('"', '""') for w in query.split()]
+    if not words:
+        return None
+    star = "*" if prefix else ""
+    match = "text : (" + " ".join(f'"{w}"{star}' for w in words) + ")"
+    if user_id is not None:
+        match += f' AND peers : "u{int(user_id)}"'
+    return match
+
+
+@dataclass(slots=True)
+class ArchivedMessage:
+    """A message stored in `MessageArchive`."""
+
+    message_id: int
+    from_id: int | None
+    to_id: int | None
+    from_username: str | None
+    to_username: str | None
+    time: int | None
+    text: str
+
+    @classmethod
+    def from_raw(cls, item: Any) -> ArchivedMessage | None:
+        """Build from an `InboxMessage` (model, `LazyModel` or raw API dict)."""
+        row = _message_row(item)
+        return cls(*row) if row is not None else None
+
+
+@dataclass(slots=True)
+class ArchiveStats:
+    messages: int
+    dialogs: int
+    synced_dialogs: int
+    # Items handed to the archive but not written yet.
+    pending: int
+
+
+class MessageArchive:
+    """
+    Local SQLite archive of the messages a client has seen, with FTS5 full-text search.
+
+    `KworkClient(message_archive=...)` feeds it with every dialog / inbox page it fetches and
+    `KworkBot` with every message event. `add_*()` only queue the items: a background task
+    writes them in batches of up to `batch_size`, at most `flush_interval` seconds later.
+    `flush()` writes everything queued so far. `path=":memory:"` keeps the archive in memory.
+
+    A dialog is *synced* up to the newest message of its last full history fetch
+    (`get_dialog_with_user`). `KworkClient.search_archived_messages` then answers from the archive
+    alone, and asks the API (for newer messages only) just when told to.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = ":memory:",
+        *,
+        batch_size: int = 500,
+        flush_interval: float = 0.5,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        if flush_interval < 0:
+            raise ValueError("flush_interval must be >= 0")
+        self._path = str(path) if str(path) == ":memory:" else str(Path(path).expanduser())
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._conn: sqlite3.Connection | None = None
+        # sqlite3 connections must not be used by two threads at once.
+        self._db_lock = threading.Lock()
+        self._write_lock = asyncio.Lock()
+        self._messages: dict[int, _MessageRow] = {}
+        self._dialogs: dict[int, str | None] = {}
+        # user_id -> (username, synced_until)
+        self._synced: dict[int, tuple[str | None, int]] = {}
+        self._wakeup = asyncio.Event()
+        self._writer: asyncio.Task[None] | None = None
+        self._closed = False
+
+    # --- ingestion -----------------------------------------------------------------------
+
+    def add_messages(self, items: Iterable[Any]) -> int:
+        """Queue `InboxMessage`s (models, `LazyModel`s or raw dicts); returns how many."""
+        added = 0
+        for item in items:
+            row = _message_row(item)
+            if row is not None:
+                # The latest copy of a message (e.g. after an edit) wins.
+                self._messages[row[0]] = row
+                added += 1
+        if added:
+            self._schedule()
+        return added
+
+    def add_dialogs(self, items: Iterable[Any]) -> int:
+        """Queue `DialogMessage`s (models, `LazyModel`s or raw dicts); returns how many."""
+        added = 0
+        for item in items:
+            user_id = _int_or_none(_field(item, "user_id"))
+            if user_id is not None:
+                self._dialogs[user_id] = _field(item, "username")
+                added += 1
+        if added:
+            self._schedule()
+        return added
+
+    def add_event(self, message: Message) -> bool:
+        """Queue a bot `Message`; events without a message id are not archived."""
+        if message.inbox_id is None:
+            return False
+        last = message.last_message or {}
+        self._messages[message.inbox_id] = (
+            message.inbox_id,
+            message.from_id,
+            message.to_user_id,
+            None,
+            None,
+            _int_or_none(last.get("time")) or int(time.time()),
+            message.text,
+        )
+        self._schedule()
+        return True
+
+    def mark_synced(
+        self, user_id: int, username: str | None = None, *, last_message_id: int
+    ) -> None:
+        """
+        Record that the full history of the dialog with `user_id`, up to `last_message_id`, has
+        been added. The watermark never moves back.
+        """
+        pending = self._synced.get(user_id)
+        if pending is not None:
+            username = username if username is not None else pending[0]
+            last_message_id = max(last_message_id, pending[1])
+        self._synced[user_id] = (username, last_message_id)
+        self._schedule()
+
+    def _pending(self) -> int:
+        return len(self._messages) + len(self._dialogs) + len(self._synced)
+
+    def _schedule(self) -> None:
+        if self._closed:
+            raise RuntimeError("MessageArchive is closed")
+        if self._writer is None or self._writer.done():
+            try:
+                self._writer = asyncio.get_running_loop().create_task(self._write_loop())
+            except RuntimeError:
+                # No running loop (sync code): the items are written by the next flush().
+                return
+        self._wakeup.set()
+
+    async def _write_loop(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            if self._pending() < self._batch_size and self._flush_interval > 0:
+                # Let more items accumulate: one transaction per batch, not per page.
+                await asyncio.sleep(self._flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Failed to write the message archive")
+
+    # --- storage -------------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self._path, check_same_thread=False)
+            try:
+                conn.executescript(_SCHEMA)
+            except sqlite3.OperationalError as err:
+                conn.close()
+                raise RuntimeError(
+                    f"Can't create the message archive (SQLite with FTS5 is required): {err}"
+                ) from err
+            if self._path != ":memory:":
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn = conn
+        return self._conn
+
+    def _write(
+        self,
+        messages: list[_MessageRow],
+        dialogs: list[tuple[int, str | None]],
+        synced: list[tuple[int, str | None, int]],
+    ) -> None:
+        with self._db_lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(_UPSERT_MESSAGE, messages)
+                conn.executemany(_UPSERT_DIALOG, dialogs)
+                # After the messages: a dialog is never marked synced before its history lands.
+                conn.executemany(_MARK_SYNCED, synced)
+
+    async def flush(self) -> None:
+        """Write everything queued so far."""
+        async with self._write_lock:
+            while self._pending():
+                messages = list(self._messages.values())[: self._batch_size]
+                for row in messages:
+                    del self._messages[row[0]]
+                dialogs = list(self._dialogs.items())
+                self._dialogs.clear()
+                # Marks go with the last chunk, once every queued message is written.
+                synced: list[tuple[int, str | None, int]] = []
+                if not self._messages:
+                    synced = [(user_id, *mark) for user_id, mark in self._synced.items()]
+                    self._synced.clear()
+                await asyncio.to_thread(self._write, messages, dialogs, synced)
+
+    def _query(self, sql: str, params: tuple[Any, ...]) -> list[tuple[Any, ...]]:
+        with self._db_lock:
+            return self._connect().execute(sql, params).fetchall()
+
+    # --- search --------------------------------------------------------------------------
+
+    async def search(
+        self,
+        query: str,
+        *,
+        user_id: int | None = None,
+        since: int | None = None,
+        until: int | None = None,
+        prefix: bool = False,
+        limit: int = 50,
+    ) -> list[ArchivedMessage]:
+        """
+        Messages containing all words of `query`, newest (highest message id) first.
+
+        `prefix=True` also matches words starting with the query words ("логотип" finds
+        "логотипа"); it is slower for short, common prefixes. `user_id` limits the search to the
+        dialog with that user, `since`/`until` to a range of message times (unix seconds,
+        inclusive). Queued but unwritten items are not searched: call `flush()` first when
+        they must be.
+        """
+        match = _match_expression(query, prefix=prefix, user_id=user_id)
+        if match is None:
+            return []
+        where = ["messages_fts MATCH ?"]
+        params: list[Any] = [match]
+        if since is not None:
+            where.append("m.time >= ?")
+            params.append(since)
+        if until is not None:
+            where.append("m.time <= ?")
+            params.append(until)
+        sql = (
+            f"SELECT {_COLUMNS} FROM messages_fts "
+            "JOIN messages AS m ON m.message_id = messages_fts.rowid "
+            f"WHERE {' AND '.join(where)} ORDER BY messages_fts.rowid DESC LIMIT ?"
+        )
+        rows = await asyncio.to_thread(self._query, sql, (*params, limit))
+        return [ArchivedMessage(*row) for row in rows]
+
+    async def synced_until(self, user_id: int | None = None) -> int | None:
+        """
+        Message id up to which the archive holds the full history of the dialog with `user_id`
+        (without `user_id`: of every known dialog), or None if it was never synced. Newer
+        messages are archived only as the client or the bot happens to see them.
+        """
+        if user_id is not None:
+            rows = await asyncio.to_thread(
+                self._query, "SELECT synced_until FROM dialogs WHERE user_id = ?", (user_id,)
+            )
+            stored = rows[0][0] if rows else None
+            pending = self._synced.get(user_id)
+            if pending is None:
+                return stored
+            return max(pending[1], stored or 0)
+        rows = await asyncio.to_thread(
+            self._query, "SELECT count(*), count(synced_until), min(synced_until) FROM dialogs", ()
+        )
+        total, synced, until = rows[0]
+        return until if total > 0 and total == synced else None
+
+    async def stats(self) -> ArchiveStats:
+        rows = await asyncio.to_thread(
+            self._query,
+            "SELECT (SELECT count(*) FROM messages), count(*), count(synced_until) FROM dialogs",
+            (),
+        )
+        messages, dialogs, synced = rows[0]
+        return ArchiveStats(
+            messages=messages, dialogs=dialogs, synced_dialogs=synced, pending=self._pending()
+        )
+
+    async def close(self) -> None:
+        """Write queued items, stop the background writer and close the database."""
+        if self._closed:
+            return
+        await self.flush()
+        self._closed = True
+        if self._writer is not None:
+            self._writer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._writer
+            self._writer = None
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from dataclasses import dataclass
+
+
+class LookupCache[K: Hashable, V]:
+    """Bounded LRU cache whose entries expire `ttl` seconds after they were stored."""
+
+    def __init__(
+        self,
+        *,
+        maxsize: int = 4096,
+        ttl: float | None = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize < 0:
+            raise ValueError("maxsize must be >= 0")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be > 0 or None")
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._clock = clock
+        # key -> (expires_at or None, value)
+        self._data: OrderedDict[K, tuple[float | None, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: K) -> V | None:
+        try:
+            expires_at, value = self._data[key]
+        except KeyError:
+            return None
+        if expires_at is not None and expires_at <= self._clock():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        if self._maxsize == 0:
+            return
+        expires_at = None if self._ttl is None else self._clock() + self._ttl
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def discard(self, key: K) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+@dataclass(slots=True)
+class LookupResult[T]:
+    """Outcome of one id of a batch lookup."""
+
+    id: int
+    value: T | None = None
+    error: BaseException | None = None
+    cached: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass(slots=True)
+class BatchLookupResult[T]:
+    """Per-id results in input order (duplicates included) plus the wall-clock time."""
+
+    items: list[LookupResult[T]]
+    elapsed: float
+
+    @property
+    def values(self) -> dict[int, T]:
+        """Successfully resolved ids -> values."""
+        return {item.id: item.value for item in self.items if item.ok and item.value is not None}
+
+    @property
+    def errors(self) -> dict[int, BaseException]:
+        return {item.id: item.error for item in self.items if item.error is not None}
+
+    @property
+    def failed(self) -> list[LookupResult[T]]:
+        return [item for item in self.items if not item.ok]
+
+
+async def batch_lookup[V, T](
+    ids: Iterable[int],
+    fetch: Callable[[int], Awaitable[V]],
+    build: Callable[[V], T],
+    *,
+    cache: LookupCache[int, V] | None = None,
+    concurrency: int = 8,
+) -> BatchLookupResult[T]:
+    """
+    Resolve many ids with `fetch(id)`, at most `concurrency` requests at a time.
+
+    Ids are deduplicated, cached raw values are reused (and fresh ones stored), and `build`
+    turns a raw value into the returned object. A failure of one id (request or `build`) is
+    recorded in its `LookupResult` and doesn't affect the others.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+
+    started = time.perf_counter()
+    ordered = list(ids)
+    unique = list(dict.fromkeys(ordered))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _resolve(item_id: int) -> LookupResult[T]:
+        raw = cache.get(item_id) if cache is not None else None
+        cached = raw is not None
+        if raw is None:
+            async with semaphore:
+                try:
+                    raw = await fetch(item_id)
+                except Exception as e:  # noqa: BLE001 - recorded per id
+                    return LookupResult(id=item_id, error=e)
+            if cache is not None:
+                cache.set(item_id, raw)
+        try:
+            value = build(raw)
+        except Exception as e:  # noqa: BLE001 - recorded per id
+            if cache is not None:
+                cache.discard(item_id)
+            return LookupResult(id=item_id, error=e, cached=cached)
+        return LookupResult(id=item_id, value=value, cached=cached)
+
+    resolved = await asyncio.gather(*(_resolve(item_id) for item_id in unique))
+    by_id = dict(zip(unique, resolved, strict=True))
+    return BatchLookupResult(
+        items=[by_id[item_id] for item_id in ordered],
+        elapsed=time.perf_counter() - started,
+    )
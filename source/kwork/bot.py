@@ -5,6 +5,7 @@ from collections.abc import AsyncIterator, Callable
 from typing import Any, NamedTuple, TypeVar
 
 import websockets
+from kwork.api import API_HOST
 from kwork.client import KworkClient
 from kwork.event_parser import EventParser
 from kwork.exceptions import KworkBotException, KworkException
@@ -35,10 +36,17 @@ class KworkBot(KworkClient):
         *,
         username_cache_max: int = 4096,
         dialog_state_cache_max: int = 8192,
+        account: str | None = None,
+        api_host: str = API_HOST,
+        websocket_uri: str = WEBSOCKET_URI,
+        **client_kwargs: Any,
     ) -> None:
-        super().__init__(login, password, proxy, phone_last)
+        super().__init__(login, password, proxy, phone_last, api_host, **client_kwargs)
+        self._websocket_uri = websocket_uri
         self._handlers: list[Handler] = []
-        self._event_parser = EventParser(self)
+        # Account identity attached to every `Message` produced by this bot.
+        self.account: str = account if account is not None else login
+        self._event_parser = EventParser(self, account=self.account)
 
         if username_cache_max < 0:
             raise ValueError("username_cache_max must be >= 0")
@@ -126,7 +134,7 @@ class KworkBot(KworkClient):
 
     async def _websocket_loop(self) -> AsyncIterator[Message]:
         channel = await self.get_channel()
-        uri = WEBSOCKET_URI.format(channel)
+        uri = self._websocket_uri.format(channel)
 
         async with websockets.connect(uri) as ws:
             while True:
@@ -155,7 +163,10 @@ class KworkBot(KworkClient):
         if event is None or self._event_parser.should_skip_event(event):
             return None
 
-        return await self._event_parser.extract_message(event)
+        message = await self._event_parser.extract_message(event)
+        if message is not None and self._message_archive is not None:
+            self._message_archive.add_event(message)
+        return message
 
     async def _process_message(self, message: Message) -> None:
         for handler in self._handlers:
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import time
+from collections import defaultdict, deque
+from collections.abc import AsyncIterator, Callable, Mapping
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import IO, Any, Literal
+
+from kwork.exceptions import KworkException
+
+CassetteMode = Literal["record", "replay"]
+
+# Response headers worth keeping: everything else is noise (or cookies) for the API client.
+_KEPT_HEADERS = ("Retry-After",)
+
+
+@dataclass(slots=True)
+class Interaction:
+    """One recorded request/response pair; `params` and a JSON `body` are redacted."""
+
+    method: str
+    endpoint: str
+    params: dict[str, Any]
+    status: int
+    content_type: str
+    body: str
+    # Seconds from sending the request to reading the whole response body.
+    elapsed: float
+    # Seconds since the first interaction of the cassette.
+    offset: float
+    headers: dict[str, str] | None = None
+
+
+class ReplayResponse:
+    """The subset of `aiohttp.ClientResponse` used by `KworkAPI`, backed by an already read body."""
+
+    __slots__ = ("body", "content_type", "headers", "status")
+
+    def __init__(
+        self, status: int, content_type: str, body: str, headers: Mapping[str, str] | None
+    ) -> None:
+        self.status = status
+        self.content_type = content_type
+        self.body = body
+        self.headers = headers or {}
+
+    async def text(self, *, errors: str = "strict") -> str:
+        return self.body
+
+
+def _open(path: Path, mode: Literal["rt", "wt"]) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, mode, encoding="utf-8")
+    return path.open(mode, encoding="utf-8")
+
+
+def _redact_body(body: str, content_type: str) -> str:
+    from kwork.api import _redact_sensitive
+
+    if content_type != "application/json":
+        return body
+    try:
+        parsed = json.loads(body)
+    except json.JSONDecodeError:
+        return body
+    return json.dumps(_redact_sensitive(parsed), ensure_ascii=False, separators=(",", ":"))
+
+
+class Cassette:
+    """
+    Record/replay storage for `KworkAPI` traffic (JSON Lines, gzip-compressed for `*.gz`).
+
+    In "record" mode requests go to the network and every response is stored with its timing;
+    `save()` (called by `KworkAPI.close()`) writes the file. In "replay" mode nothing is sent:
+    responses are served per `(method, endpoint)` in recorded order, after waiting the recorded
+    latency multiplied by `time_scale` (`0` replays without delays).
+    """
+
+    def __init__(self, path: str | Path, mode: CassetteMode, *, time_scale: float = 1.0) -> None:
+        if mode not in ("record", "replay"):
+            raise ValueError("mode must be 'record' or 'replay'")
+        if time_scale < 0:
+            raise ValueError("time_scale must be >= 0")
+        self.path = Path(path).expanduser()
+        self.mode: CassetteMode = mode
+        self.time_scale = time_scale
+        self.interactions: list[Interaction] = []
+        self._started: float | None = None
+        self._queues: dict[tuple[str, str], deque[Interaction]] = defaultdict(deque)
+        if mode == "replay":
+            self.interactions = self.load(self.path)
+            for item in self.interactions:
+                self._queues[(item.method, item.endpoint)].append(item)
+
+    @classmethod
+    def record(cls, path: str | Path) -> Cassette:
+        return cls(path, "record")
+
+    @classmethod
+    def replay(cls, path: str | Path, *, time_scale: float = 1.0) -> Cassette:
+        return cls(path, "replay", time_scale=time_scale)
+
+    @staticmethod
+    def load(path: str | Path) -> list[Interaction]:
+        with _open(Path(path).expanduser(), "rt") as f:
+            return [Interaction(**json.loads(line)) for line in f if line.strip()]
+
+    def save(self) -> None:
+        if self.mode != "record":
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with _open(self.path, "wt") as f:
+            for item in self.interactions:
+                f.write(json.dumps(asdict(item), ensure_ascii=False, separators=(",", ":")))
+                f.write("\n")
+
+    def remaining(self) -> int:
+        """Recorded responses not served yet (replay mode)."""
+        return sum(len(queue) for queue in self._queues.values())
+
+    def request(
+        self,
+        send: Callable[[], AbstractAsyncContextManager[Any]],
+        *,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None,
+    ) -> AbstractAsyncContextManager[Any]:
+        """Wrap one `session.request(...)` call; `send` is only called when recording."""
+        if self.mode == "replay":
+            return self._replay(method.upper(), endpoint)
+        return self._record(send, method.upper(), endpoint, params or {})
+
+    @asynccontextmanager
+    async def _record(
+        self,
+        send: Callable[[], AbstractAsyncContextManager[Any]],
+        method: str,
+        endpoint: str,
+        params: dict[str, Any],
+    ) -> AsyncIterator[ReplayResponse]:
+        from kwork.api import _redact_sensitive
+
+        started = time.perf_counter()
+        if self._started is None:
+            self._started = started
+        async with send() as resp:
+            body = await resp.text(errors="replace")
+            elapsed = time.perf_counter() - started
+            content_type = resp.content_type
+            headers = {k: resp.headers[k] for k in _KEPT_HEADERS if k in resp.headers} or None
+            status = resp.status
+        self.interactions.append(
+            Interaction(
+                method=method,
+                endpoint=endpoint,
+                params=_redact_sensitive({k: str(v) for k, v in params.items()}),
+                status=status,
+                content_type=content_type,
+                body=_redact_body(body, content_type),
+                elapsed=round(elapsed, 6),
+                offset=round(started - self._started, 6),
+                headers=headers,
+            )
+        )
+        # The caller gets the original (unredacted) body: it may need the real token.
+        yield ReplayResponse(status, content_type, body, headers)
+
+    @asynccontextmanager
+    async def _replay(self, method: str, endpoint: str) -> AsyncIterator[ReplayResponse]:
+        queue = self._queues.get((method, endpoint))
+        if not queue:
+            raise KworkException(f"No recorded response left for {method} /{endpoint}")
+        item = queue.popleft()
+        if self.time_scale > 0 and item.elapsed > 0:
+            await asyncio.sleep(item.elapsed * self.time_scale)
+        yield ReplayResponse(item.status, item.content_type, item.body, item.headers)
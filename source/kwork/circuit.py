@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Literal
+
+from kwork.exceptions import KworkCircuitOpen
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+CircuitStateName = Literal["closed", "open", "half_open"]
+CircuitScope = Literal["endpoint", "host"]
+StateChangeCallback = Callable[[str, "CircuitStateName", "CircuitStateName"], None]
+
+_DEFAULT_FAILURE_STATUSES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass(slots=True)
+class CircuitState:
+    """Snapshot of one circuit for monitoring."""
+
+    key: str
+    state: CircuitStateName
+    # Outcomes in the current window (closed state) and how many of them failed.
+    calls: int
+    failures: int
+    # Seconds until an open circuit lets a trial request through (0 unless open).
+    retry_after: float
+    # Total requests rejected without being sent.
+    rejected: int
+
+
+class _Circuit:
+    __slots__ = (
+        "key",
+        "opened_at",
+        "outcomes",
+        "rejected",
+        "state",
+        "trial_successes",
+        "trials",
+    )
+
+    def __init__(self, key: str, window: int) -> None:
+        self.key = key
+        self.state: CircuitStateName = "closed"
+        # True for a failure, newest last.
+        self.outcomes: deque[bool] = deque(maxlen=window)
+        self.opened_at = 0.0
+        # Half-open: trial requests in flight and trial requests that succeeded.
+        self.trials = 0
+        self.trial_successes = 0
+        self.rejected = 0
+
+
+class CircuitPermit:
+    """
+    Permission to send one request; report its outcome with `success()` / `failure()`.
+
+    Only the first report counts. `release()` frees the permit without an outcome (e.g. the
+    request was cancelled) and is a no-op after a report.
+    """
+
+    __slots__ = ("_breaker", "_circuit", "_done", "_trial")
+
+    def __init__(self, breaker: CircuitBreaker, circuit: _Circuit, trial: bool) -> None:
+        self._breaker = breaker
+        self._circuit = circuit
+        self._trial = trial
+        self._done = False
+
+    def success(self) -> None:
+        if not self._done:
+            self._done = True
+            self._breaker._record(self._circuit, failed=False, trial=self._trial)
+
+    def failure(self) -> None:
+        if not self._done:
+            self._done = True
+            self._breaker._record(self._circuit, failed=True, trial=self._trial)
+
+    def release(self) -> None:
+        if not self._done:
+            self._done = True
+            if self._trial:
+                self._circuit.trials -= 1
+
+
+class _NullPermit(CircuitPermit):
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        pass
+
+    def success(self) -> None:
+        pass
+
+    def failure(self) -> None:
+        pass
+
+    def release(self) -> None:
+        pass
+
+
+# Permit used when no breaker is configured: reports are ignored.
+NULL_PERMIT: CircuitPermit = _NullPermit()
+
+
+class CircuitBreaker:
+    """
+    Circuit breakers for `KworkAPI` requests, one per endpoint (`scope="endpoint"`) or per API
+    host (`scope="host"`).
+
+    A closed circuit opens when at least `min_calls` of the last `window` requests completed
+    and `failure_ratio` of them failed (network errors, timeouts and HTTP `failure_statuses`).
+    While open, requests fail fast with `KworkCircuitOpen`. After `open_for` seconds the
+    circuit is half-open: up to `half_open_max_calls` trial requests are sent, and the circuit
+    closes once that many succeeded in a row, or opens again on the first failure.
+
+    One instance can be shared by several clients to pool their view of the server.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_ratio: float = 0.5,
+        min_calls: int = 10,
+        window: int = 20,
+        open_for: float = 30.0,
+        half_open_max_calls: int = 1,
+        scope: CircuitScope = "endpoint",
+        failure_statuses: Iterable[int] | None = None,
+        on_state_change: StateChangeCallback | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 0 < failure_ratio <= 1:
+            raise ValueError("failure_ratio must be in (0, 1]")
+        if min_calls < 1:
+            raise ValueError("min_calls must be >= 1")
+        if window < min_calls:
+            raise ValueError("window must be >= min_calls")
+        if open_for < 0:
+            raise ValueError("open_for must be >= 0")
+        if half_open_max_calls < 1:
+            raise ValueError("half_open_max_calls must be >= 1")
+        if scope not in ("endpoint", "host"):
+            raise ValueError("scope must be 'endpoint' or 'host'")
+
+        self._failure_ratio = failure_ratio
+        self._min_calls = min_calls
+        self._window = window
+        self._open_for = open_for
+        self._half_open_max_calls = half_open_max_calls
+        self._scope: CircuitScope = scope
+        self.failure_statuses: frozenset[int] = (
+            frozenset(failure_statuses)
+            if failure_statuses is not None
+            else _DEFAULT_FAILURE_STATUSES
+        )
+        self._on_state_change = on_state_change
+        self._clock = clock
+        self._circuits: dict[str, _Circuit] = {}
+
+    def key(self, host: str, endpoint: str) -> str:
+        """Circuit key of a request: `host/endpoint` or `host`, depending on `scope`."""
+        return host if self._scope == "host" else f"{host}/{endpoint}"
+
+    def acquire(self, key: str) -> CircuitPermit:
+        """Return a permit for one request to `key` or raise `KworkCircuitOpen`."""
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            circuit = self._circuits[key] = _Circuit(key, self._window)
+
+        if circuit.state == "open":
+            remaining = circuit.opened_at + self._open_for - self._clock()
+            if remaining > 0:
+                circuit.rejected += 1
+                raise KworkCircuitOpen(
+                    f"Circuit for {key} is open, retry in {remaining:.1f}s",
+                    key=key,
+                    retry_after=remaining,
+                )
+            self._transition(circuit, "half_open")
+
+        if circuit.state == "half_open":
+            if circuit.trials >= self._half_open_max_calls:
+                circuit.rejected += 1
+                raise KworkCircuitOpen(
+                    f"Circuit for {key} is half-open, waiting for trial requests",
+                    key=key,
+                    retry_after=0.0,
+                )
+            circuit.trials += 1
+            return CircuitPermit(self, circuit, trial=True)
+
+        return CircuitPermit(self, circuit, trial=False)
+
+    def _record(self, circuit: _Circuit, *, failed: bool, trial: bool) -> None:
+        if trial:
+            circuit.trials -= 1
+            if circuit.state != "half_open":
+                return
+            if failed:
+                self._open(circuit)
+                return
+            circuit.trial_successes += 1
+            if circuit.trial_successes >= self._half_open_max_calls:
+                self._transition(circuit, "closed")
+            return
+
+        if circuit.state != "closed":
+            # Outcome of a request sent before the circuit opened.
+            return
+        circuit.outcomes.append(failed)
+        calls = len(circuit.outcomes)
+        if calls >= self._min_calls and sum(circuit.outcomes) >= self._failure_ratio * calls:
+            self._open(circuit)
+
+    def _open(self, circuit: _Circuit) -> None:
+        circuit.opened_at = self._clock()
+        self._transition(circuit, "open")
+
+    def _transition(self, circuit: _Circuit, state: CircuitStateName) -> None:
+        old = circuit.state
+        circuit.state = state
+        circuit.trial_successes = 0
+        if state == "closed":
+            circuit.outcomes.clear()
+        if state == "open":
+            logger.warning("Circuit for %s opened for %.1fs", circuit.key, self._open_for)
+        else:
+            logger.info("Circuit for %s is %s", circuit.key, state)
+        if self._on_state_change is not None:
+            self._on_state_change(circuit.key, old, state)
+
+    def is_failure_status(self, status: int | None) -> bool:
+        return status is not None and status in self.failure_statuses
+
+    def state(self, key: str) -> CircuitState:
+        circuit = self._circuits.get(key) or _Circuit(key, self._window)
+        retry_after = 0.0
+        if circuit.state == "open":
+            retry_after = max(0.0, circuit.opened_at + self._open_for - self._clock())
+        return CircuitState(
+            key=key,
+            state=circuit.state,
+            calls=len(circuit.outcomes),
+            failures=sum(circuit.outcomes),
+            retry_after=retry_after,
+            rejected=circuit.rejected,
+        )
+
+    def states(self) -> dict[str, CircuitState]:
+        """Snapshot of every circuit seen so far."""
+        return {key: self.state(key) for key in self._circuits}
+
+    def reset(self, key: str | None = None) -> None:
+        """Forget the state of one circuit (or of all of them)."""
+        if key is None:
+            self._circuits.clear()
+        else:
+            self._circuits.pop(key, None)
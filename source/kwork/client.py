@@ -1,8 +1,15 @@
-from typing import Any
+import asyncio
+import time
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, overload
 
-from kwork.api import KworkAPI
+from pydantic import BaseModel
+
+from kwork.api import API_HOST, KworkAPI
 from kwork.apk_extra_mixin import APKExtraMethodsMixin
-from kwork.openapi_mixin import OpenAPIMethodsMixin
+from kwork.batch import BatchLookupResult, LookupCache, batch_lookup
+from kwork.openapi_typed_mixin import OpenAPITypedMethodsMixin
 from kwork.schema import (
     Actor,
     Connects,
@@ -12,32 +19,133 @@ from kwork.schema import (
     User,
     WantWorker,
 )
-from kwork.web_client import KworkWebClient, WebLoginResult
+from kwork.schema.adapters import parse_list
+from kwork.schema.lazy import LazyModel
+from kwork.uploads import BulkUploadResult, FileUploadResult, ProgressCallback
+
+if TYPE_CHECKING:
+    from kwork.archive import ArchivedMessage, MessageArchive
+    from kwork.identity import IdentityMap
+    from kwork.web_client import KworkWebClient, WebLoginResult
+    from kwork.web_session import WebSessionPool
+
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+
+def _stat_sizes(paths: Sequence[Path]) -> list[int | None]:
+    sizes: list[int | None] = []
+    for path in paths:
+        try:
+            sizes.append(path.stat().st_size)
+        except OSError:
+            sizes.append(None)
+    return sizes
 
 
 # IMPORTANT:
-# `OpenAPIMethodsMixin` (auto-generated) inherits a `Protocol` that defines `request(...) -> dict`
-# as a stub with `...` body. If it appears before `KworkAPI` in the MRO, Python will resolve
-# `self.request` to that stub at runtime, returning `None` and breaking the client.
+# `OpenAPIMethodsMixin` (auto-generated, base of `OpenAPITypedMethodsMixin`) inherits a `Protocol`
+# that defines `request(...) -> dict` as a stub with `...` body. If it appears before `KworkAPI`
+# in the MRO, Python will resolve `self.request` to that stub at runtime, returning `None` and
+# breaking the client.
 # Put `KworkAPI` first so the real implementations win.
-class KworkClient(KworkAPI, OpenAPIMethodsMixin, APKExtraMethodsMixin):
-    _web_client: KworkWebClient | None = None
+class KworkClient(KworkAPI, OpenAPITypedMethodsMixin, APKExtraMethodsMixin):
+    _web_client: "KworkWebClient | None" = None
+
+    def __init__(
+        self,
+        login: str,
+        password: str,
+        proxy: str | None = None,
+        phone_last: str | None = None,
+        api_host: str = API_HOST,
+        *,
+        lazy_models: bool = False,
+        lookup_cache_max: int = 4096,
+        lookup_cache_ttl: float | None = 300.0,
+        message_archive: "MessageArchive | None" = None,
+        identity_map: "IdentityMap | None" = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        `lazy_models=True` makes model-returning methods return `LazyModel` wrappers that
+        validate fields on first access instead of full Pydantic models (can be overridden per
+        call with `lazy=`). The method signatures are typed for plain models unless the call
+        passes `lazy=True`; `LazyModel` exposes the same attributes. `lookup_cache_max` / `lookup_cache_ttl` bound the caches used by
+        `get_users` and `get_kworks`. `message_archive` receives every fetched dialog and
+        message (see `kwork.archive`). With `identity_map`, validated models of the same entity
+        are returned as one shared, updated instance with interned strings (see
+        `kwork.identity`). Other keyword arguments are passed to `KworkAPI`.
+        """
+        super().__init__(login, password, proxy, phone_last, api_host, **kwargs)
+        self._lazy_models = lazy_models
+        self._message_archive = message_archive
+        self._identity_map = identity_map
+        self._user_cache: LookupCache[int, dict[str, Any]] = LookupCache(
+            maxsize=lookup_cache_max, ttl=lookup_cache_ttl
+        )
+        self._kwork_cache: LookupCache[int, dict[str, Any]] = LookupCache(
+            maxsize=lookup_cache_max, ttl=lookup_cache_ttl
+        )
+
+    def _build_model(
+        self, model: type[_ModelT], raw: dict[str, Any], lazy: bool | None
+    ) -> _ModelT | LazyModel[_ModelT]:
+        if lazy if lazy is not None else self._lazy_models:
+            return LazyModel(model, raw)
+        if self._identity_map is not None:
+            return self._identity_map.canonical(model.model_validate(raw))
+        return model.model_validate(raw)
+
+    def _build_models(
+        self, model: type[_ModelT], items: list[dict[str, Any]], lazy: bool | None
+    ) -> list[_ModelT] | list[LazyModel[_ModelT]]:
+        if lazy if lazy is not None else self._lazy_models:
+            return [LazyModel(model, item) for item in items]
+        if self._identity_map is not None:
+            return self._identity_map.canonical_all(parse_list(model, items))
+        return parse_list(model, items)
 
     @property
-    def web(self) -> KworkWebClient:
+    def identity_map(self) -> "IdentityMap | None":
+        return self._identity_map
+
+    @property
+    def message_archive(self) -> "MessageArchive | None":
+        return self._message_archive
+
+    async def close(self) -> None:
+        await super().close()
+        if self._message_archive is not None:
+            # The archive may be shared with other clients: write it out, don't close it.
+            await self._message_archive.flush()
+
+    @property
+    def web(self) -> "KworkWebClient":
         """
         Web client for kwork.ru that uses the official mobile /getWebAuthToken flow.
         """
         if self._web_client is None:
+            # Imported on first use: most API-only scripts never touch the web endpoints.
+            from kwork.web_client import KworkWebClient
+
             self._web_client = KworkWebClient(self)
         return self._web_client
 
+    def web_pool(self, *, size: int = 2, **kwargs: Any) -> "WebSessionPool":
+        """
+        Пул из `size` независимых web-сессий с автоматическим перелогином
+        (параметры — как у `kwork.web_session.WebSessionPool`).
+        """
+        from kwork.web_session import WebSessionPool
+
+        return WebSessionPool(self, size=size, **kwargs)
+
     async def web_login(
         self,
         *,
         url_to_redirect: str | None = "/",
         user_agent: str | None = None,
-    ) -> WebLoginResult:
+    ) -> "WebLoginResult":
         """
         Establish a web session (kwork.ru cookies) using the official mobile app flow.
         """
@@ -46,13 +154,94 @@ class KworkClient(KworkAPI, OpenAPIMethodsMixin, APKExtraMethodsMixin):
             user_agent=user_agent,
         )
 
-    async def get_me(self) -> Actor:
+    @overload
+    async def get_me(self, *, lazy: Literal[False] | None = None) -> Actor: ...
+    @overload
+    async def get_me(self, *, lazy: Literal[True]) -> LazyModel[Actor]: ...
+    async def get_me(self, *, lazy: bool | None = None) -> Actor | LazyModel[Actor]:
         data = await self.request("post", "actor", use_token=True)
-        return Actor(**data["response"])
+        return self._build_model(Actor, data["response"], lazy)
 
-    async def get_user(self, user_id: int) -> User:
+    @overload
+    async def get_user(self, user_id: int, *, lazy: Literal[False] | None = None) -> User: ...
+    @overload
+    async def get_user(self, user_id: int, *, lazy: Literal[True]) -> LazyModel[User]: ...
+    async def get_user(self, user_id: int, *, lazy: bool | None = None) -> User | LazyModel[User]:
         data = await self.request("post", "user", id=user_id)
-        return User(**data["response"])
+        return self._build_model(User, data["response"], lazy)
+
+    @overload
+    async def get_users(
+        self,
+        user_ids: Iterable[int],
+        *,
+        concurrency: int = 8,
+        use_cache: bool = True,
+        lazy: Literal[False] | None = None,
+    ) -> BatchLookupResult[User]: ...
+    @overload
+    async def get_users(
+        self,
+        user_ids: Iterable[int],
+        *,
+        concurrency: int = 8,
+        use_cache: bool = True,
+        lazy: Literal[True],
+    ) -> BatchLookupResult[LazyModel[User]]: ...
+    async def get_users(
+        self,
+        user_ids: Iterable[int],
+        *,
+        concurrency: int = 8,
+        use_cache: bool = True,
+        lazy: bool | None = None,
+    ) -> BatchLookupResult[User] | BatchLookupResult[LazyModel[User]]:
+        """
+        Получить данные нескольких пользователей (`user`).
+
+        Повторяющиеся id запрашиваются один раз, одновременно выполняется не больше
+        `concurrency` запросов, свежие ответы берутся из кэша клиента. Ошибка по одному id
+        не прерывает остальные: результаты возвращаются в порядке `user_ids`.
+        """
+
+        async def _fetch(user_id: int) -> dict[str, Any]:
+            data = await self.request("post", "user", id=user_id)
+            return data["response"]
+
+        def _build(raw: dict[str, Any]) -> Any:
+            # Any: the overloads above pick the element type from `lazy`.
+            return self._build_model(User, raw, lazy)
+
+        return await batch_lookup(
+            user_ids,
+            _fetch,
+            _build,
+            cache=self._user_cache if use_cache else None,
+            concurrency=concurrency,
+        )
+
+    async def get_kworks(
+        self,
+        kwork_ids: Iterable[int],
+        *,
+        concurrency: int = 8,
+        use_cache: bool = True,
+    ) -> BatchLookupResult[dict[str, Any]]:
+        """
+        Получить данные нескольких кворков (`getKworkDetails`); поведение как у `get_users`.
+        """
+
+        async def _fetch(kwork_id: int) -> dict[str, Any]:
+            data = await self.get_kwork_details(id=kwork_id)
+            return data["response"]
+
+        return await batch_lookup(
+            kwork_ids,
+            _fetch,
+            dict,
+            cache=self._kwork_cache if use_cache else None,
+            concurrency=concurrency,
+        )
 
     async def set_typing(self, recipient_id: int) -> dict[str, Any]:
         return await self.request(
@@ -87,11 +276,25 @@ class KworkClient(KworkAPI, OpenAPIMethodsMixin, APKExtraMethodsMixin):
             id=message_id,
         )
 
+    @overload
+    async def get_dialogs_page(
+        self,
+        page: int = 1,
+        excluded_ids: str | None = None,
+        *,
+        lazy: Literal[False] | None = None,
+    ) -> list[DialogMessage]: ...
+    @overload
+    async def get_dialogs_page(
+        self, page: int = 1, excluded_ids: str | None = None, *, lazy: Literal[True]
+    ) -> list[LazyModel[DialogMessage]]: ...
     async def get_dialogs_page(
         self,
         page: int = 1,
         excluded_ids: str | None = None,
-    ) -> list[DialogMessage]:
+        *,
+        lazy: bool | None = None,
+    ) -> list[DialogMessage] | list[LazyModel[DialogMessage]]:
         data = await self.request(
             "post",
             "dialogs",
@@ -100,14 +303,24 @@ class KworkClient(KworkAPI, OpenAPIMethodsMixin, APKExtraMethodsMixin):
             excludedIds=excluded_ids,
         )
         response = data.get("response") or []
-        return [DialogMessage(**d) for d in response]
+        if self._message_archive is not None:
+            self._message_archive.add_dialogs(response)
+        return self._build_models(DialogMessage, response, lazy)
 
-    async def get_all_dialogs(self) -> list[DialogMessage]:
-        dialogs: list[DialogMessage] = []
+    @overload
+    async def get_all_dialogs(
+        self, *, lazy: Literal[False] | None = None
+    ) -> list[DialogMessage]: ...
+    @overload
+    async def get_all_dialogs(self, *, lazy: Literal[True]) -> list[LazyModel[DialogMessage]]: ...
+    async def get_all_dialogs(
+        self, *, lazy: bool | None = None
+    ) -> list[DialogMessage] | list[LazyModel[DialogMessage]]:
+        dialogs: list[Any] = []
         page = 1
 
         while True:
-            page_dialogs = await self.get_dialogs_page(page)
+            page_dialogs = await self.get_dialogs_page(page, lazy=lazy)
             if not page_dialogs:
                 break
             dialogs.extend(page_dialogs)
@@ -115,12 +328,24 @@ class KworkClient(KworkAPI, OpenAPIMethodsMixin, APKExtraMethodsMixin):
 
         return dialogs
 
-    async def get_dialog_with_user(self, username: str) -> list[InboxMessage]:
-        messages: list[InboxMessage] = []
+    @overload
+    async def get_dialog_with_user(
+        self, username: str, *, lazy: Literal[False] | None = None
+    ) -> list[InboxMessage]: ...
+    @overload
+    async def get_dialog_with_user(
+        self, username: str, *, lazy: Literal[True]
+    ) -> list[LazyModel[InboxMessage]]: ...
+    async def get_dialog_with_user(
+        self, username: str, *, lazy: bool | None = None
+    ) -> list[InboxMessage] | list[LazyModel[InboxMessage]]:
+        messages: list[Any] = []
         page = 1
 
         while True:
-            page_messages, paging = await self.get_dialog_with_user_page(username, page=page)
+            page_messages, paging = await self.get_dialog_with_user_page(
+                username, page=page, lazy=lazy
+            )
             if not page_messages:
                 break
 
@@ -129,14 +354,45 @@ class KworkClient(KworkAPI, OpenAPIMethodsMixin, APKExtraMethodsMixin):
                 break
             page += 1
 
+        if self._message_archive is not None:
+            peer_id = self._peer_id(messages, username)
+            if peer_id is not None:
+                last_message_id = max(
+                    (m.message_id for m in messages if m.message_id is not None), default=0
+                )
+                self._message_archive.mark_synced(
+                    peer_id, username, last_message_id=last_message_id
+                )
         return messages
 
+    @staticmethod
+    def _peer_id(messages: Iterable[Any], username: str) -> int | None:
+        for message in messages:
+            if message.from_username == username and message.from_id is not None:
+                return message.from_id
+            if message.to_username == username and message.to_id is not None:
+                return message.to_id
+        return None
+
+    @overload
     async def get_dialog_with_user_page(
         self,
         username: str,
         *,
         page: int = 1,
-    ) -> tuple[list[InboxMessage], dict[str, Any]]:
+        lazy: Literal[False] | None = None,
+    ) -> tuple[list[InboxMessage], dict[str, Any]]: ...
+    @overload
+    async def get_dialog_with_user_page(
+        self, username: str, *, page: int = 1, lazy: Literal[True]
+    ) -> tuple[list[LazyModel[InboxMessage]], dict[str, Any]]: ...
+    async def get_dialog_with_user_page(
+        self,
+        username: str,
+        *,
+        page: int = 1,
+        lazy: bool | None = None,
+    ) -> tuple[list[InboxMessage] | list[LazyModel[InboxMessage]], dict[str, Any]]:
         """
         Получить одну страницу сообщений диалога с пользователем.
 
@@ -152,7 +408,82 @@ class KworkClient(KworkAPI, OpenAPIMethodsMixin, APKExtraMethodsMixin):
 
         response = data.get("response") or []
         paging = data.get("paging") or {}
-        return [InboxMessage(**m) for m in response], paging
+        if self._message_archive is not None:
+            self._message_archive.add_messages(response)
+        return self._build_models(InboxMessage, response, lazy), paging
+
+    async def search_archived_messages(
+        self,
+        query: str,
+        *,
+        user_id: int | None = None,
+        prefix: bool = False,
+        limit: int = 50,
+        remote_fallback: bool | None = None,
+    ) -> list["ArchivedMessage"]:
+        """
+        Поиск сообщений по локальному архиву (`message_archive`), новые первыми.
+
+        Если история диалога с `user_id` (или, без `user_id`, всех известных диалогов) ещё не
+        загружена целиком, результаты дополняются первой страницей `searchInboxes`, а найденные
+        там сообщения добавляются в архив. Синхронизированные диалоги ищутся только в архиве:
+        `remote_fallback=True` всё равно запрашивает API и берёт из ответа сообщения новее
+        последней синхронизации, `remote_fallback=False` — только архив.
+        `prefix=True` ищет слова по началу ("логотип" найдёт "логотипа").
+        """
+        from kwork.archive import ArchivedMessage
+
+        archive = self._message_archive
+        if archive is None:
+            raise ValueError("message_archive is not configured for this client")
+
+        await archive.flush()
+        found = await archive.search(query, user_id=user_id, prefix=prefix, limit=limit)
+        if remote_fallback is False:
+            return found
+
+        # The archive is complete up to the watermark and kept current by the client and the bot,
+        # so synced dialogs only go to the API on request, and then only for newer messages.
+        synced_until = await archive.synced_until(user_id)
+        if synced_until is not None and not remote_fallback:
+            return found
+        synced_until = synced_until or 0
+        data = await self.search_inboxes(query=query, userId=user_id)
+        by_id = {m.message_id: m for m in found}
+        newer: list[Any] = []
+        for raw in data.get("response") or []:
+            message = ArchivedMessage.from_raw(raw)
+            if message is not None and message.message_id > synced_until:
+                newer.append(raw)
+                by_id.setdefault(message.message_id, message)
+        archive.add_messages(newer)
+        merged = sorted(by_id.values(), key=lambda m: m.message_id, reverse=True)
+        return merged[:limit]
+
+    async def sync_message_archive(self, *, concurrency: int = 4) -> int:
+        """
+        Загрузить в `message_archive` полную историю всех диалогов.
+
+        После этого `search_archived_messages` ищет только в архиве: новые сообщения попадают в
+        него из последующих запросов клиента и событий бота. Возвращает число диалогов.
+        """
+        archive = self._message_archive
+        if archive is None:
+            raise ValueError("message_archive is not configured for this client")
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+
+        dialogs = await self.get_all_dialogs(lazy=True)
+        usernames = {d.username for d in dialogs if d.username}
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _sync(username: str) -> None:
+            async with semaphore:
+                await self.get_dialog_with_user(username, lazy=True)
+
+        await asyncio.gather(*(_sync(u) for u in usernames))
+        await archive.flush()
+        return len(usernames)
 
     async def get_worker_orders(self) -> dict[str, Any]:
         return await self.request(
@@ -173,9 +504,17 @@ class KworkClient(KworkAPI, OpenAPIMethodsMixin, APKExtraMethodsMixin):
     async def get_notifications(self) -> dict[str, Any]:
         return await self.request("post", "notifications", use_token=True)
 
-    async def get_categories(self) -> list[ParentCategory]:
+    @overload
+    async def get_categories(
+        self, *, lazy: Literal[False] | None = None
+    ) -> list[ParentCategory]: ...
+    @overload
+    async def get_categories(self, *, lazy: Literal[True]) -> list[LazyModel[ParentCategory]]: ...
+    async def get_categories(
+        self, *, lazy: bool | None = None
+    ) -> list[ParentCategory] | list[LazyModel[ParentCategory]]:
         data = await self.request("post", "categories")
-        return [ParentCategory(**c) for c in data["response"]]
+        return self._build_models(ParentCategory, data["response"], lazy)
 
     async def get_connects(self) -> Connects:
         data = await self.request(
@@ -186,6 +525,7 @@ class KworkClient(KworkAPI, OpenAPIMethodsMixin, APKExtraMethodsMixin):
         )
         return Connects(**data["connects"])
 
+    @overload
     async def get_projects(
         self,
         categories_ids: list[int | str],
@@ -196,7 +536,36 @@ class KworkClient(KworkAPI, OpenAPIMethodsMixin, APKExtraMethodsMixin):
         kworks_filter_to: int | None = None,
         page: int | None = None,
         query: str | None = None,
-    ) -> list[WantWorker]:
+        *,
+        lazy: Literal[False] | None = None,
+    ) -> list[WantWorker]: ...
+    @overload
+    async def get_projects(
+        self,
+        categories_ids: list[int | str],
+        price_from: int | None = None,
+        price_to: int | None = None,
+        hiring_from: int | None = None,
+        kworks_filter_from: int | None = None,
+        kworks_filter_to: int | None = None,
+        page: int | None = None,
+        query: str | None = None,
+        *,
+        lazy: Literal[True],
+    ) -> list[LazyModel[WantWorker]]: ...
+    async def get_projects(
+        self,
+        categories_ids: list[int | str],
+        price_from: int | None = None,
+        price_to: int | None = None,
+        hiring_from: int | None = None,
+        kworks_filter_from: int | None = None,
+        kworks_filter_to: int | None = None,
+        page: int | None = None,
+        query: str | None = None,
+        *,
+        lazy: bool | None = None,
+    ) -> list[WantWorker] | list[LazyModel[WantWorker]]:
         """
         Получить список проектов.
 
@@ -209,6 +578,7 @@ class KworkClient(KworkAPI, OpenAPIMethodsMixin, APKExtraMethodsMixin):
         kworks_filter_to: Количество предложений до (включительно)
         page: Страница выдачи
         query: Поисковая строка
+        lazy: Вернуть `LazyModel` вместо моделей (по умолчанию — настройка клиента)
         """
         categories_str = ",".join(str(c) for c in categories_ids)
 
@@ -225,4 +595,73 @@ class KworkClient(KworkAPI, OpenAPIMethodsMixin, APKExtraMethodsMixin):
             page=page,
             query=query,
         )
-        return [WantWorker(**p) for p in data["response"]]
+        return self._build_models(WantWorker, data["response"], lazy)
+
+    async def upload_portfolio_files(
+        self,
+        paths: Sequence[str | Path],
+        *,
+        concurrency: int = 4,
+        max_attempts: int = 3,
+        field: str = "file",
+        fields: dict[str, Any] | None = None,
+        use_token: bool = False,
+        progress: ProgressCallback | None = None,
+    ) -> BulkUploadResult:
+        """
+        Загрузить несколько файлов портфолио параллельно (`uploadPortfolioFile`).
+
+        Не больше `concurrency` загрузок одновременно; каждый файл ретраится отдельно
+        (до `max_attempts` попыток — это безопасно, т.к. файл открывается заново на каждую попытку).
+        Ошибка одного файла не прерывает остальные: результаты возвращаются в порядке `paths`.
+        `progress(sent_bytes, total_bytes)` получает суммарный прогресс по всем файлам.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+
+        resolved = [Path(p) for p in paths]
+        sizes = await asyncio.to_thread(_stat_sizes, resolved)
+        total = None if any(s is None for s in sizes) else sum(s for s in sizes if s is not None)
+        sent_by_file = [0] * len(resolved)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        def _file_progress(index: int) -> ProgressCallback | None:
+            report = progress
+            if report is None:
+                return None
+
+            def _report(sent: int, _total: int | None) -> None:
+                sent_by_file[index] = sent
+                report(sum(sent_by_file), total)
+
+            return _report
+
+        async def _upload(index: int, path: Path) -> FileUploadResult:
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    response = await self.upload_portfolio_file(
+                        use_token=use_token,
+                        fields=fields,
+                        files={field: path},
+                        retry=True,
+                        max_attempts=max_attempts,
+                        progress=_file_progress(index),
+                    )
+                except Exception as e:  # noqa: BLE001 - recorded per file
+                    return FileUploadResult(
+                        path=path,
+                        size=sizes[index],
+                        elapsed=time.perf_counter() - started,
+                        error=e,
+                    )
+                return FileUploadResult(
+                    path=path,
+                    size=sizes[index],
+                    elapsed=time.perf_counter() - started,
+                    response=response,
+                )
+
+        started = time.perf_counter()
+        items = await asyncio.gather(*(_upload(i, p) for i, p in enumerate(resolved)))
+        return BulkUploadResult(items=list(items), elapsed=time.perf_counter() - started)
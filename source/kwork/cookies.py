@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Mapping
+from os import PathLike
+from types import MappingProxyType
+from typing import Any
+
+import aiohttp
+from yarl import URL
+
+
+class KworkCookieJar(aiohttp.CookieJar):
+    """
+    `aiohttp.CookieJar` that caches per-URL cookie lookups.
+
+    `cookie_values(url)` is called for every web XHR (CSRF headers); instead of re-running
+    `filter_cookies` it reuses the last result for the same scheme/host/path until the jar is
+    modified (`version` changes) or `max_age` seconds pass, which bounds how long a cookie that
+    expired on its own may still be served.
+    """
+
+    def __init__(self, *, max_age: float = 30.0, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        if max_age < 0:
+            raise ValueError("max_age must be >= 0")
+        self.version = 0
+        self._max_age = max_age
+        # (scheme, host, path) -> (version, computed_at, values)
+        self._lookups: dict[tuple[str, str, str], tuple[int, float, Mapping[str, str]]] = {}
+
+    def _changed(self) -> None:
+        self.version += 1
+        self._lookups.clear()
+
+    def update_cookies(self, *args: Any, **kwargs: Any) -> None:
+        super().update_cookies(*args, **kwargs)
+        self._changed()
+
+    def update_cookies_from_headers(self, *args: Any, **kwargs: Any) -> None:
+        super().update_cookies_from_headers(*args, **kwargs)  # pyright: ignore[reportAttributeAccessIssue]
+        self._changed()
+
+    def clear(self, *args: Any, **kwargs: Any) -> None:
+        super().clear(*args, **kwargs)
+        self._changed()
+
+    def clear_domain(self, domain: str) -> None:
+        super().clear_domain(domain)
+        self._changed()
+
+    def load(self, file_path: str | PathLike[str]) -> None:
+        super().load(file_path)
+        self._changed()
+
+    def cookie_values(self, url: str | URL) -> Mapping[str, str]:
+        """Read-only `{name: value}` of cookies that would be sent to `url`."""
+        u = url if isinstance(url, URL) else URL(url)
+        key = (u.scheme, u.host or "", u.path)
+        now = time.monotonic()
+        cached = self._lookups.get(key)
+        if cached is not None and cached[0] == self.version and now - cached[1] < self._max_age:
+            return cached[2]
+
+        values = MappingProxyType(
+            {name: morsel.value for name, morsel in self.filter_cookies(u).items()}
+        )
+        self._lookups[key] = (self.version, now, values)
+        return values
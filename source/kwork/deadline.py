@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+
+# Absolute `time.monotonic()` value by which the current API call (with retries) must finish.
+_DEADLINE: ContextVar[float | None] = ContextVar("kwork_deadline", default=None)
+
+
+def current_deadline() -> float | None:
+    """`time.monotonic()` deadline of the current context, if any."""
+    return _DEADLINE.get()
+
+
+def time_left() -> float | None:
+    """Seconds left until the current deadline (may be negative), or None without one."""
+    at = _DEADLINE.get()
+    return None if at is None else at - time.monotonic()
+
+
+def deadline(seconds: float | None) -> AbstractContextManager[float | None]:
+    """
+    Limit every `KworkAPI` request made inside the block (including sign in, retries and
+    backoff sleeps) to finish within `seconds` from now.
+
+    Scopes nest: an inner scope can only shorten the deadline of the outer one. The deadline is
+    stored in a context variable, so tasks created inside the block inherit it. `None` keeps the
+    current deadline. Yields the effective absolute deadline.
+    """
+    if seconds is None:
+        # Every API call enters a scope; without a deadline it must stay as cheap as possible.
+        return nullcontext(_DEADLINE.get())
+    if seconds < 0:
+        raise ValueError("seconds must be >= 0")
+    return _deadline_scope(seconds)
+
+
+@contextmanager
+def _deadline_scope(seconds: float) -> Iterator[float]:
+    at = time.monotonic() + seconds
+    outer = _DEADLINE.get()
+    if outer is not None and outer < at:
+        at = outer
+    token = _DEADLINE.set(at)
+    try:
+        yield at
+    finally:
+        _DEADLINE.reset(token)
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, replace
+from typing import Any, Literal
+
+AuthMode = Literal["basic", "token"]
+ContentKind = Literal["query", "form", "multipart"]
+RateLimitClass = Literal["auth", "read", "write", "upload"]
+
+
+@dataclass(frozen=True, slots=True)
+class EndpointPolicy:
+    """How `KworkAPI` treats one endpoint; generated from docs/openapi.json."""
+
+    endpoint: str
+    # Safe to send more than once: retried without duplicating an action.
+    idempotent: bool
+    auth: AuthMode
+    content: ContentKind
+    # Per-attempt timeout (seconds) for calls that don't pass one; None: the client's default.
+    timeout: float | None
+    # Public read whose response may be served from the client's response cache.
+    cacheable: bool
+    rate_limit: RateLimitClass
+
+
+def _unknown_policy(endpoint: str) -> EndpointPolicy:
+    # Endpoints missing from the spec are treated as mutations: sent once, never cached.
+    return EndpointPolicy(
+        endpoint,
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    )
+
+
+class EndpointPolicies:
+    """
+    Per-endpoint retry/timeout/cache policies for `KworkAPI(endpoint_policies=...)`.
+
+    Defaults to the registry generated from docs/openapi.json (`kwork.openapi_policies`).
+    Idempotent endpoints get at least `read_max_attempts` attempts; other endpoints are sent
+    once unless the call passes `retry=True` or `max_attempts=`. Responses of cacheable endpoints
+    are reused for `cache_ttl` seconds (`cache_maxsize=0` disables the cache).
+    """
+
+    def __init__(
+        self,
+        policies: Mapping[str, EndpointPolicy] | None = None,
+        *,
+        read_max_attempts: int = 3,
+        cache_ttl: float = 60.0,
+        cache_maxsize: int = 512,
+    ) -> None:
+        if read_max_attempts < 1:
+            raise ValueError("read_max_attempts must be >= 1")
+        if cache_ttl <= 0:
+            raise ValueError("cache_ttl must be > 0")
+        if cache_maxsize < 0:
+            raise ValueError("cache_maxsize must be >= 0")
+        if policies is None:
+            from kwork.openapi_policies import ENDPOINT_POLICIES
+
+            policies = ENDPOINT_POLICIES
+        self._policies: dict[str, EndpointPolicy] = dict(policies)
+        # Endpoints missing from `policies`; kept apart so `in` only matches known endpoints.
+        self._unknown: dict[str, EndpointPolicy] = {}
+        self.read_max_attempts = read_max_attempts
+        self.cache_ttl = cache_ttl
+        self.cache_maxsize = cache_maxsize
+
+    def get(self, endpoint: str) -> EndpointPolicy:
+        policy = self._policies.get(endpoint) or self._unknown.get(endpoint)
+        if policy is None:
+            policy = self._unknown[endpoint] = _unknown_policy(endpoint)
+        return policy
+
+    def override(self, endpoint: str, **changes: Any) -> EndpointPolicy:
+        """Change fields of one endpoint's policy, e.g. `override("projects", timeout=10.0)`."""
+        policy = self._policies[endpoint] = replace(self.get(endpoint), **changes)
+        return policy
+
+    def __contains__(self, endpoint: object) -> bool:
+        return endpoint in self._policies
+
+    def __len__(self) -> int:
+        return len(self._policies)
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 from dataclasses import dataclass
@@ -6,10 +7,15 @@ from urllib.parse import unquote_plus
 
 from pydantic import ValidationError
 
+from kwork.batch import LookupCache
 from kwork.schema import BaseEvent, EventType, Message, Notify
 
 if TYPE_CHECKING:
     from kwork.client import KworkClient
+    from kwork.schema import InboxMessage
+    from kwork.schema.lazy import LazyModel
+
+    _Latest = InboxMessage | LazyModel[InboxMessage]
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -74,9 +80,64 @@ class ParsedMessage:
     last_message: dict[str, Any] | None = None
 
 
+class LatestMessageResolver:
+    """
+    Latest message of the dialog with a login, for notifications that only name the peer.
+
+    Fetches only the first `inboxes` page, and concurrent lookups of the same login share one
+    request. The message content is never cached: every notification fetches the page again.
+    Only the id of the last message returned per login is kept, so the `notify` and
+    `pop_up_notify` events sent for one message deliver it once.
+    """
+
+    def __init__(self, client: "KworkClient", *, maxsize: int = 1024) -> None:
+        self._client = client
+        # login -> id of the last message returned by `resolve`.
+        self._delivered: LookupCache[str, int] = LookupCache(maxsize=maxsize, ttl=None)
+        self._inflight: dict[str, asyncio.Task[_Latest | None]] = {}
+
+    async def resolve(self, login: str) -> "_Latest | None":
+        """The latest message, or None if there is none or it was already returned."""
+        task = self._inflight.get(login)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(login))
+            self._inflight[login] = task
+            task.add_done_callback(lambda _task: self._inflight.pop(login, None))
+        # One cancelled waiter must not cancel the lookup the others are waiting for.
+        latest = await asyncio.shield(task)
+        if latest is None or latest.message_id is None:
+            return latest
+        if self._delivered.get(login) == latest.message_id:
+            return None
+        self._delivered.set(login, latest.message_id)
+        return latest
+
+    def latest_message_id(self, login: str) -> int | None:
+        """Id of the last message returned for `login`."""
+        return self._delivered.get(login)
+
+    def invalidate(self, login: str) -> None:
+        self._delivered.discard(login)
+
+    async def _fetch(self, login: str) -> "_Latest | None":
+        messages, _paging = await self._client.get_dialog_with_user_page(login, page=1)
+        return messages[0] if messages else None
+
+
 class EventParser:
-    def __init__(self, client: "KworkClient") -> None:
+    def __init__(
+        self,
+        client: "KworkClient",
+        *,
+        account: str | None = None,
+    ) -> None:
         self._client = client
+        self._account = account
+        self._latest = LatestMessageResolver(client)
+
+    @property
+    def latest_messages(self) -> LatestMessageResolver:
+        return self._latest
 
     def parse_raw_event(self, raw_data: str) -> BaseEvent | None:
         try:
@@ -112,6 +173,7 @@ class EventParser:
             inbox_id=parsed.inbox_id,
             title=parsed.title,
             last_message=parsed.last_message,
+            account=self._account,
         )
 
     async def _parse_event_to_message(self, event: BaseEvent) -> ParsedMessage | None:
@@ -191,13 +253,8 @@ class EventParser:
         if not login:
             return None
 
-        messages = await self._client.get_dialog_with_user(login)
-
-        if not messages:
-            return None
-
-        msg = messages[0]
-        if msg.from_id is None or msg.message is None:
+        msg = await self._latest.resolve(login)
+        if msg is None or msg.from_id is None or msg.message is None:
             return None
 
         return ParsedMessage(
@@ -224,13 +281,8 @@ class EventParser:
         if not username:
             return None
 
-        messages = await self._client.get_dialog_with_user(username)
-
-        if not messages:
-            return None
-
-        msg = messages[0]
-        if msg.from_id is None or msg.message is None:
+        msg = await self._latest.resolve(username)
+        if msg is None or msg.from_id is None or msg.message is None:
             return None
 
         return ParsedMessage(
@@ -47,5 +47,35 @@ class KworkRetryExceeded(KworkException):
         self.last_error = last_error
 
 
+class KworkDeadlineExceeded(KworkRetryExceeded):
+    """The call's deadline (`deadline=` or `kwork.deadline.deadline(...)`) ran out."""
+
+
+class KworkCircuitOpen(KworkException):
+    """The circuit breaker for this endpoint is open: the request was not sent."""
+
+    def __init__(self, message: str, *, key: str, retry_after: float) -> None:
+        super().__init__(message)
+        self.key = key
+        self.retry_after = retry_after
+
+
+class KworkWebAuthError(KworkException, RuntimeError):
+    """
+    The kwork.ru web session is missing or expired (log in again via the mobile API flow).
+
+    Also a `RuntimeError`, which is what this condition was reported as before.
+    """
+
+
+class KworkShardWorkerFailed(KworkException):
+    """A `ShardSupervisor` worker kept crashing: more than `max_restarts` in `restart_window`."""
+
+    def __init__(self, message: str, *, worker_id: str, exitcode: int | None) -> None:
+        super().__init__(message)
+        self.worker_id = worker_id
+        self.exitcode = exitcode
+
+
 class KworkBotException(Exception):
     pass
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterable, Mapping
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from multidict import CIMultiDict
+
+from kwork.cassette import ReplayResponse
+from kwork.retry_budget import RetryBudget
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Idempotent reads on the bot's hot path.
+DEFAULT_HEDGED_ENDPOINTS: frozenset[str] = frozenset({"dialogs", "inboxes", "user"})
+
+
+@dataclass(slots=True)
+class HedgeStats:
+    """Counters of a `RequestHedger` since it was created."""
+
+    requests: int
+    # Requests for which a second, identical request was sent.
+    hedged: int
+    # Hedged requests answered by the second request first.
+    hedge_wins: int
+    # Requests that were slow enough to hedge but the hedge rate cap didn't allow it.
+    rate_limited: int
+    # Current hedge delay (seconds) per endpoint.
+    delays: dict[str, float]
+
+
+class RequestHedger:
+    """
+    Hedged requests for latency-critical idempotent `KworkAPI` reads.
+
+    If a request to one of `endpoints` hasn't been answered after the endpoint's `percentile`
+    latency (measured over the last `window` responses, clipped to `min_delay..max_delay`;
+    `initial_delay` until `min_samples` are collected), an identical second request is sent and
+    the first successful (2xx) response wins; the other request is cancelled. Only the first
+    page of a paginated read is hedged. At most `max_ratio` of the requests are hedged (token
+    bucket, `burst` hedges in a row).
+    """
+
+    def __init__(
+        self,
+        endpoints: Iterable[str] = DEFAULT_HEDGED_ENDPOINTS,
+        *,
+        percentile: float = 0.95,
+        window: int = 200,
+        min_samples: int = 20,
+        initial_delay: float = 0.5,
+        min_delay: float = 0.02,
+        max_delay: float = 5.0,
+        max_ratio: float = 0.1,
+        burst: float = 2.0,
+    ) -> None:
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be in (0, 1)")
+        if window < 1 or min_samples < 1:
+            raise ValueError("window and min_samples must be >= 1")
+        if min_delay < 0 or max_delay < min_delay:
+            raise ValueError("expected 0 <= min_delay <= max_delay")
+        if initial_delay < 0:
+            raise ValueError("initial_delay must be >= 0")
+
+        self.endpoints = frozenset(endpoints)
+        self._percentile = percentile
+        self._window = window
+        self._min_samples = min(min_samples, window)
+        self._initial_delay = initial_delay
+        self._min_delay = min_delay
+        self._max_delay = max_delay
+        self._budget = RetryBudget(ratio=max_ratio, min_per_second=0.0, max_tokens=burst)
+        self._samples: dict[str, deque[float]] = {}
+        # endpoint -> delay computed from the samples; dropped when a new sample arrives.
+        self._delays: dict[str, float] = {}
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.rate_limited = 0
+
+    def applies(self, endpoint: str, params: Mapping[str, Any] | None = None) -> bool:
+        # Only the first page is latency-critical; deeper pages are bulk reads.
+        if endpoint not in self.endpoints:
+            return False
+        page = None if params is None else params.get("page")
+        return page is None or str(page) == "1"
+
+    def delay(self, endpoint: str) -> float:
+        """Seconds to wait for the first response before hedging."""
+        cached = self._delays.get(endpoint)
+        if cached is not None:
+            return cached
+        samples = self._samples.get(endpoint)
+        if samples is None or len(samples) < self._min_samples:
+            return self._initial_delay
+        ordered = sorted(samples)
+        value = ordered[int(self._percentile * (len(ordered) - 1))]
+        delay = min(max(value, self._min_delay), self._max_delay)
+        self._delays[endpoint] = delay
+        return delay
+
+    def _observe(self, endpoint: str, elapsed: float) -> None:
+        samples = self._samples.get(endpoint)
+        if samples is None:
+            samples = self._samples[endpoint] = deque(maxlen=self._window)
+        samples.append(elapsed)
+        self._delays.pop(endpoint, None)
+
+    def request(
+        self, send: Callable[[], AbstractAsyncContextManager[Any]], *, endpoint: str
+    ) -> AbstractAsyncContextManager[ReplayResponse]:
+        """Wrap one `session.request(...)` call; `send` may be called twice."""
+        return self._request(send, endpoint)
+
+    @asynccontextmanager
+    async def _request(
+        self, send: Callable[[], AbstractAsyncContextManager[Any]], endpoint: str
+    ) -> AsyncIterator[ReplayResponse]:
+        yield await self._race(send, endpoint)
+
+    async def _exchange(
+        self, send: Callable[[], AbstractAsyncContextManager[Any]], endpoint: str
+    ) -> ReplayResponse:
+        started = time.perf_counter()
+        async with send() as resp:
+            body = await resp.text(errors="replace")
+            result = ReplayResponse(resp.status, resp.content_type, body, CIMultiDict(resp.headers))
+        self._observe(endpoint, time.perf_counter() - started)
+        return result
+
+    async def _race(
+        self, send: Callable[[], AbstractAsyncContextManager[Any]], endpoint: str
+    ) -> ReplayResponse:
+        self.requests += 1
+        self._budget.deposit()
+        first = asyncio.ensure_future(self._exchange(send, endpoint))
+        pending: set[asyncio.Future[ReplayResponse]] = {first}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=self.delay(endpoint))
+            if done:
+                return first.result()
+            if not self._budget.try_withdraw():
+                self.rate_limited += 1
+                return await first
+
+            self.hedged += 1
+            logger.debug("Hedging /%s after %.3fs", endpoint, self.delay(endpoint))
+            second = asyncio.ensure_future(self._exchange(send, endpoint))
+            pending.add(second)
+            # An error status doesn't win the race: the other request may still succeed.
+            # If neither does, the first request's outcome is returned.
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None and 200 <= task.result().status < 300:
+                        if task is second:
+                            self.hedge_wins += 1
+                        return task.result()
+            return first.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    def stats(self) -> HedgeStats:
+        return HedgeStats(
+            requests=self.requests,
+            hedged=self.hedged,
+            hedge_wins=self.hedge_wins,
+            rate_limited=self.rate_limited,
+            delays={endpoint: self.delay(endpoint) for endpoint in self._samples},
+        )
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import sys
+import weakref
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+from kwork.schema import (
+    Actor,
+    Category,
+    DialogMessage,
+    InboxMessage,
+    KworkObject,
+    ParentCategory,
+    Project,
+    SubCategory,
+    User,
+    WantWorker,
+)
+from kwork.schema.kwork_object import Worker
+
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+# Model class -> field holding the entity id. Subclasses of a listed class share its key field
+# but get their own identities (a `SubCategory` is never merged into a `Category`).
+DEFAULT_KEYS: dict[type[BaseModel], str] = {
+    Actor: "id",
+    Category: "id",
+    DialogMessage: "user_id",
+    InboxMessage: "message_id",
+    KworkObject: "id",
+    ParentCategory: "id",
+    Project: "id",
+    SubCategory: "id",
+    User: "id",
+    WantWorker: "id",
+    Worker: "id",
+}
+
+
+class IdentityMap:
+    """
+    Canonical model instances keyed by (model class, entity id), plus string interning.
+
+    `canonical(model)` returns the instance already seen for that id, updated in place with the
+    fields set on `model` (the freshest data wins), or registers `model` itself. Nested models
+    (`KworkObject.worker`, `User.kworks`, subcategories, ...) are canonicalized too, and strings
+    up to `max_intern_length` characters (usernames, avatar URLs, category names) are interned,
+    so repeated values across endpoints share one object.
+
+    Instances are held weakly: an entity is forgotten once the application drops every
+    reference to it, so a long-running bot doesn't accumulate stale users.
+    """
+
+    def __init__(
+        self,
+        keys: dict[type[BaseModel], str] | None = None,
+        *,
+        max_intern_length: int = 256,
+    ) -> None:
+        if max_intern_length < 0:
+            raise ValueError("max_intern_length must be >= 0")
+        self._keys = dict(DEFAULT_KEYS if keys is None else keys)
+        self._max_intern_length = max_intern_length
+        self._entities: weakref.WeakValueDictionary[tuple[type[BaseModel], Any], BaseModel] = (
+            weakref.WeakValueDictionary()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def get(self, model_cls: type[_ModelT], entity_id: Any) -> _ModelT | None:
+        return self._entities.get((model_cls, entity_id))  # type: ignore[return-value]
+
+    def intern(self, value: str) -> str:
+        if len(value) <= self._max_intern_length:
+            return sys.intern(value)
+        return value
+
+    def canonical(self, model: _ModelT) -> _ModelT:
+        for name in model.model_fields_set:
+            value = getattr(model, name)
+            new_value = self._value(value)
+            if new_value is not value:
+                # Bypass validate_assignment/frozen checks: the value has the same type.
+                vars(model)[name] = new_value
+
+        key_field = self._keys.get(type(model))
+        if key_field is None:
+            return model
+        entity_id = getattr(model, key_field, None)
+        if entity_id is None:
+            return model
+
+        key = (type(model), entity_id)
+        existing = self._entities.get(key)
+        if existing is None:
+            self.misses += 1
+            self._entities[key] = model
+            return model
+        self.hits += 1
+        if existing is not model:
+            for name in model.model_fields_set:
+                vars(existing)[name] = vars(model)[name]
+            existing.model_fields_set.update(model.model_fields_set)
+        return existing  # type: ignore[return-value]
+
+    def canonical_all(self, models: list[_ModelT]) -> list[_ModelT]:
+        return [self.canonical(model) for model in models]
+
+    def _value(self, value: Any) -> Any:
+        if isinstance(value, str):
+            return self.intern(value)
+        if isinstance(value, BaseModel):
+            return self.canonical(value)
+        if isinstance(value, list):
+            for index, item in enumerate(value):
+                value[index] = self._value(item)
+        elif isinstance(value, dict):
+            for item_key, item in value.items():
+                value[item_key] = self._value(item)
+        return value
@@ -0,0 +1,177 @@
+import asyncio
+import logging
+import random
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from kwork.bot import RECONNECT_DELAY, Handler, KworkBot
+from kwork.exceptions import KworkBotException, KworkException
+from kwork.schema import Message
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class AccountStats:
+    """Per-account counters of a running `KworkMultiBot`."""
+
+    connects: int = 0
+    reconnects: int = 0
+    messages: int = 0
+    handler_errors: int = 0
+    last_error: str | None = None
+
+
+class KworkMultiBot:
+    """
+    Runs websocket listeners of many accounts in one event loop.
+
+    Every account is a regular `KworkBot` (own token, HTTP session and caches), while the
+    handler registry is shared: a handler registered with `message_handler` receives messages
+    of all accounts, and `message.account` tells which account the event came from.
+
+    Connects and reconnects are staggered so that a restart (or an outage of notice.kwork.ru)
+    doesn't make hundreds of accounts hit `getChannel` and the websocket endpoint at once.
+    """
+
+    def __init__(
+        self,
+        *,
+        start_stagger: float = 0.2,
+        reconnect_delay: float = RECONNECT_DELAY,
+        reconnect_jitter: float = 0.5,
+    ) -> None:
+        if start_stagger < 0:
+            raise ValueError("start_stagger must be >= 0")
+        if reconnect_delay < 0:
+            raise ValueError("reconnect_delay must be >= 0")
+        if reconnect_jitter < 0:
+            raise ValueError("reconnect_jitter must be >= 0")
+
+        self._start_stagger = start_stagger
+        self._reconnect_delay = reconnect_delay
+        self._reconnect_jitter = reconnect_jitter
+
+        self._handlers: list[Handler] = []
+        self._bots: dict[str, KworkBot] = {}
+        self._stats: dict[str, AccountStats] = {}
+
+    @property
+    def accounts(self) -> tuple[str, ...]:
+        return tuple(self._bots)
+
+    def get_bot(self, account: str) -> KworkBot:
+        return self._bots[account]
+
+    def add_account(
+        self,
+        login: str,
+        password: str,
+        proxy: str | None = None,
+        phone_last: str | None = None,
+        *,
+        account: str | None = None,
+        **bot_kwargs: Any,
+    ) -> KworkBot:
+        """
+        Register an account. `account` is the identity put into `Message.account`
+        (defaults to `login`); extra keyword arguments are passed to `KworkBot`.
+        """
+        bot = KworkBot(login, password, proxy, phone_last, account=account, **bot_kwargs)
+        return self.add_bot(bot)
+
+    def add_bot(self, bot: KworkBot) -> KworkBot:
+        """
+        Register a constructed `KworkBot`. Handlers already registered on the bot are moved to
+        the shared registry (so they receive messages of all accounts) instead of being dropped.
+        """
+        if bot.account in self._bots:
+            raise KworkBotException(f"Account {bot.account!r} is already registered")
+        if bot._handlers is not self._handlers:
+            self._handlers.extend(h for h in bot._handlers if h not in self._handlers)
+            bot._handlers = self._handlers
+        self._bots[bot.account] = bot
+        self._stats[bot.account] = AccountStats()
+        return bot
+
+    def message_handler(
+        self,
+        text: str | None = None,
+        on_start: bool = False,
+        text_contains: str | None = None,
+    ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """
+        Декоратор для регистрации обработчика сообщений всех аккаунтов.
+
+        Параметры такие же, как у `KworkBot.message_handler`.
+        """
+
+        def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+            self._handlers.append(Handler(func, text, on_start, text_contains))
+            return func
+
+        return decorator
+
+    def metrics(self) -> dict[str, AccountStats]:
+        return dict(self._stats)
+
+    def _reconnect_sleep(self) -> float:
+        if self._reconnect_jitter <= 0:
+            return self._reconnect_delay
+        spread = self._reconnect_jitter * self._reconnect_delay
+        return self._reconnect_delay + random.uniform(0.0, spread)
+
+    async def run(self) -> None:
+        if not self._handlers:
+            raise KworkBotException("No handlers registered. Add at least one handler.")
+        if not self._bots:
+            raise KworkBotException("No accounts registered. Add at least one account.")
+
+        logger.info("Multi-account bot is running with %s accounts", len(self._bots))
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for index, bot in enumerate(self._bots.values()):
+                    tg.create_task(
+                        self._run_account(bot, delay=index * self._start_stagger),
+                        name=f"kwork-bot:{bot.account}",
+                    )
+        except asyncio.CancelledError:
+            logger.info("Multi-account bot run cancelled. Shutting down...")
+            raise
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        await asyncio.gather(*(bot.close() for bot in self._bots.values()), return_exceptions=True)
+
+    async def _run_account(self, bot: KworkBot, *, delay: float) -> None:
+        stats = self._stats[bot.account]
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        while True:
+            try:
+                stats.connects += 1
+                async for message in bot._websocket_loop():
+                    stats.messages += 1
+                    await self._dispatch(bot, message, stats)
+            except KworkException as e:
+                logger.warning("[%s] listener error: %s. Reconnecting...", bot.account, e)
+                stats.last_error = str(e)
+            except Exception as e:
+                # One broken account must not take the others down.
+                logger.exception("[%s] unexpected listener error. Reconnecting...", bot.account)
+                stats.last_error = str(e)
+
+            stats.reconnects += 1
+            await asyncio.sleep(self._reconnect_sleep())
+
+    async def _dispatch(self, bot: KworkBot, message: Message, stats: AccountStats) -> None:
+        try:
+            await bot._process_message(message)
+        except Exception as e:
+            stats.handler_errors += 1
+            stats.last_error = str(e)
+            logger.exception("[%s] handler failed", bot.account)
@@ -0,0 +1,2314 @@
+# This file is auto-generated. Do not edit by hand.
+# Regenerate with: python3 scripts/generate_openapi_mixin.py
+"""Per-endpoint policies derived from docs/openapi.json (see `kwork.endpoint_policy`)."""
+
+from __future__ import annotations
+
+from kwork.endpoint_policy import EndpointPolicy
+
+ENDPOINT_POLICIES: dict[str, EndpointPolicy] = {
+    "acceptExtras": EndpointPolicy(
+        "acceptExtras",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "acceptStageSuggestion": EndpointPolicy(
+        "acceptStageSuggestion",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "actor": EndpointPolicy(
+        "actor",
+        idempotent=True,
+        auth="token",
+        content="form",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "addFavoriteCategories": EndpointPolicy(
+        "addFavoriteCategories",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "addNewPhoneNumber": EndpointPolicy(
+        "addNewPhoneNumber",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "addPhoneNumber": EndpointPolicy(
+        "addPhoneNumber",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "addStage": EndpointPolicy(
+        "addStage",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "allowInboxRequest": EndpointPolicy(
+        "allowInboxRequest",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "allowMobilePush": EndpointPolicy(
+        "allowMobilePush",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "allowOrderPortfolioUpload": EndpointPolicy(
+        "allowOrderPortfolioUpload",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "allowPushNotificationsSound": EndpointPolicy(
+        "allowPushNotificationsSound",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "appleSignIn": EndpointPolicy(
+        "appleSignIn",
+        idempotent=False,
+        auth="basic",
+        content="form",
+        timeout=None,
+        cacheable=False,
+        rate_limit="auth",
+    ),
+    "applyFilters": EndpointPolicy(
+        "applyFilters",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "approveOrder": EndpointPolicy(
+        "approveOrder",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "approveOrderStage": EndpointPolicy(
+        "approveOrderStage",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "archiveDialog": EndpointPolicy(
+        "archiveDialog",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "blockDialog": EndpointPolicy(
+        "blockDialog",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "blockedDialogList": EndpointPolicy(
+        "blockedDialogList",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "cancelOrderAwaitingPayment": EndpointPolicy(
+        "cancelOrderAwaitingPayment",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "cancelOrderByPayer": EndpointPolicy(
+        "cancelOrderByPayer",
+        idempotent=False,
+        auth="token",
+        content="form",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "cancelOrderByWorker": EndpointPolicy(
+        "cancelOrderByWorker",
+        idempotent=False,
+        auth="token",
+        content="form",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "catalogCategories": EndpointPolicy(
+        "catalogCategories",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "catalogFilters": EndpointPolicy(
+        "catalogFilters",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "catalogMain": EndpointPolicy(
+        "catalogMain",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "catalogMainv2": EndpointPolicy(
+        "catalogMainv2",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "catalogRubrics": EndpointPolicy(
+        "catalogRubrics",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "categories": EndpointPolicy(
+        "categories",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "category": EndpointPolicy(
+        "category",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "categoryAttributes": EndpointPolicy(
+        "categoryAttributes",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "changePassword": EndpointPolicy(
+        "changePassword",
+        idempotent=False,
+        auth="token",
+        content="form",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "changePayerSubRole": EndpointPolicy(
+        "changePayerSubRole",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "changeUsername": EndpointPolicy(
+        "changeUsername",
+        idempotent=False,
+        auth="token",
+        content="form",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "checkLogin": EndpointPolicy(
+        "checkLogin",
+        idempotent=True,
+        auth="basic",
+        content="form",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "checkUadDuplicate": EndpointPolicy(
+        "checkUadDuplicate",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "cities": EndpointPolicy(
+        "cities",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "clearFilters": EndpointPolicy(
+        "clearFilters",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "confirmCancelOrderRequestByPayer": EndpointPolicy(
+        "confirmCancelOrderRequestByPayer",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "confirmCancelOrderRequestByWorker": EndpointPolicy(
+        "confirmCancelOrderRequestByWorker",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "countries": EndpointPolicy(
+        "countries",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "createAnswer": EndpointPolicy(
+        "createAnswer",
+        idempotent=False,
+        auth="token",
+        content="form",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "createKworkComplain": EndpointPolicy(
+        "createKworkComplain",
+        idempotent=False,
+        auth="token",
+        content="form",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "createPortfolio": EndpointPolicy(
+        "createPortfolio",
+        idempotent=False,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "createReview": EndpointPolicy(
+        "createReview",
+        idempotent=False,
+        auth="token",
+        content="form",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "createStage": EndpointPolicy(
+        "createStage",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "delFavoriteCategories": EndpointPolicy(
+        "delFavoriteCategories",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "deleteAccount": EndpointPolicy(
+        "deleteAccount",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "deleteCancelOrderRequestByPayer": EndpointPolicy(
+        "deleteCancelOrderRequestByPayer",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "deleteCancelOrderRequestByWorker": EndpointPolicy(
+        "deleteCancelOrderRequestByWorker",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "deleteCover": EndpointPolicy(
+        "deleteCover",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "deleteKwork": EndpointPolicy(
+        "deleteKwork",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "deleteOffer": EndpointPolicy(
+        "deleteOffer",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "deleteOrderNote": EndpointPolicy(
+        "deleteOrderNote",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "deletePortfolio": EndpointPolicy(
+        "deletePortfolio",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "deleteReview": EndpointPolicy(
+        "deleteReview",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "deleteStage": EndpointPolicy(
+        "deleteStage",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "deleteUserNote": EndpointPolicy(
+        "deleteUserNote",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "deleteWant": EndpointPolicy(
+        "deleteWant",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "dialogs": EndpointPolicy(
+        "dialogs",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "editAnswer": EndpointPolicy(
+        "editAnswer",
+        idempotent=False,
+        auth="token",
+        content="form",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "editPortfolio": EndpointPolicy(
+        "editPortfolio",
+        idempotent=False,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "editReview": EndpointPolicy(
+        "editReview",
+        idempotent=False,
+        auth="token",
+        content="form",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "editStage": EndpointPolicy(
+        "editStage",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "emailVerificationLetter": EndpointPolicy(
+        "emailVerificationLetter",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "exchangeInfo": EndpointPolicy(
+        "exchangeInfo",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "favoriteCategories": EndpointPolicy(
+        "favoriteCategories",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "favoriteKworks": EndpointPolicy(
+        "favoriteKworks",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "fcmNotificationsRead": EndpointPolicy(
+        "fcmNotificationsRead",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "fcmNotificationsReceived": EndpointPolicy(
+        "fcmNotificationsReceived",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "fcmTokenRequestFailed": EndpointPolicy(
+        "fcmTokenRequestFailed",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "fileDelete": EndpointPolicy(
+        "fileDelete",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "fileUpload": EndpointPolicy(
+        "fileUpload",
+        idempotent=False,
+        auth="basic",
+        content="multipart",
+        timeout=120.0,
+        cacheable=False,
+        rate_limit="upload",
+    ),
+    "getActorInfo": EndpointPolicy(
+        "getActorInfo",
+        idempotent=True,
+        auth="token",
+        content="form",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "getArbitrationReasons": EndpointPolicy(
+        "getArbitrationReasons",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "getAvailableFeatures": EndpointPolicy(
+        "getAvailableFeatures",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "getBadgesInfo": EndpointPolicy(
+        "getBadgesInfo",
+        idempotent=True,
+        auth="token",
+        content="form",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "getBillRefillUrl": EndpointPolicy(
+        "getBillRefillUrl",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "getCaptchaStatus": EndpointPolicy(
+        "getCaptchaStatus",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "getChannel": EndpointPolicy(
+        "getChannel",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "getCompanyDetails": EndpointPolicy(
+        "getCompanyDetails",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "getComplainCategories": EndpointPolicy(
+        "getComplainCategories",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "getCookie": EndpointPolicy(
+        "getCookie",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "getCurrentVersions": EndpointPolicy(
+        "getCurrentVersions",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "getCustomOptionsPresets": EndpointPolicy(
+        "getCustomOptionsPresets",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "getDialog": EndpointPolicy(
+        "getDialog",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "getExtrasAvailableForOrder": EndpointPolicy(
+        "getExtrasAvailableForOrder",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "getFishingTutorialQuestions": EndpointPolicy(
+        "getFishingTutorialQuestions",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "getHiddenKworks": EndpointPolicy(
+        "getHiddenKworks",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "getInAppNotification": EndpointPolicy(
+        "getInAppNotification",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "getInboxTracks": EndpointPolicy(
+        "getInboxTracks",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "getKworkAnswers": EndpointPolicy(
+        "getKworkAnswers",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "getKworkDetails": EndpointPolicy(
+        "getKworkDetails",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "getKworkDetailsExtra": EndpointPolicy(
+        "getKworkDetailsExtra",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "getKworkLinksTable": EndpointPolicy(
+        "getKworkLinksTable",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "getKworkLinksTablev2": EndpointPolicy(
+        "getKworkLinksTablev2",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "getKworkPortfolios": EndpointPolicy(
+        "getKworkPortfolios",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "getKworkReviews": EndpointPolicy(
+        "getKworkReviews",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "getOrderCancellationReasons": EndpointPolicy(
+        "getOrderCancellationReasons",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "getOrderDetails": EndpointPolicy(
+        "getOrderDetails",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "getOrderFiles": EndpointPolicy(
+        "getOrderFiles",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "getOrderHeader": EndpointPolicy(
+        "getOrderHeader",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "getOrderProvidedData": EndpointPolicy(
+        "getOrderProvidedData",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "getOrderedExtras": EndpointPolicy(
+        "getOrderedExtras",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "getPayerCompanyModalUrl": EndpointPolicy(
+        "getPayerCompanyModalUrl",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "getPaymentMethods": EndpointPolicy(
+        "getPaymentMethods",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "getSecurityUserData": EndpointPolicy(
+        "getSecurityUserData",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "getSubscribersStatistics": EndpointPolicy(
+        "getSubscribersStatistics",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "getTracks": EndpointPolicy(
+        "getTracks",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "getUserInfo": EndpointPolicy(
+        "getUserInfo",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "getUsersLastOrderInfo": EndpointPolicy(
+        "getUsersLastOrderInfo",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "getVoiceMessageConvertStatus": EndpointPolicy(
+        "getVoiceMessageConvertStatus",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "getVoiceMessageTranscription": EndpointPolicy(
+        "getVoiceMessageTranscription",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "getWantsCount": EndpointPolicy(
+        "getWantsCount",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "getWebAuthToken": EndpointPolicy(
+        "getWebAuthToken",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "hideDialog": EndpointPolicy(
+        "hideDialog",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "hideSelfEmployedNotification": EndpointPolicy(
+        "hideSelfEmployedNotification",
+        idempotent=False,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "hideVoiceMessageSettingsPopup": EndpointPolicy(
+        "hideVoiceMessageSettingsPopup",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "inboxComplainMessage": EndpointPolicy(
+        "inboxComplainMessage",
+        idempotent=False,
+        auth="token",
+        content="form",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "inboxCreate": EndpointPolicy(
+        "inboxCreate",
+        idempotent=False,
+        auth="token",
+        content="form",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "inboxCustomRequestDecline": EndpointPolicy(
+        "inboxCustomRequestDecline",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "inboxDelete": EndpointPolicy(
+        "inboxDelete",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "inboxEdit": EndpointPolicy(
+        "inboxEdit",
+        idempotent=False,
+        auth="token",
+        content="form",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "inboxForward": EndpointPolicy(
+        "inboxForward",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "inboxMessage": EndpointPolicy(
+        "inboxMessage",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "inboxPayerDecline": EndpointPolicy(
+        "inboxPayerDecline",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "inboxRead": EndpointPolicy(
+        "inboxRead",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "inboxTrackMessage": EndpointPolicy(
+        "inboxTrackMessage",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "inboxWorkerDecline": EndpointPolicy(
+        "inboxWorkerDecline",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "inboxes": EndpointPolicy(
+        "inboxes",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "isDialogAllow": EndpointPolicy(
+        "isDialogAllow",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "kworks": EndpointPolicy(
+        "kworks",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "kworksCategoriesList": EndpointPolicy(
+        "kworksCategoriesList",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "kworksStatusList": EndpointPolicy(
+        "kworksStatusList",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "logout": EndpointPolicy(
+        "logout",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="auth",
+    ),
+    "markInboxTracksAsRead": EndpointPolicy(
+        "markInboxTracksAsRead",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "markKworkAsFavorite": EndpointPolicy(
+        "markKworkAsFavorite",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "markKworkAsHidden": EndpointPolicy(
+        "markKworkAsHidden",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "markKworksBlackFriday": EndpointPolicy(
+        "markKworksBlackFriday",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "markVoiceMessageHeard": EndpointPolicy(
+        "markVoiceMessageHeard",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "miniature": EndpointPolicy(
+        "miniature",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "myWants": EndpointPolicy(
+        "myWants",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "notifications": EndpointPolicy(
+        "notifications",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "notificationsFetch": EndpointPolicy(
+        "notificationsFetch",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "notificationsReceived": EndpointPolicy(
+        "notificationsReceived",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "offer": EndpointPolicy(
+        "offer",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "offerOrderOptions": EndpointPolicy(
+        "offerOrderOptions",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "offers": EndpointPolicy(
+        "offers",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "offline": EndpointPolicy(
+        "offline",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "order": EndpointPolicy(
+        "order",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "orderKwork": EndpointPolicy(
+        "orderKwork",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "orderStage": EndpointPolicy(
+        "orderStage",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "ordersBetween": EndpointPolicy(
+        "ordersBetween",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "pauseKwork": EndpointPolicy(
+        "pauseKwork",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "payOrderAwaitingPayment": EndpointPolicy(
+        "payOrderAwaitingPayment",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "payerBuyExtras": EndpointPolicy(
+        "payerBuyExtras",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "payerDeclineExtras": EndpointPolicy(
+        "payerDeclineExtras",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "payerDeclinesExtraRemovalRequest": EndpointPolicy(
+        "payerDeclinesExtraRemovalRequest",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "payerExtraDelete": EndpointPolicy(
+        "payerExtraDelete",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "payerOrders": EndpointPolicy(
+        "payerOrders",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "payerUpgradePackage": EndpointPolicy(
+        "payerUpgradePackage",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "portfolioCategoriesList": EndpointPolicy(
+        "portfolioCategoriesList",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "portfolioList": EndpointPolicy(
+        "portfolioList",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "positiveReviewsCount": EndpointPolicy(
+        "positiveReviewsCount",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "privacy": EndpointPolicy(
+        "privacy",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "project": EndpointPolicy(
+        "project",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "projects": EndpointPolicy(
+        "projects",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "pushInAppNotificationLog": EndpointPolicy(
+        "pushInAppNotificationLog",
+        idempotent=False,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "rateArbitration": EndpointPolicy(
+        "rateArbitration",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "rechargeBalance": EndpointPolicy(
+        "rechargeBalance",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "registerCloudToken": EndpointPolicy(
+        "registerCloudToken",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "rejectCancelOrderRequestByPayer": EndpointPolicy(
+        "rejectCancelOrderRequestByPayer",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "rejectCancelOrderRequestByWorker": EndpointPolicy(
+        "rejectCancelOrderRequestByWorker",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "rejectStageSuggestion": EndpointPolicy(
+        "rejectStageSuggestion",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "repeatOrder": EndpointPolicy(
+        "repeatOrder",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "replaceUad": EndpointPolicy(
+        "replaceUad",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "reportAppVersion": EndpointPolicy(
+        "reportAppVersion",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "requestPhoneChanging": EndpointPolicy(
+        "requestPhoneChanging",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "resetPassword": EndpointPolicy(
+        "resetPassword",
+        idempotent=False,
+        auth="token",
+        content="form",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "resolution": EndpointPolicy(
+        "resolution",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "restartWant": EndpointPolicy(
+        "restartWant",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "saveOrderNote": EndpointPolicy(
+        "saveOrderNote",
+        idempotent=False,
+        auth="token",
+        content="form",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "saveUserNote": EndpointPolicy(
+        "saveUserNote",
+        idempotent=False,
+        auth="token",
+        content="form",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "search": EndpointPolicy(
+        "search",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "searchDialogs": EndpointPolicy(
+        "searchDialogs",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "searchInboxes": EndpointPolicy(
+        "searchInboxes",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "searchKworksCatalogQuery": EndpointPolicy(
+        "searchKworksCatalogQuery",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "searchMessages": EndpointPolicy(
+        "searchMessages",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "searchOrderTracks": EndpointPolicy(
+        "searchOrderTracks",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "searchTracks": EndpointPolicy(
+        "searchTracks",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "sendBonus": EndpointPolicy(
+        "sendBonus",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "sendCompanyForVerification": EndpointPolicy(
+        "sendCompanyForVerification",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "sendOrderForApproval": EndpointPolicy(
+        "sendOrderForApproval",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "sendOrderForArbitration": EndpointPolicy(
+        "sendOrderForArbitration",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "sendOrderForRevision": EndpointPolicy(
+        "sendOrderForRevision",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "sendOrderReceiptLinkForVerification": EndpointPolicy(
+        "sendOrderReceiptLinkForVerification",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "sendOrderRequirements": EndpointPolicy(
+        "sendOrderRequirements",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "sendReport": EndpointPolicy(
+        "sendReport",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "sendSelfEmployedSurveyResult": EndpointPolicy(
+        "sendSelfEmployedSurveyResult",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "sendUserStatus": EndpointPolicy(
+        "sendUserStatus",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "sendWhatsAppCode": EndpointPolicy(
+        "sendWhatsAppCode",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "setAvailableAtWeekends": EndpointPolicy(
+        "setAvailableAtWeekends",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "setDialogStarred": EndpointPolicy(
+        "setDialogStarred",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "setFavorite": EndpointPolicy(
+        "setFavorite",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "setFishingTutorialStatus": EndpointPolicy(
+        "setFishingTutorialStatus",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "setOrderRating": EndpointPolicy(
+        "setOrderRating",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "setTakingOrders": EndpointPolicy(
+        "setTakingOrders",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "setUserType": EndpointPolicy(
+        "setUserType",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "setVoiceMessageReceiving": EndpointPolicy(
+        "setVoiceMessageReceiving",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "setVoiceMessageSpeed": EndpointPolicy(
+        "setVoiceMessageSpeed",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "signIn": EndpointPolicy(
+        "signIn",
+        idempotent=True,
+        auth="basic",
+        content="form",
+        timeout=None,
+        cacheable=False,
+        rate_limit="auth",
+    ),
+    "signUp": EndpointPolicy(
+        "signUp",
+        idempotent=False,
+        auth="basic",
+        content="form",
+        timeout=None,
+        cacheable=False,
+        rate_limit="auth",
+    ),
+    "socialSignIn": EndpointPolicy(
+        "socialSignIn",
+        idempotent=False,
+        auth="basic",
+        content="form",
+        timeout=None,
+        cacheable=False,
+        rate_limit="auth",
+    ),
+    "socialSignInByToken": EndpointPolicy(
+        "socialSignInByToken",
+        idempotent=False,
+        auth="basic",
+        content="form",
+        timeout=None,
+        cacheable=False,
+        rate_limit="auth",
+    ),
+    "socialSignInByTokenv2": EndpointPolicy(
+        "socialSignInByTokenv2",
+        idempotent=False,
+        auth="basic",
+        content="form",
+        timeout=None,
+        cacheable=False,
+        rate_limit="auth",
+    ),
+    "socialSignUp": EndpointPolicy(
+        "socialSignUp",
+        idempotent=False,
+        auth="basic",
+        content="form",
+        timeout=None,
+        cacheable=False,
+        rate_limit="auth",
+    ),
+    "socialSignUpByToken": EndpointPolicy(
+        "socialSignUpByToken",
+        idempotent=False,
+        auth="basic",
+        content="form",
+        timeout=None,
+        cacheable=False,
+        rate_limit="auth",
+    ),
+    "startKwork": EndpointPolicy(
+        "startKwork",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "stopWant": EndpointPolicy(
+        "stopWant",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "suggestStages": EndpointPolicy(
+        "suggestStages",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "terms": EndpointPolicy(
+        "terms",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "termsOfService": EndpointPolicy(
+        "termsOfService",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "timezones": EndpointPolicy(
+        "timezones",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "trackDelete": EndpointPolicy(
+        "trackDelete",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "trackEdit": EndpointPolicy(
+        "trackEdit",
+        idempotent=False,
+        auth="token",
+        content="form",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "trackMessage": EndpointPolicy(
+        "trackMessage",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "trackRead": EndpointPolicy(
+        "trackRead",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "translationLanguages": EndpointPolicy(
+        "translationLanguages",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "typing": EndpointPolicy(
+        "typing",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "unarchiveDialog": EndpointPolicy(
+        "unarchiveDialog",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "unblockDialog": EndpointPolicy(
+        "unblockDialog",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "unreadDialog": EndpointPolicy(
+        "unreadDialog",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "updateAvatar": EndpointPolicy(
+        "updateAvatar",
+        idempotent=False,
+        auth="token",
+        content="multipart",
+        timeout=120.0,
+        cacheable=False,
+        rate_limit="upload",
+    ),
+    "updateChatDraftMessage": EndpointPolicy(
+        "updateChatDraftMessage",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "updateOrderDraftMessage": EndpointPolicy(
+        "updateOrderDraftMessage",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "updateSettings": EndpointPolicy(
+        "updateSettings",
+        idempotent=False,
+        auth="token",
+        content="multipart",
+        timeout=120.0,
+        cacheable=False,
+        rate_limit="upload",
+    ),
+    "updateStageProgress": EndpointPolicy(
+        "updateStageProgress",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "uploadCover": EndpointPolicy(
+        "uploadCover",
+        idempotent=False,
+        auth="token",
+        content="multipart",
+        timeout=120.0,
+        cacheable=False,
+        rate_limit="upload",
+    ),
+    "uploadLog": EndpointPolicy(
+        "uploadLog",
+        idempotent=False,
+        auth="basic",
+        content="multipart",
+        timeout=120.0,
+        cacheable=False,
+        rate_limit="upload",
+    ),
+    "uploadPortfolioFile": EndpointPolicy(
+        "uploadPortfolioFile",
+        idempotent=False,
+        auth="basic",
+        content="multipart",
+        timeout=120.0,
+        cacheable=False,
+        rate_limit="upload",
+    ),
+    "uploadedFile": EndpointPolicy(
+        "uploadedFile",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "user": EndpointPolicy(
+        "user",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "userByUsername": EndpointPolicy(
+        "userByUsername",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "userKworks": EndpointPolicy(
+        "userKworks",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "userReviews": EndpointPolicy(
+        "userReviews",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "userSearch": EndpointPolicy(
+        "userSearch",
+        idempotent=True,
+        auth="basic",
+        content="query",
+        timeout=None,
+        cacheable=True,
+        rate_limit="read",
+    ),
+    "verifyPhoneActivationCode": EndpointPolicy(
+        "verifyPhoneActivationCode",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "verifySmsCodeForAccountDeleting": EndpointPolicy(
+        "verifySmsCodeForAccountDeleting",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "viewedCatalogKworks": EndpointPolicy(
+        "viewedCatalogKworks",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "voiceUpload": EndpointPolicy(
+        "voiceUpload",
+        idempotent=False,
+        auth="basic",
+        content="multipart",
+        timeout=120.0,
+        cacheable=False,
+        rate_limit="upload",
+    ),
+    "want": EndpointPolicy(
+        "want",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "wantsStatusList": EndpointPolicy(
+        "wantsStatusList",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+    "workerConfirmsExtraRemovalRequest": EndpointPolicy(
+        "workerConfirmsExtraRemovalRequest",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "workerDeclineExtras": EndpointPolicy(
+        "workerDeclineExtras",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "workerDeclinesExtraRemovalRequest": EndpointPolicy(
+        "workerDeclinesExtraRemovalRequest",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "workerExtraDelete": EndpointPolicy(
+        "workerExtraDelete",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "workerInprogress": EndpointPolicy(
+        "workerInprogress",
+        idempotent=False,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="write",
+    ),
+    "workerOrders": EndpointPolicy(
+        "workerOrders",
+        idempotent=True,
+        auth="token",
+        content="query",
+        timeout=None,
+        cacheable=False,
+        rate_limit="read",
+    ),
+}
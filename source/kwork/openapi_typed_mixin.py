@@ -0,0 +1,556 @@
+# This file is auto-generated. Do not edit by hand.
+# Regenerate with: python3 scripts/generate_openapi_mixin.py
+from __future__ import annotations
+
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+from pydantic import TypeAdapter
+
+from kwork.openapi_mixin import OpenAPIMethodsMixin
+
+if TYPE_CHECKING:
+    from kwork.schema import openapi_models as m
+
+
+@cache
+def _adapter(tp: Any) -> TypeAdapter[Any]:
+    return TypeAdapter(tp)
+
+
+class OpenAPITypedMethodsMixin(OpenAPIMethodsMixin):
+    """
+    Auto-generated typed variants of endpoints whose response references a component schema.
+
+    Models live in `kwork.schema.openapi_models` and are imported on first call only.
+    """
+
+    async def catalog_categories_typed(
+        self,
+        *,
+        use_token: bool = False,
+        **params: Any,
+    ) -> list[m.SecondLevelCategory]:
+        """`catalog_categories()` with `response` validated as `list[SecondLevelCategory]`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.catalog_categories(use_token=use_token, **params)
+        return _adapter(list[m.SecondLevelCategory]).validate_python(data.get("response"))
+
+    async def catalog_rubrics_typed(
+        self,
+        *,
+        use_token: bool = False,
+        **params: Any,
+    ) -> list[m.FirstLevelCategory]:
+        """`catalog_rubrics()` with `response` validated as `list[FirstLevelCategory]`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.catalog_rubrics(use_token=use_token, **params)
+        return _adapter(list[m.FirstLevelCategory]).validate_python(data.get("response"))
+
+    async def categories_typed(
+        self,
+        *,
+        use_token: bool = False,
+        **params: Any,
+    ) -> list[m.CategoryLevel1]:
+        """`categories()` with `response` validated as `list[CategoryLevel1]`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.categories(use_token=use_token, **params)
+        return _adapter(list[m.CategoryLevel1]).validate_python(data.get("response"))
+
+    async def category_attributes_typed(
+        self,
+        *,
+        use_token: bool = False,
+        **params: Any,
+    ) -> m.Attributes:
+        """`category_attributes()` with `response` validated as `Attributes`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.category_attributes(use_token=use_token, **params)
+        return _adapter(m.Attributes).validate_python(data.get("response"))
+
+    async def clear_filters_typed(
+        self,
+        *,
+        use_token: bool = True,
+        **params: Any,
+    ) -> list[m.WantsFilter]:
+        """`clear_filters()` with `response` validated as `list[WantsFilter]`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.clear_filters(use_token=use_token, **params)
+        return _adapter(list[m.WantsFilter]).validate_python(data.get("response"))
+
+    async def dialogs_typed(
+        self,
+        *,
+        use_token: bool = True,
+        **params: Any,
+    ) -> list[m.DialogMessage]:
+        """`dialogs()` with `response` validated as `list[DialogMessage]`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.dialogs(use_token=use_token, **params)
+        return _adapter(list[m.DialogMessage]).validate_python(data.get("response"))
+
+    async def exchange_info_typed(
+        self,
+        *,
+        use_token: bool = True,
+        **params: Any,
+    ) -> list[m.ExchangeInfo]:
+        """`exchange_info()` with `response` validated as `list[ExchangeInfo]`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.exchange_info(use_token=use_token, **params)
+        return _adapter(list[m.ExchangeInfo]).validate_python(data.get("response"))
+
+    async def favorite_kworks_typed(
+        self,
+        *,
+        use_token: bool = True,
+        **params: Any,
+    ) -> m.FavoriteKworks:
+        """`favorite_kworks()` with `response` validated as `FavoriteKworks`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.favorite_kworks(use_token=use_token, **params)
+        return _adapter(m.FavoriteKworks).validate_python(data.get("response"))
+
+    async def file_upload_typed(
+        self,
+        *,
+        use_token: bool = False,
+        fields: dict[str, Any] | None = None,
+        files: dict[str, Any] | None = None,
+        **params: Any,
+    ) -> m.File:
+        """`file_upload()` with `response` validated as `File`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.file_upload(use_token=use_token, fields=fields, files=files, **params)
+        return _adapter(m.File).validate_python(data.get("response"))
+
+    async def get_arbitration_reasons_typed(
+        self,
+        *,
+        use_token: bool = True,
+        **params: Any,
+    ) -> list[m.ArbitrationReason]:
+        """`get_arbitration_reasons()` with `response` validated as `list[ArbitrationReason]`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.get_arbitration_reasons(use_token=use_token, **params)
+        return _adapter(list[m.ArbitrationReason]).validate_python(data.get("response"))
+
+    async def get_complain_categories_typed(
+        self,
+        *,
+        use_token: bool = False,
+        **params: Any,
+    ) -> list[m.ComplainCategory]:
+        """`get_complain_categories()` with `response` validated as `list[ComplainCategory]`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.get_complain_categories(use_token=use_token, **params)
+        return _adapter(list[m.ComplainCategory]).validate_python(data.get("response"))
+
+    async def get_dialog_typed(
+        self,
+        *,
+        use_token: bool = True,
+        **params: Any,
+    ) -> m.DialogMessage:
+        """`get_dialog()` with `response` validated as `DialogMessage`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.get_dialog(use_token=use_token, **params)
+        return _adapter(m.DialogMessage).validate_python(data.get("response"))
+
+    async def get_extras_available_for_order_typed(
+        self,
+        *,
+        use_token: bool = True,
+        **params: Any,
+    ) -> list[m.OrderOption]:
+        """`get_extras_available_for_order()` with `response` validated as `list[OrderOption]`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.get_extras_available_for_order(use_token=use_token, **params)
+        return _adapter(list[m.OrderOption]).validate_python(data.get("response"))
+
+    async def get_hidden_kworks_typed(
+        self,
+        *,
+        use_token: bool = True,
+        **params: Any,
+    ) -> m.ProfileKworks:
+        """`get_hidden_kworks()` with `response` validated as `ProfileKworks`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.get_hidden_kworks(use_token=use_token, **params)
+        return _adapter(m.ProfileKworks).validate_python(data.get("response"))
+
+    async def get_inbox_tracks_typed(
+        self,
+        *,
+        use_token: bool = True,
+        **params: Any,
+    ) -> list[m.InboxTrackMessage]:
+        """`get_inbox_tracks()` with `response` validated as `list[InboxTrackMessage]`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.get_inbox_tracks(use_token=use_token, **params)
+        return _adapter(list[m.InboxTrackMessage]).validate_python(data.get("response"))
+
+    async def get_kwork_links_table_typed(
+        self,
+        *,
+        use_token: bool = False,
+        **params: Any,
+    ) -> list[m.KworkLinkSiteItem]:
+        """`get_kwork_links_table()` with `response` validated as `list[KworkLinkSiteItem]`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.get_kwork_links_table(use_token=use_token, **params)
+        return _adapter(list[m.KworkLinkSiteItem]).validate_python(data.get("response"))
+
+    async def get_kwork_portfolios_typed(
+        self,
+        *,
+        use_token: bool = False,
+        **params: Any,
+    ) -> list[m.ProfilePortfolios]:
+        """`get_kwork_portfolios()` with `response` validated as `list[ProfilePortfolios]`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.get_kwork_portfolios(use_token=use_token, **params)
+        return _adapter(list[m.ProfilePortfolios]).validate_python(data.get("response"))
+
+    async def get_order_cancellation_reasons_typed(
+        self,
+        *,
+        use_token: bool = True,
+        **params: Any,
+    ) -> list[m.CancelReason]:
+        """`get_order_cancellation_reasons()` with `response` validated as `list[CancelReason]`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.get_order_cancellation_reasons(use_token=use_token, **params)
+        return _adapter(list[m.CancelReason]).validate_python(data.get("response"))
+
+    async def get_order_details_typed(
+        self,
+        *,
+        use_token: bool = True,
+        **params: Any,
+    ) -> list[m.OrderDetails]:
+        """`get_order_details()` with `response` validated as `list[OrderDetails]`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.get_order_details(use_token=use_token, **params)
+        return _adapter(list[m.OrderDetails]).validate_python(data.get("response"))
+
+    async def get_order_header_typed(
+        self,
+        *,
+        use_token: bool = True,
+        **params: Any,
+    ) -> list[m.OrderHeader]:
+        """`get_order_header()` with `response` validated as `list[OrderHeader]`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.get_order_header(use_token=use_token, **params)
+        return _adapter(list[m.OrderHeader]).validate_python(data.get("response"))
+
+    async def get_order_provided_data_typed(
+        self,
+        *,
+        use_token: bool = True,
+        **params: Any,
+    ) -> list[m.OrderProvidedData]:
+        """`get_order_provided_data()` with `response` validated as `list[OrderProvidedData]`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.get_order_provided_data(use_token=use_token, **params)
+        return _adapter(list[m.OrderProvidedData]).validate_python(data.get("response"))
+
+    async def inbox_message_typed(
+        self,
+        *,
+        use_token: bool = True,
+        **params: Any,
+    ) -> list[m.GetMessage]:
+        """`inbox_message()` with `response` validated as `list[GetMessage]`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.inbox_message(use_token=use_token, **params)
+        return _adapter(list[m.GetMessage]).validate_python(data.get("response"))
+
+    async def inbox_track_message_typed(
+        self,
+        *,
+        use_token: bool = True,
+        **params: Any,
+    ) -> list[m.GetMessageWithTrack]:
+        """`inbox_track_message()` with `response` validated as `list[GetMessageWithTrack]`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.inbox_track_message(use_token=use_token, **params)
+        return _adapter(list[m.GetMessageWithTrack]).validate_python(data.get("response"))
+
+    async def inboxes_typed(
+        self,
+        *,
+        use_token: bool = True,
+        **params: Any,
+    ) -> list[m.InboxMessage]:
+        """`inboxes()` with `response` validated as `list[InboxMessage]`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.inboxes(use_token=use_token, **params)
+        return _adapter(list[m.InboxMessage]).validate_python(data.get("response"))
+
+    async def my_wants_typed(
+        self,
+        *,
+        use_token: bool = True,
+        **params: Any,
+    ) -> list[m.WantPayer]:
+        """`my_wants()` with `response` validated as `list[WantPayer]`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.my_wants(use_token=use_token, **params)
+        return _adapter(list[m.WantPayer]).validate_python(data.get("response"))
+
+    async def notifications_typed(
+        self,
+        *,
+        use_token: bool = True,
+        **params: Any,
+    ) -> list[m.NotificationType]:
+        """`notifications()` with `response` validated as `list[NotificationType]`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.notifications(use_token=use_token, **params)
+        return _adapter(list[m.NotificationType]).validate_python(data.get("response"))
+
+    async def notifications_fetch_typed(
+        self,
+        *,
+        use_token: bool = True,
+        **params: Any,
+    ) -> list[m.PushEvent]:
+        """`notifications_fetch()` with `response` validated as `list[PushEvent]`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.notifications_fetch(use_token=use_token, **params)
+        return _adapter(list[m.PushEvent]).validate_python(data.get("response"))
+
+    async def offer_typed(
+        self,
+        *,
+        use_token: bool = True,
+        **params: Any,
+    ) -> m.Offer:
+        """`offer()` with `response` validated as `Offer`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.offer(use_token=use_token, **params)
+        return _adapter(m.Offer).validate_python(data.get("response"))
+
+    async def offers_typed(
+        self,
+        *,
+        use_token: bool = True,
+        **params: Any,
+    ) -> list[m.Offer]:
+        """`offers()` with `response` validated as `list[Offer]`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.offers(use_token=use_token, **params)
+        return _adapter(list[m.Offer]).validate_python(data.get("response"))
+
+    async def positive_reviews_count_typed(
+        self,
+        *,
+        use_token: bool = False,
+        **params: Any,
+    ) -> m.PositiveReviewsCount:
+        """`positive_reviews_count()` with `response` validated as `PositiveReviewsCount`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.positive_reviews_count(use_token=use_token, **params)
+        return _adapter(m.PositiveReviewsCount).validate_python(data.get("response"))
+
+    async def project_typed(
+        self,
+        *,
+        use_token: bool = True,
+        **params: Any,
+    ) -> m.WantWorker:
+        """`project()` with `response` validated as `WantWorker`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.project(use_token=use_token, **params)
+        return _adapter(m.WantWorker).validate_python(data.get("response"))
+
+    async def projects_typed(
+        self,
+        *,
+        use_token: bool = True,
+        **params: Any,
+    ) -> list[m.WantWorker]:
+        """`projects()` with `response` validated as `list[WantWorker]`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.projects(use_token=use_token, **params)
+        return _adapter(list[m.WantWorker]).validate_python(data.get("response"))
+
+    async def search_typed(
+        self,
+        *,
+        use_token: bool = False,
+        **params: Any,
+    ) -> list[m.ProfileKworksWithWorkerLevel]:
+        """`search()` with `response` validated as `list[ProfileKworksWithWorkerLevel]`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.search(use_token=use_token, **params)
+        return _adapter(list[m.ProfileKworksWithWorkerLevel]).validate_python(data.get("response"))
+
+    async def search_dialogs_typed(
+        self,
+        *,
+        use_token: bool = True,
+        **params: Any,
+    ) -> list[m.DialogMessage]:
+        """`search_dialogs()` with `response` validated as `list[DialogMessage]`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.search_dialogs(use_token=use_token, **params)
+        return _adapter(list[m.DialogMessage]).validate_python(data.get("response"))
+
+    async def search_inboxes_typed(
+        self,
+        *,
+        use_token: bool = True,
+        **params: Any,
+    ) -> list[m.InboxMessage]:
+        """`search_inboxes()` with `response` validated as `list[InboxMessage]`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.search_inboxes(use_token=use_token, **params)
+        return _adapter(list[m.InboxMessage]).validate_python(data.get("response"))
+
+    async def track_message_typed(
+        self,
+        *,
+        use_token: bool = True,
+        **params: Any,
+    ) -> list[m.Track]:
+        """`track_message()` with `response` validated as `list[Track]`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.track_message(use_token=use_token, **params)
+        return _adapter(list[m.Track]).validate_python(data.get("response"))
+
+    async def user_typed(
+        self,
+        *,
+        use_token: bool = False,
+        **params: Any,
+    ) -> m.User:
+        """`user()` with `response` validated as `User`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.user(use_token=use_token, **params)
+        return _adapter(m.User).validate_python(data.get("response"))
+
+    async def user_by_username_typed(
+        self,
+        *,
+        use_token: bool = False,
+        **params: Any,
+    ) -> m.User:
+        """`user_by_username()` with `response` validated as `User`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.user_by_username(use_token=use_token, **params)
+        return _adapter(m.User).validate_python(data.get("response"))
+
+    async def user_kworks_typed(
+        self,
+        *,
+        use_token: bool = True,
+        **params: Any,
+    ) -> m.ProfileKworksWithWorkerLevel:
+        """`user_kworks()` with `response` validated as `ProfileKworksWithWorkerLevel`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.user_kworks(use_token=use_token, **params)
+        return _adapter(m.ProfileKworksWithWorkerLevel).validate_python(data.get("response"))
+
+    async def user_reviews_typed(
+        self,
+        *,
+        use_token: bool = True,
+        **params: Any,
+    ) -> list[m.UserReview]:
+        """`user_reviews()` with `response` validated as `list[UserReview]`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.user_reviews(use_token=use_token, **params)
+        return _adapter(list[m.UserReview]).validate_python(data.get("response"))
+
+    async def user_search_typed(
+        self,
+        *,
+        use_token: bool = False,
+        **params: Any,
+    ) -> list[m.UserWorker]:
+        """`user_search()` with `response` validated as `list[UserWorker]`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.user_search(use_token=use_token, **params)
+        return _adapter(list[m.UserWorker]).validate_python(data.get("response"))
+
+    async def viewed_catalog_kworks_typed(
+        self,
+        *,
+        use_token: bool = True,
+        **params: Any,
+    ) -> m.ProfileKworks:
+        """`viewed_catalog_kworks()` with `response` validated as `ProfileKworks`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.viewed_catalog_kworks(use_token=use_token, **params)
+        return _adapter(m.ProfileKworks).validate_python(data.get("response"))
+
+    async def want_typed(
+        self,
+        *,
+        use_token: bool = True,
+        **params: Any,
+    ) -> list[m.WantPayer]:
+        """`want()` with `response` validated as `list[WantPayer]`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.want(use_token=use_token, **params)
+        return _adapter(list[m.WantPayer]).validate_python(data.get("response"))
+
+    async def wants_status_list_typed(
+        self,
+        *,
+        use_token: bool = True,
+        **params: Any,
+    ) -> list[m.WantsList]:
+        """`wants_status_list()` with `response` validated as `list[WantsList]`."""
+        from kwork.schema import openapi_models as m
+
+        data = await self.wants_status_list(use_token=use_token, **params)
+        return _adapter(list[m.WantsList]).validate_python(data.get("response"))
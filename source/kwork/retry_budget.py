@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class RetryBudgetStats:
+    """Counters of a `RetryBudget` since it was created."""
+
+    tokens: float
+    successes: int
+    retries: int
+    # Retries that were skipped because the budget was exhausted.
+    rejected: int
+
+
+class RetryBudget:
+    """
+    Token bucket that caps retries to a fraction of successful requests.
+
+    Every successful request deposits `ratio` tokens and every retry withdraws one, so during
+    an outage retries stop after roughly `ratio` x (recent successes) instead of multiplying the
+    traffic by `retry_max_attempts`. `min_per_second` tokens are added per second regardless of
+    traffic, so a quiet client can still retry occasionally; the bucket holds at most
+    `max_tokens`, which bounds how much past success can be spent in one burst.
+
+    One instance can be shared by several clients to budget their retries together.
+    """
+
+    def __init__(
+        self,
+        *,
+        ratio: float = 0.1,
+        min_per_second: float = 1.0,
+        max_tokens: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ratio < 0:
+            raise ValueError("ratio must be >= 0")
+        if min_per_second < 0:
+            raise ValueError("min_per_second must be >= 0")
+        if max_tokens < 1:
+            raise ValueError("max_tokens must be >= 1")
+        self._ratio = ratio
+        self._min_per_second = min_per_second
+        self._max_tokens = max_tokens
+        self._clock = clock
+        self._tokens = max_tokens
+        self._updated = clock()
+        self.successes = 0
+        self.retries = 0
+        self.rejected = 0
+
+    def _refill(self) -> None:
+        now = self._clock()
+        if self._min_per_second:
+            self._tokens = min(
+                self._max_tokens, self._tokens + (now - self._updated) * self._min_per_second
+            )
+        self._updated = now
+
+    @property
+    def tokens(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def deposit(self) -> None:
+        """Record a successful request."""
+        self.successes += 1
+        self._refill()
+        self._tokens = min(self._max_tokens, self._tokens + self._ratio)
+
+    def try_withdraw(self) -> bool:
+        """Take one token for a retry; False (and no retry) if the budget is exhausted."""
+        self._refill()
+        if self._tokens < 1:
+            self.rejected += 1
+            return False
+        self._tokens -= 1
+        self.retries += 1
+        return True
+
+    def stats(self) -> RetryBudgetStats:
+        return RetryBudgetStats(
+            tokens=self.tokens,
+            successes=self.successes,
+            retries=self.retries,
+            rejected=self.rejected,
+        )
@@ -0,0 +1,25 @@
+from functools import cache
+from typing import Any
+
+from pydantic import BaseModel, TypeAdapter
+
+
+@cache
+def list_adapter[ModelT: BaseModel](model: type[ModelT]) -> TypeAdapter[list[ModelT]]:
+    """
+    Process-wide `TypeAdapter(list[model])`.
+
+    Building an adapter compiles a validator, so it is done once per model; validating a whole
+    list in one call avoids the per-item `Model(**item)` call and kwargs unpacking.
+    """
+    return TypeAdapter(list[model])  # pyright: ignore[reportInvalidTypeForm]
+
+
+def parse_list[ModelT: BaseModel](model: type[ModelT], items: list[Any]) -> list[ModelT]:
+    """Validate already decoded JSON items (the API layer decodes responses once)."""
+    return list_adapter(model).validate_python(items)
+
+
+def parse_list_json[ModelT: BaseModel](model: type[ModelT], data: str | bytes) -> list[ModelT]:
+    """Validate a raw JSON array straight from text/bytes, skipping `json.loads`."""
+    return list_adapter(model).validate_json(data)
@@ -0,0 +1,91 @@
+from typing import Any
+
+from pydantic import BaseModel, TypeAdapter
+
+_MISSING: Any = object()
+
+# (model class, attribute name) -> (raw key, adapter, default); None for unknown attributes.
+_FieldSpec = tuple[str, TypeAdapter[Any], Any]
+_field_specs: dict[tuple[type[BaseModel], str], _FieldSpec | None] = {}
+
+
+def _field_spec(model_cls: type[BaseModel], name: str) -> _FieldSpec | None:
+    key = (model_cls, name)
+    try:
+        return _field_specs[key]
+    except KeyError:
+        pass
+
+    info = model_cls.model_fields.get(name)
+    spec: _FieldSpec | None = None
+    if info is not None:
+        spec = (
+            info.alias or name,
+            TypeAdapter(Any if info.annotation is None else info.annotation),
+            info.get_default(call_default_factory=True),
+        )
+    _field_specs[key] = spec
+    return spec
+
+
+class LazyModel[ModelT: BaseModel]:
+    """
+    Thin wrapper over a raw API dict that validates fields on first access.
+
+    Attribute access mirrors the wrapped model (`item.id`, `item.title`, ...); each field is
+    validated with the same type as in the model once and then cached. `validate()` builds the
+    full Pydantic model when it is really needed.
+    """
+
+    __slots__ = ("_model", "_model_cls", "_raw", "_values")
+
+    def __init__(self, model_cls: type[ModelT], raw: dict[str, Any]) -> None:
+        self._model_cls = model_cls
+        self._raw = raw
+        self._values: dict[str, Any] | None = None
+        self._model: ModelT | None = None
+
+    @property
+    def raw(self) -> dict[str, Any]:
+        return self._raw
+
+    @property
+    def model_class(self) -> type[ModelT]:
+        return self._model_cls
+
+    def validate(self) -> ModelT:
+        """Validate the whole payload into the model (cached)."""
+        if self._model is None:
+            self._model = self._model_cls.model_validate(self._raw)
+        return self._model
+
+    def model_dump(self, **kwargs: Any) -> dict[str, Any]:
+        return self.validate().model_dump(**kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for names that are not slots/properties, i.e. model fields. Private and
+        # dunder names are never fields: copy/pickle probe them on instances whose slots are
+        # not set yet, where reading `self._model` would recurse.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if self._model is not None:
+            return getattr(self._model, name)
+
+        values = self._values
+        if values is None:
+            values = self._values = {}
+        elif name in values:
+            return values[name]
+
+        spec = _field_spec(self._model_cls, name)
+        if spec is None:
+            raise AttributeError(f"{self._model_cls.__name__!r} has no field {name!r}")
+
+        raw_key, adapter, default = spec
+        raw_value = self._raw.get(raw_key, _MISSING)
+        value = default if raw_value is _MISSING else adapter.validate_python(raw_value)
+        values[name] = value
+        return value
+
+    def __repr__(self) -> str:
+        return f"LazyModel[{self._model_cls.__name__}]({self._raw!r})"
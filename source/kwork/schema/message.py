@@ -37,6 +37,7 @@ class Message:
         inbox_id: int | None = None,
         last_message: dict[str, Any] | None = None,
         title: str | None = None,
+        account: str | None = None,
     ) -> None:
         self.api = api
         self.from_id = from_id
@@ -45,6 +46,8 @@ class Message:
         self.inbox_id = inbox_id
         self.title = title
         self.last_message = last_message
+        # Identity of the bot account that received the event (see `KworkMultiBot`).
+        self.account = account
 
     async def answer_simulation(self, text: str) -> None:
         await asyncio.sleep(2)
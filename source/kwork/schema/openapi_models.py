@@ -0,0 +1,1441 @@
+# This file is auto-generated. Do not edit by hand.
+# Regenerate with: python3 scripts/generate_openapi_mixin.py
+"""Typed response models for `components.schemas` of docs/openapi.json."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from pydantic import ConfigDict, Field
+from pydantic.dataclasses import dataclass, rebuild_dataclass
+
+_CONFIG = ConfigDict(extra="ignore")
+
+
+@dataclass(slots=True, config=_CONFIG)
+class Achievement:
+    """Бейдж пользователя"""
+
+    id: int | None = None
+    name: str | None = None
+    description: str | None = None
+    image_url: str | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class ArbitrationReason:
+    """Опция в заказе"""
+
+    id: int | None = None
+    name: str | None = None
+    price: int | None = None
+    currency: str | None = None
+    time: int | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class Attribute:
+    """Классификация/Атрибут"""
+
+    id: int | None = None
+    title: str | None = None
+    lang: str | None = None
+    h1: str | None = None
+    hint_payer: str | None = None
+    hint_worker: str | None = None
+    hint_volume: str | None = None
+    note_worker: str | None = None
+    category_id: int | None = None
+    visible: int | None = None
+    is_classification: bool | None = None
+    required: bool | None = None
+    allow_multiple: bool | None = None
+    multiple_max_count: int | None = None
+    allow_custom: bool | None = None
+    portfolio: bool | None = None
+    parent_portfolio: bool | None = None
+    is_custom: bool | None = None
+    custom_max_count: bool | None = None
+    demo_file_upload: bool | None = None
+    custom_moderation_status: str | None = None
+    order_index: int | None = None
+    is_free_price: bool | None = None
+    unembedded: bool | None = None
+    percent_usage: str | None = None
+    portfolio_type: str | None = None
+    orders_inprogress_limit: int | None = None
+    orders_inprogress_pause_off: int | None = None
+    depth: int | None = None
+    is_custom_extra_denied: bool | None = None
+    is_subscribe_price: bool | None = None
+    is_kwork_links_sites: int | None = None
+    meta_title: str | None = None
+    meta_description: str | None = None
+    parent_id: int | None = None
+    volume_type_id: int | None = None
+    base_volume: int | None = None
+    min_volume: int | None = None
+    max_volume: int | None = None
+    min_volume_type_id: int | None = None
+    max_volume_type_id: int | None = None
+    custom_descendant_count: int | None = None
+    kworks_count: int | None = None
+    alias: str | None = None
+    duplicated_attribute_id: int | None = None
+    is_duplicated_children_only: bool | None = None
+    twin_id: int | None = None
+    is_smm_hide: bool | None = None
+    children: list[Attribute] | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class BalanceDeficit:
+    """Нехватка денежных средств при оплате заказа"""
+
+    success: bool | None = None
+    error: str | None = None
+    error_code: int | None = None
+    response: dict[str, Any] | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class BudgetWithCount:
+    """Диапазоны цен в фильтре проектов"""
+
+    name: str | None = None
+    boundaries: dict[str, Any] | None = None
+    count: int | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class CancelReason:
+    """Причина отмены заказа"""
+
+    id: str | None = None
+    title: str | None = None
+    commentRequired: bool | None = None
+    hide_worker_kwork_by_default: bool | None = None
+    is_arbitrage_popup_available: bool | None = None
+    subtypes: list[dict[str, Any]] | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class CatalogOtherServiceBlock:
+    """catalogOtherServiceBlock"""
+
+    category_id: int | None = None
+    classifier_id: int | None = None
+    name: str | None = None
+    order: int | None = None
+    cover_url: str | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class CatalogServiceBlock:
+    """catalogServiceBlock"""
+
+    id: int | None = None
+    name: str | None = None
+    rubric_description: str | None = None
+    icon_path: str | None = None
+    order: int | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class Category:
+    """Категория"""
+
+    id: int | None = None
+    name: str | None = None
+    description: str | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class CategoryLevel1:
+    """Категория верхнего уровня"""
+
+    id: int | None = None
+    name: str | None = None
+    description: str | None = None
+    subcategories: list[CategoryLevel2] | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class CategoryLevel2:
+    """Категория второго уровня"""
+
+    id: int | None = None
+    name: str | None = None
+    description: str | None = None
+    subcategories: list[CategoryLevel3] | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class CategoryLevel3:
+    """Категория третьего уровня"""
+
+    id: int | None = None
+    name: str | None = None
+    description: str | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class ComplainCategory:
+    """Категория жалобы"""
+
+    id: int | None = None
+    title: str | None = None
+    commentRequired: bool | None = None
+    isFileUploaderNotAuth: bool | None = None
+    hasNotification: bool | None = None
+    subCategories: list[ComplainCategory] | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class Connects:
+    """Объект с коннектами"""
+
+    all_connects: int | None = None
+    active_connects: int | None = None
+    update_time: int | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class DialogLastMessage:
+    """DialogLastMessage"""
+
+    unread: bool | None = None
+    fromUsername: str | None = None
+    fromUserId: int | None = None
+    type_: str | None = Field(default=None, alias="type")
+    time: int | None = None
+    message: str | None = None
+    profilePicture: str | None = None
+    originText: str | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class DialogMessage:
+    """DialogMessage"""
+
+    unread: int | None = None
+    unread_count: int | None = None
+    last_message: str | None = None
+    time: int | None = None
+    user_id: int | None = None
+    username: str | None = None
+    profilepicture: str | None = None
+    is_online: bool | None = None
+    lastOnlineTime: int | None = None
+    link: str | None = None
+    status: str | None = None
+    blocked_by_user: bool | None = None
+    allowedDialog: bool | None = None
+    lastMessage: DialogLastMessage | None = None
+    has_active_order: bool | None = None
+    archived: bool | None = None
+    isStarred: bool | None = None
+    warning_message_id: int | None = None
+    countup: int | None = None
+    warning_message_time: int | None = None
+    has_answer: bool | None = None
+    is_allow_custom_request: bool | None = None
+    hidden_at: int | None = None
+    disallowReason: int | None = None
+    is_important: bool | None = None
+    is_spam: bool | None = None
+    active_orders: list[TrackOrder] | None = None
+    draft: str | None = None
+    not_available_for_company: bool | None = None
+    draft_details: InboxAndTrackDraft | None = None
+    note: dict[str, Any] | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class DialogTrackLastMessage:
+    """DialogTrackLastMessage"""
+
+    unread: bool | None = None
+    fromUsername: str | None = None
+    fromUserId: int | None = None
+    type_: str | None = Field(default=None, alias="type")
+    time: int | None = None
+    message: str | None = None
+    profilePicture: str | None = None
+    originText: str | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class Error:
+    """Ошибка"""
+
+    success: bool | None = None
+    error: str | None = None
+    error_code: int | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class ExchangeInfo:
+    """Ключевая информации по бирже"""
+
+    exchange_response_count: int | None = None
+    archived_count: int | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class FavoriteKworks:
+    """Избранный кворк"""
+
+    id: int | None = None
+    category_id: int | None = None
+    category_name: str | None = None
+    classification_id: int | None = None
+    status_id: int | None = None
+    status_name: str | None = None
+    title: str | None = None
+    image_url: str | None = None
+    price: int | None = None
+    is_price_from: bool | None = None
+    is_best: bool | None = None
+    is_hidden: bool | None = None
+    is_favorite: bool | None = None
+    is_viewed: bool | None = None
+    isSubscription: bool | None = None
+    lang: str | None = None
+    order: int | None = None
+    worker: UserWorker | None = None
+    edits_list: list[str] | None = None
+    activity: dict[str, Any] | None = None
+    badges: KworkBadges | None = None
+    isBlackFriday: bool | None = None
+    blackFridayPrice: int | None = None
+    discountPercentage: int | None = None
+    not_available_for_company: bool | None = None
+    classifier_id: int | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class FavouriteCategory:
+    """Любимая рубрика пользователя"""
+
+    id: int | None = None
+    name: str | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class File:
+    """Файл"""
+
+    id: int | None = None
+    name: str | None = None
+    path: str | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class FileWithMiniature:
+    """Файл с миниатюрой"""
+
+    id: int | None = None
+    name: str | None = None
+    path: str | None = None
+    size: int | None = None
+    timestamp: int | None = None
+    status: str | None = None
+    file_url: str | None = None
+    miniature_url: str | None = None
+    miniature_path: str | None = None
+    duration_in_ms: int | None = None
+    is_voice_message: bool | None = None
+    is_heard: bool | None = None
+    convert_status: str | None = None
+    imageData: dict[str, Any] | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class FileWithSize:
+    """Файл с размером"""
+
+    id: int | None = None
+    name: str | None = None
+    path: str | None = None
+    size: int | None = None
+    timestamp: int | None = None
+    status: str | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class FirstLevelCategory:
+    """firstLevelCategory"""
+
+    id: int | None = None
+    name: str | None = None
+    rubric_description: str | None = None
+    ico: str | None = None
+    ico_extra: str | None = None
+    order: int | None = None
+    category_image: str | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class GetMessage:
+    """getMessage"""
+
+    message_id: int | None = None
+    to_id: int | None = None
+    to_username: str | None = None
+    to_live_date: int | None = None
+    from_id: int | None = None
+    from_username: str | None = None
+    from_live_date: int | None = None
+    from_profilepicture: str | None = None
+    to_profilepicture: str | None = None
+    message: str | None = None
+    time: int | None = None
+    unread: bool | None = None
+    type_: str | None = Field(default=None, alias="type")
+    status: str | None = None
+    created_order_id: int | None = None
+    forwarded: bool | None = None
+    updated_at: int | None = None
+    warning_type: str | None = None
+    countup: int | None = None
+    files: list[FileWithMiniature] | None = None
+    quote: dict[str, Any] | None = None
+    message_page: int | None = None
+    custom_request: dict[str, Any] | None = None
+    inbox_order: InboxOrder | None = None
+    transcription_status: int | None = None
+    page: int | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class GetMessageWithTrack:
+    """getMessageWithTrack"""
+
+    conversation_id: int | None = None
+    message_id: int | None = None
+    entity_type: int | None = None
+    to_id: int | None = None
+    to_username: str | None = None
+    to_live_date: int | None = None
+    from_id: int | None = None
+    from_username: str | None = None
+    from_live_date: int | None = None
+    from_profilepicture: str | None = None
+    to_profilepicture: str | None = None
+    forwarder_from_id: int | None = None
+    forwarded_from_username: str | None = None
+    message: str | None = None
+    time: int | None = None
+    unread: bool | None = None
+    type_: str | None = Field(default=None, alias="type")
+    status: str | None = None
+    created_order_id: int | None = None
+    forwarded: bool | None = None
+    updated_at: int | None = None
+    warning_type: str | None = None
+    countup: int | None = None
+    files: list[FileWithMiniature] | None = None
+    quote: dict[str, Any] | None = None
+    message_page: int | None = None
+    custom_request: dict[str, Any] | None = None
+    inbox_order: InboxOrder | None = None
+    message_key: str | None = None
+    track_type: int | None = None
+    track_order: TrackOrder | None = None
+    transcription_status: int | None = None
+    page: int | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class InboxAndTrackDraft:
+    """Черновики сообщений и треков"""
+
+    message: str | None = None
+    files: list[dict[str, Any]] | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class InboxMessage:
+    """Сообщение в переписке"""
+
+    message_id: int | None = None
+    to_id: int | None = None
+    to_username: str | None = None
+    to_live_date: int | None = None
+    from_id: int | None = None
+    from_username: str | None = None
+    from_live_date: int | None = None
+    from_profilepicture: str | None = None
+    to_profilepicture: str | None = None
+    message: str | None = None
+    time: int | None = None
+    unread: bool | None = None
+    type_: str | None = Field(default=None, alias="type")
+    status: str | None = None
+    created_order_id: int | None = None
+    forwarded: bool | None = None
+    updated_at: int | None = None
+    warning_type: str | None = None
+    countup: int | None = None
+    files: list[FileWithMiniature] | None = None
+    quote: dict[str, Any] | None = None
+    message_page: int | None = None
+    custom_request: dict[str, Any] | None = None
+    inbox_order: InboxOrder | None = None
+    transcription_status: int | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class InboxOrder:
+    """Предложение на индивидуальный кворк"""
+
+    order_id: int | None = None
+    status: str | None = None
+    budget: float | None = None
+    duration: int | None = None
+    kwork: dict[str, Any] | None = None
+    order: dict[str, Any] | None = None
+    not_available_for_company: bool | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class InboxTrackMessage:
+    """Сообщение в переписке"""
+
+    conversation_id: int | None = None
+    message_id: int | None = None
+    entity_type: int | None = None
+    to_id: int | None = None
+    to_username: str | None = None
+    to_live_date: int | None = None
+    from_id: int | None = None
+    from_username: str | None = None
+    from_live_date: int | None = None
+    from_profilepicture: str | None = None
+    to_profilepicture: str | None = None
+    forwarder_from_id: int | None = None
+    forwarded_from_username: str | None = None
+    message: str | None = None
+    time: int | None = None
+    unread: bool | None = None
+    type_: str | None = Field(default=None, alias="type")
+    status: str | None = None
+    created_order_id: int | None = None
+    forwarded: bool | None = None
+    updated_at: int | None = None
+    warning_type: str | None = None
+    countup: int | None = None
+    files: list[FileWithMiniature] | None = None
+    quote: dict[str, Any] | None = None
+    message_page: int | None = None
+    custom_request: dict[str, Any] | None = None
+    inbox_order: InboxOrder | None = None
+    message_key: str | None = None
+    track_type: int | None = None
+    track_order: TrackOrder | None = None
+    transcription_status: int | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class IndividualEnterpreneur:
+    """Индивидуальынй предприниматель"""
+
+    ip: dict[str, Any] | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class Interlocutor:
+    """Данные о собеседнике"""
+
+    user_id: int | None = None
+    username: str | None = None
+    last_online_timestamp: int | None = None
+    avatar_image_path: str | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class KworkFile:
+    """Файл кворка с типом"""
+
+    id: int | None = None
+    name: str | None = None
+    path: str | None = None
+    size: int | None = None
+    timestamp: int | None = None
+    status: str | None = None
+    type_: str | None = Field(default=None, alias="type")
+
+
+@dataclass(slots=True, config=_CONFIG)
+class KworkInList:
+    """Кворк"""
+
+    id: int | None = None
+    category_id: int | None = None
+    classifier_id: int | None = None
+    title: str | None = None
+    image_url: str | None = None
+    price: int | None = None
+    is_price_from: bool | None = None
+    is_best: bool | None = None
+    is_hidden: bool | None = None
+    is_favorite: bool | None = None
+    is_viewed: bool | None = None
+    isSubscription: bool | None = None
+    lang: str | None = None
+    worker: UserWorker | None = None
+    badges: KworkBadges | None = None
+    not_available_for_company: bool | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class KworkInListWithWorkerLevel:
+    """kworkInListWithWorkerLevel"""
+
+    id: int | None = None
+    category_id: int | None = None
+    classifier_id: int | None = None
+    title: str | None = None
+    image_url: str | None = None
+    price: int | None = None
+    is_price_from: bool | None = None
+    is_best: bool | None = None
+    is_hidden: bool | None = None
+    is_favorite: bool | None = None
+    is_viewed: bool | None = None
+    isSubscription: bool | None = None
+    lang: str | None = None
+    worker: Any = None
+    badges: KworkBadges | None = None
+    not_available_for_company: bool | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class KworkLinkSiteItem:
+    """Площадка размещения ссылок кворка, либо продаваемый сайт или домен"""
+
+    name: str | None = None
+    sqi: str | None = None
+    moz_domain_authority: str | None = None
+    moz_spam_score: str | None = None
+    majestic_citation_flow: str | None = None
+    trust: str | None = None
+    spam: str | None = None
+    language: str | None = None
+    traffic: str | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class KworkNotification:
+    """Уведомление по кворку"""
+
+    id: int | None = None
+    added: int | None = None
+    entity_id: int | None = None
+    link: str | None = None
+    kworkTitle: str | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class KworkPackage:
+    """Пакет кворка"""
+
+    id: int | None = None
+    name: str | None = None
+    package_description: str | None = None
+    price: int | None = None
+    term: str | None = None
+    min: int | None = None
+    max: int | None = None
+    options: list[dict[str, Any]] | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class KworksWithCount:
+    """Диапазоны количества кворков в фильтре проектов"""
+
+    name: str | None = None
+    boundaries: dict[str, Any] | None = None
+    count: int | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class LegalEntity:
+    """ООО"""
+
+    ooo: dict[str, Any] | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class MultiError:
+    """Ошибка"""
+
+    success: bool | None = None
+    error: str | None = None
+    error_code: int | None = None
+    errors: list[dict[str, Any]] | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class NotificationType:
+    """Тип уведомления"""
+
+    name: str | None = None
+    description: str | None = None
+    is_red: bool | None = None
+    priority: int | None = None
+    entity_type: str | None = None
+    notifications: list[Notification] | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class Offer:
+    """Предложение на запрос услуги на бирже"""
+
+    id: int | None = None
+    status: str | None = None
+    title: str | None = None
+    comment: str | None = None
+    price: int | None = None
+    duration: int | None = None
+    date_create: int | None = None
+    is_actual: bool | None = None
+    is_read: bool | None = None
+    want_id: int | None = None
+    order_id: int | None = None
+    kwork_id: int | None = None
+    project: WantWorker | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class OrderDetails:
+    """Детальные данные по заказу"""
+
+    details: dict[str, Any] | None = None
+    stages: list[dict[str, Any]] | None = None
+    key_tracks: list[dict[str, Any]] | None = None
+    attention_tracks: list[dict[str, Any]] | None = None
+    volume: list[dict[str, Any]] | None = None
+    draft: str | None = None
+    draft_details: InboxAndTrackDraft | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class OrderHeader:
+    """order_header"""
+
+    order: dict[str, Any] | None = None
+    kwork: dict[str, Any] | None = None
+    worker: dict[str, Any] | None = None
+    payer: dict[str, Any] | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class OrderNotification:
+    """Уведомление по заказу"""
+
+    id: int | None = None
+    added: int | None = None
+    entity_id: int | None = None
+    link: str | None = None
+    otherUserId: int | None = None
+    otherUserName: str | None = None
+    otherUserAvatar: str | None = None
+    isOtherUserOnline: bool | None = None
+    orderId: int | None = None
+    orderTitle: str | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class OrderOption:
+    """Опция в заказе"""
+
+    id: int | None = None
+    name: str | None = None
+    payer_price: float | None = None
+    worker_price: float | None = None
+    is_additional_kwork_extra: bool | None = None
+    currency: str | None = None
+    time: int | None = None
+    is_extra_volume: bool | None = None
+    volume: list[dict[str, Any]] | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class OrderProvidedData:
+    """Информация предоставленная по заказу"""
+
+    message: str | None = None
+    files: list[dict[str, Any]] | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class OrderedExtra:
+    """Заказанная опция"""
+
+    id: int | None = None
+    title: str | None = None
+    count: int | None = None
+    payer_price: float | None = None
+    worker_price: float | None = None
+    totaldays: int | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class Package:
+    """Пакет"""
+
+    description: str | None = None
+    price: float | None = None
+    duration: int | None = None
+    type_: str | None = Field(default=None, alias="type")
+    items: list[PackageItem] | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class PackageItem:
+    """Пакетная опция"""
+
+    id: int | None = None
+    name: str | None = None
+    value: str | None = None
+    type_: str | None = Field(default=None, alias="type")
+    name_1: str | None = None
+    name_2: str | None = None
+    name_5: str | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class Paging:
+    """Данные пагинации"""
+
+    page: int | None = None
+    total: int | None = None
+    limit: int | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class PagingWithPages:
+    """Данные пагинации с лимитом"""
+
+    page: int | None = None
+    total: int | None = None
+    limit: int | None = None
+    pages: int | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class PaymentType:
+    """Способ пополнения"""
+
+    type_: str | None = Field(default=None, alias="type")
+    name: str | None = None
+    country_group_code: str | None = None
+    country_groups: list[dict[str, Any]] | None = None
+    amount_limits: dict[str, Any] | None = None
+    consent_url: str | None = None
+    lock_refill_sum: bool | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class PopularBlock:
+    """popularBlock"""
+
+    name: str | None = None
+    block_description: str | None = None
+    categories: list[PopularBlockCategories] | None = None
+    id: int | None = None
+    order: int | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class PopularBlockCategories:
+    """popularBlockCategories"""
+
+    category_id: int | None = None
+    classifier_id: int | None = None
+    name: str | None = None
+    order: int | None = None
+    cover_url: str | None = None
+    kworks_count: int | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class Portfolio:
+    """Портфолио"""
+
+    id: int | None = None
+    title: str | None = None
+    order_id: int | None = None
+    category_id: int | None = None
+    category_name: str | None = None
+    type_: str | None = Field(default=None, alias="type")
+    photo: str | None = None
+    video: str | None = None
+    views: int | None = None
+    views_dirty: int | None = None
+    comments_count: int | None = None
+    images: list[dict[str, Any]] | None = None
+    videos: list[dict[str, Any]] | None = None
+    audios: list[dict[str, Any]] | None = None
+    pdf: list[dict[str, Any]] | None = None
+    pined_at_timestamp: int | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class ProfileBadges:
+    """Бейдж пользователя"""
+
+    id: int | None = None
+    name: str | None = None
+    description: str | None = None
+    image_url: str | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class ProfileKwork:
+    """Кворк пользователя"""
+
+    id: int | None = None
+    category_id: int | None = None
+    category_name: str | None = None
+    classification_id: int | None = None
+    status_id: int | None = None
+    status_name: str | None = None
+    title: str | None = None
+    image_url: str | None = None
+    price: int | None = None
+    is_price_from: bool | None = None
+    is_best: bool | None = None
+    is_hidden: bool | None = None
+    is_favorite: bool | None = None
+    is_viewed: bool | None = None
+    isSubscription: bool | None = None
+    lang: str | None = None
+    order: int | None = None
+    worker: UserWorker | None = None
+    edits_list: list[str] | None = None
+    activity: dict[str, Any] | None = None
+    badges: KworkBadges | None = None
+    isBlackFriday: bool | None = None
+    blackFridayPrice: int | None = None
+    discountPercentage: int | None = None
+    not_available_for_company: bool | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class ProfileKworkWithWorkerLevel:
+    """profileKworkWithWorkerLevel"""
+
+    id: int | None = None
+    category_id: int | None = None
+    category_name: str | None = None
+    classification_id: int | None = None
+    status_id: int | None = None
+    status_name: str | None = None
+    title: str | None = None
+    image_url: str | None = None
+    price: int | None = None
+    is_price_from: bool | None = None
+    is_best: bool | None = None
+    is_hidden: bool | None = None
+    is_favorite: bool | None = None
+    is_viewed: bool | None = None
+    isSubscription: bool | None = None
+    lang: str | None = None
+    order: int | None = None
+    worker: Any = None
+    edits_list: list[str] | None = None
+    activity: dict[str, Any] | None = None
+    badges: KworkBadges | None = None
+    isBlackFriday: bool | None = None
+    blackFridayPrice: int | None = None
+    discountPercentage: int | None = None
+    not_available_for_company: bool | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class PushEvent:
+    """Непрочитанное push-событие пользователя"""
+
+    id: int | None = None
+    entity_id: int | None = None
+    user_id: int | None = None
+    data: dict[str, Any] | None = None
+    created_at: str | None = None
+    event: str | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class Resize:
+    """Данные ресайза изображения"""
+
+    x: float | None = None
+    y: float | None = None
+    w: float | None = None
+    h: float | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class SecondLevelCategory:
+    """secondLevelCategory"""
+
+    id: int | None = None
+    name: str | None = None
+    rubric_description: str | None = None
+    order: int | None = None
+    kworks_count: int | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class ShortUserInfo:
+    """short_user_info"""
+
+    id: int | None = None
+    username: str | None = None
+    description: str | None = None
+    profilepicture: str | None = None
+    rating: float | None = None
+    rating_count: int | None = None
+    reviews_count: int | None = None
+    good_reviews: int | None = None
+    bad_reviews: int | None = None
+    is_online: bool | None = None
+    level: str | None = None
+    location: str | None = None
+    order_done_count: int | None = None
+    answer_time: str | None = None
+    registration_time: int | None = None
+    achievments_list: list[ProfileBadges] | None = None
+    is_cashless_payment_available: bool | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class SimpleNotification:
+    """Уведомление без дополнительных полей"""
+
+    id: int | None = None
+    added: int | None = None
+    entity_id: int | None = None
+    link: str | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class StageNotification:
+    """Уведомление по этапу заказа"""
+
+    id: int | None = None
+    added: int | None = None
+    entity_id: int | None = None
+    link: str | None = None
+    otherUserId: int | None = None
+    otherUserName: str | None = None
+    otherUserAvatar: str | None = None
+    isOtherUserOnline: bool | None = None
+    orderId: int | None = None
+    orderTitle: str | None = None
+    stageTitle: str | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class Track:
+    """Сообщение трека"""
+
+    id: int | None = None
+    sent_timestamp: int | None = None
+    text: str | None = None
+    from_id: int | None = None
+    from_name: str | None = None
+    files: list[dict[str, Any]] | None = None
+    conversation_id: int | None = None
+    is_unread: bool | None = None
+    updated_at: int | None = None
+    quote: TrackQuote | None = None
+    type_: int | None = Field(default=None, alias="type")
+    status: str | None = None
+    inbox_id: int | None = None
+    title: str | None = None
+    message_key: str | None = None
+    actions: list[dict[str, Any]] | None = None
+    auto_cancel_deadline: int | None = None
+    auto_completion_time: int | None = None
+    extras: list[dict[str, Any]] | None = None
+    stages: list[dict[str, Any]] | None = None
+    misc_track_params: dict[str, Any] | None = None
+    transcription_status: int | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class TrackFile:
+    """Файл трека"""
+
+    id: int | None = None
+    name: int | None = None
+    file_url: str | None = None
+    miniature_url: str | None = None
+    size_in_bytes: int | None = None
+    path: str | None = None
+    status: bool | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class TrackFileIsMetrics:
+    """Файл трека"""
+
+    id: int | None = None
+    name: int | None = None
+    file_url: str | None = None
+    miniature_url: str | None = None
+    size_in_bytes: int | None = None
+    path: str | None = None
+    status: bool | None = None
+    isMetrics: bool | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class TrackOrder:
+    """Данные о заказе"""
+
+    id: int | None = None
+    title: str | None = None
+    color: int | None = None
+    worker_id: int | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class TrackQuote:
+    """Цитируемое сообщение трека"""
+
+    id: int | None = None
+    text: str | None = None
+    from_id: int | None = None
+    conversation_id: int | None = None
+    files: list[TrackFile] | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class User:
+    """Публичные данные пользователя"""
+
+    id: int | None = None
+    username: str | None = None
+    profilepicture: str | None = None
+    description: str | None = None
+    slogan: str | None = None
+    fullname: str | None = None
+    level_description: str | None = None
+    cover: str | None = None
+    good_reviews: int | None = None
+    bad_reviews: int | None = None
+    reviews_count: int | None = None
+    location: str | None = None
+    rating: str | None = None
+    rating_count: int | None = None
+    online: bool | None = None
+    live_date: int | None = None
+    custom_request_min_budget: float | None = None
+    is_allow_custom_request: bool | None = None
+    order_done_persent: int | None = None
+    order_done_intime_persent: int | None = None
+    order_done_repeat_persent: int | None = None
+    timezoneId: int | None = None
+    blocked_by_user: bool | None = None
+    allowedDialog: bool | None = None
+    addtime: int | None = None
+    achievments_list: ProfileBadges | None = None
+    completed_orders_count: int | None = None
+    profession: str | None = None
+    kworks_count: int | None = None
+    kworks: ProfileKworks | None = None
+    portfolio_list: ProfilePortfolios | None = None
+    reviews: list[UserReview] | None = None
+    skills: list[dict[str, Any]] | None = None
+    is_verified_worker: bool | None = None
+    note: dict[str, Any] | None = None
+    is_cashless_payment_available: bool | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class UserAnswer:
+    """Ответ продавца на отзыв"""
+
+    id: int | None = None
+    text: str | None = None
+    user_id: int | None = None
+    time_added: int | None = None
+    username: str | None = None
+    profilepicture: str | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class UserNotification:
+    """Уведомление о действиях другого пользователя"""
+
+    id: int | None = None
+    added: int | None = None
+    entity_id: int | None = None
+    link: str | None = None
+    otherUserId: int | None = None
+    otherUserName: str | None = None
+    otherUserAvatar: str | None = None
+    isOtherUserOnline: bool | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class UserReview:
+    """Отзыв о пользователе"""
+
+    id: int | None = None
+    time_added: int | None = None
+    text: str | None = None
+    auto_mode: str | None = None
+    good: bool | None = None
+    bad: bool | None = None
+    kwork: dict[str, Any] | None = None
+    writer: UserReviewWriter | None = None
+    answer: UserAnswer | None = None
+    portfolio: Portfolio | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class UserReviewWriter:
+    """Краткие данные автора отзыва"""
+
+    id: int | None = None
+    username: str | None = None
+    profilepicture: str | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class UserWorker:
+    """Данные продавца"""
+
+    id: int | None = None
+    username: str | None = None
+    fullname: str | None = None
+    profilepicture: str | None = None
+    rating: float | None = None
+    reviews_count: int | None = None
+    rating_count: int | None = None
+    is_online: bool | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class Versions:
+    """Текущие версии мобильных приложений"""
+
+    current_version_ios: str | None = None
+    current_version_android: str | None = None
+    critical_update: bool | None = None
+    facebook: bool | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class VolumeType:
+    """Тип числового объема"""
+
+    id: int | None = None
+    name: str | None = None
+    name_short: str | None = None
+    name_plural_2_4: str | None = None
+    name_plural_11_19: str | None = None
+    name_accusative: str | None = None
+    volume_type_group_id: str | None = None
+    contains_value: str | None = None
+    contains_id: str | None = None
+    group_order: str | None = None
+    lang: str | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class WantPayer:
+    """Проекты для покупателя"""
+
+    id: int | None = None
+    title: str | None = None
+    description: str | None = None
+    status: str | None = None
+    want_status_id: int | None = None
+    date_create: int | None = None
+    date_active: int | None = None
+    date_expire: int | None = None
+    date_reject: int | None = None
+    price_limit: int | None = None
+    views: int | None = None
+    orders: int | None = None
+    offers: int | None = None
+    views_history: dict[str, Any] | None = None
+    category_base_price: int | None = None
+    allow_higher_price: bool | None = None
+    possible_price_limit: int | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class WantWorker:
+    """Поля запроса(проекта) для продавца"""
+
+    id: int | None = None
+    status: str | None = None
+    user_id: int | None = None
+    username: str | None = None
+    profile_picture: str | None = None
+    price: int | None = None
+    title: str | None = None
+    description: str | None = None
+    offers: int | None = None
+    time_left: int | None = None
+    parent_category_id: int | None = None
+    category_id: int | None = None
+    date_confirm: int | None = None
+    category_base_price: int | None = None
+    user_projects_count: int | None = None
+    user_hired_percent: int | None = None
+    user_active_projects_count: int | None = None
+    achievements_list: Achievements | None = None
+    is_viewed: bool | None = None
+    already_work: int | None = None
+    allow_higher_price: bool | None = None
+    possible_price_limit: int | None = None
+    user_need_portfolio: int | None = None
+    user_need_portfolio_rubric_name: str | None = None
+    has_offer: bool | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class WantsFilter:
+    """Предустановленный фильтр"""
+
+    categories: list[FavouriteCategory] | None = None
+    price_from: int | None = Field(default=None, alias="price-from")
+    price_to: int | None = Field(default=None, alias="price-to")
+    hiring_to: int | None = Field(default=None, alias="hiring-to")
+    kworks_filter_from: int | None = Field(default=None, alias="kworks-filter-from")
+    kworks_filter_to: int | None = Field(default=None, alias="kworks-filter-to")
+
+
+@dataclass(slots=True, config=_CONFIG)
+class WantsList:
+    """Проекты для покупателя сгруппированные по альтернативному статусу"""
+
+    id: int | None = None
+    title: str | None = None
+    tootlip: str | None = None
+    order: int | None = None
+    projects_count: int | None = None
+    wants: list[WantPayer] | None = None
+
+
+@dataclass(slots=True, config=_CONFIG)
+class WithdrawType:
+    """Способ вывода средств"""
+
+    type_: str | None = Field(default=None, alias="type")
+    sum: float | None = None
+    last_digits: str | None = None
+    service_fee: float | None = None
+
+
+Achievements = list[Achievement]
+Attributes = list[Attribute]
+KworkBadges = list[dict[str, Any]]
+Notification = (
+    SimpleNotification
+    | KworkNotification
+    | UserNotification
+    | OrderNotification
+    | StageNotification
+)
+PositiveReviewsCount = dict[str, str]
+ProfileKworks = list[ProfileKwork]
+ProfileKworksWithWorkerLevel = list[ProfileKworkWithWorkerLevel]
+ProfilePortfolios = list[Portfolio]
+
+for _model in (
+    Achievement,
+    ArbitrationReason,
+    Attribute,
+    BalanceDeficit,
+    BudgetWithCount,
+    CancelReason,
+    CatalogOtherServiceBlock,
+    CatalogServiceBlock,
+    Category,
+    CategoryLevel1,
+    CategoryLevel2,
+    CategoryLevel3,
+    ComplainCategory,
+    Connects,
+    DialogLastMessage,
+    DialogMessage,
+    DialogTrackLastMessage,
+    Error,
+    ExchangeInfo,
+    FavoriteKworks,
+    FavouriteCategory,
+    File,
+    FileWithMiniature,
+    FileWithSize,
+    FirstLevelCategory,
+    GetMessage,
+    GetMessageWithTrack,
+    InboxAndTrackDraft,
+    InboxMessage,
+    InboxOrder,
+    InboxTrackMessage,
+    IndividualEnterpreneur,
+    Interlocutor,
+    KworkFile,
+    KworkInList,
+    KworkInListWithWorkerLevel,
+    KworkLinkSiteItem,
+    KworkNotification,
+    KworkPackage,
+    KworksWithCount,
+    LegalEntity,
+    MultiError,
+    NotificationType,
+    Offer,
+    OrderDetails,
+    OrderHeader,
+    OrderNotification,
+    OrderOption,
+    OrderProvidedData,
+    OrderedExtra,
+    Package,
+    PackageItem,
+    Paging,
+    PagingWithPages,
+    PaymentType,
+    PopularBlock,
+    PopularBlockCategories,
+    Portfolio,
+    ProfileBadges,
+    ProfileKwork,
+    ProfileKworkWithWorkerLevel,
+    PushEvent,
+    Resize,
+    SecondLevelCategory,
+    ShortUserInfo,
+    SimpleNotification,
+    StageNotification,
+    Track,
+    TrackFile,
+    TrackFileIsMetrics,
+    TrackOrder,
+    TrackQuote,
+    User,
+    UserAnswer,
+    UserNotification,
+    UserReview,
+    UserReviewWriter,
+    UserWorker,
+    Versions,
+    VolumeType,
+    WantPayer,
+    WantWorker,
+    WantsFilter,
+    WantsList,
+    WithdrawType,
+):
+    rebuild_dataclass(_model)  # pyright: ignore[reportArgumentType]
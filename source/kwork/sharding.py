@@ -0,0 +1,379 @@
+import asyncio
+import bisect
+import hashlib
+import logging
+import multiprocessing
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, field
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from typing import Any
+
+from kwork.exceptions import KworkShardWorkerFailed
+from kwork.multi_bot import KworkMultiBot
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# (runner) -> None; must be a picklable module-level function: it is executed in every worker
+# process to register handlers on that worker's `KworkMultiBot`.
+SetupFunc = Callable[[KworkMultiBot], None]
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """Consistent hash ring with virtual nodes."""
+
+    def __init__(self, nodes: Iterable[str] = (), *, replicas: int = 64) -> None:
+        if replicas < 1:
+            raise ValueError("replicas must be >= 1")
+        self._replicas = replicas
+        self._keys: list[int] = []
+        self._owners: dict[int, str] = {}
+        self._nodes: set[str] = set()
+        for node in nodes:
+            self.add(node)
+
+    @property
+    def nodes(self) -> frozenset[str]:
+        return frozenset(self._nodes)
+
+    def add(self, node: str) -> None:
+        if node in self._nodes:
+            return
+        self._nodes.add(node)
+        for i in range(self._replicas):
+            point = _hash(f"{node}#{i}")
+            self._owners[point] = node
+            bisect.insort(self._keys, point)
+
+    def remove(self, node: str) -> None:
+        if node not in self._nodes:
+            return
+        self._nodes.discard(node)
+        for i in range(self._replicas):
+            point = _hash(f"{node}#{i}")
+            if self._owners.get(point) == node:
+                del self._owners[point]
+                idx = bisect.bisect_left(self._keys, point)
+                del self._keys[idx]
+
+    def get(self, key: str) -> str:
+        if not self._keys:
+            raise LookupError("Hash ring is empty")
+        idx = bisect.bisect(self._keys, _hash(key)) % len(self._keys)
+        return self._owners[self._keys[idx]]
+
+
+@dataclass(frozen=True, slots=True)
+class AccountSpec:
+    """Credentials of one bot account, as sent to a worker process."""
+
+    login: str
+    password: str
+    proxy: str | None = None
+    phone_last: str | None = None
+    account: str | None = None
+
+    @property
+    def key(self) -> str:
+        return self.account if self.account is not None else self.login
+
+
+@dataclass(slots=True)
+class _Worker:
+    worker_id: str
+    accounts: tuple[AccountSpec, ...]
+    process: BaseProcess | None = None
+    conn: Connection | None = None
+    restarts: int = 0
+    # monotonic() of recent crashes (within `restart_window`) and of the pending restart.
+    crashes: deque[float] = field(default_factory=deque)
+    restart_at: float | None = None
+    metrics: dict[str, Any] = field(default_factory=dict)
+    metrics_at: float | None = None
+
+
+async def _worker_async(
+    accounts: tuple[AccountSpec, ...],
+    setup: SetupFunc,
+    conn: Connection,
+    metrics_interval: float,
+    bot_kwargs: dict[str, Any],
+    runner_kwargs: dict[str, Any],
+) -> None:
+    runner = KworkMultiBot(**runner_kwargs)
+    for spec in accounts:
+        runner.add_account(
+            spec.login,
+            spec.password,
+            spec.proxy,
+            spec.phone_last,
+            account=spec.account,
+            **bot_kwargs,
+        )
+    setup(runner)
+
+    async def _report() -> None:
+        while True:
+            conn.send({key: asdict(stats) for key, stats in runner.metrics().items()})
+            await asyncio.sleep(metrics_interval)
+
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(_report())
+        if accounts:
+            tg.create_task(runner.run())
+
+
+def _worker_main(
+    accounts: tuple[AccountSpec, ...],
+    setup: SetupFunc,
+    conn: Connection,
+    metrics_interval: float,
+    bot_kwargs: dict[str, Any],
+    runner_kwargs: dict[str, Any],
+) -> None:
+    asyncio.run(_worker_async(accounts, setup, conn, metrics_interval, bot_kwargs, runner_kwargs))
+
+
+class ShardSupervisor:
+    """
+    Spreads bot accounts across worker processes.
+
+    Accounts are assigned to workers via a consistent hash ring, so adding or removing a worker
+    only moves the accounts that hash to it. Each worker runs a `KworkMultiBot` for its accounts,
+    calls `setup(runner)` to register handlers and reports per-account counters back to the
+    supervisor over a `multiprocessing` pipe.
+
+    Crashed workers are restarted after `restart_delay`, doubled for every earlier crash within
+    `restart_window` (up to `max_restart_delay`). A worker that crashes more than `max_restarts`
+    times within the window makes `run()` raise `KworkShardWorkerFailed`.
+    """
+
+    def __init__(
+        self,
+        accounts: Iterable[AccountSpec],
+        setup: SetupFunc,
+        *,
+        workers: int = 2,
+        metrics_interval: float = 5.0,
+        poll_interval: float = 0.5,
+        restart_delay: float = 1.0,
+        max_restart_delay: float = 60.0,
+        max_restarts: int = 5,
+        restart_window: float = 300.0,
+        bot_kwargs: dict[str, Any] | None = None,
+        runner_kwargs: dict[str, Any] | None = None,
+        mp_context: str = "spawn",
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        if metrics_interval <= 0:
+            raise ValueError("metrics_interval must be > 0")
+        if poll_interval <= 0:
+            raise ValueError("poll_interval must be > 0")
+        if restart_delay < 0:
+            raise ValueError("restart_delay must be >= 0")
+        if max_restart_delay < restart_delay:
+            raise ValueError("max_restart_delay must be >= restart_delay")
+        if max_restarts < 0:
+            raise ValueError("max_restarts must be >= 0")
+        if restart_window <= 0:
+            raise ValueError("restart_window must be > 0")
+
+        self._accounts: dict[str, AccountSpec] = {}
+        for spec in accounts:
+            if spec.key in self._accounts:
+                raise ValueError(f"Duplicate account: {spec.key!r}")
+            self._accounts[spec.key] = spec
+
+        self._setup = setup
+        self._metrics_interval = metrics_interval
+        self._poll_interval = poll_interval
+        self._restart_delay = restart_delay
+        self._max_restart_delay = max_restart_delay
+        self._max_restarts = max_restarts
+        self._restart_window = restart_window
+        self._bot_kwargs = dict(bot_kwargs or {})
+        self._runner_kwargs = dict(runner_kwargs or {})
+        # Any: typeshed's BaseContext has no `Process`, and `Pipe` differs per platform.
+        self._ctx: Any = multiprocessing.get_context(mp_context)
+
+        self._next_worker_n = 0
+        self._ring = HashRing()
+        self._workers: dict[str, _Worker] = {}
+        for _ in range(workers):
+            self._ring.add(self._new_worker_id())
+        self._running = False
+        self._assign()
+
+    def _new_worker_id(self) -> str:
+        worker_id = f"worker-{self._next_worker_n}"
+        self._next_worker_n += 1
+        return worker_id
+
+    def assignments(self) -> dict[str, tuple[AccountSpec, ...]]:
+        out: dict[str, list[AccountSpec]] = {node: [] for node in sorted(self._ring.nodes)}
+        for key, spec in self._accounts.items():
+            out[self._ring.get(key)].append(spec)
+        return {node: tuple(specs) for node, specs in out.items()}
+
+    def metrics(self) -> dict[str, Any]:
+        """Aggregated counters: per-worker snapshots plus totals over all accounts."""
+        totals: dict[str, int] = {}
+        workers: dict[str, Any] = {}
+        for worker in self._workers.values():
+            workers[worker.worker_id] = {
+                "alive": worker.process is not None and worker.process.is_alive(),
+                "restarts": worker.restarts,
+                "accounts": dict(worker.metrics),
+                "reported_at": worker.metrics_at,
+            }
+            for stats in worker.metrics.values():
+                for name, value in stats.items():
+                    if isinstance(value, int):
+                        totals[name] = totals.get(name, 0) + value
+        return {"workers": workers, "totals": totals}
+
+    async def _spawn(self, worker: _Worker) -> None:
+        parent_conn, child_conn = self._ctx.Pipe(duplex=False)
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(
+                worker.accounts,
+                self._setup,
+                child_conn,
+                self._metrics_interval,
+                self._bot_kwargs,
+                self._runner_kwargs,
+            ),
+            name=f"kwork-{worker.worker_id}",
+            daemon=True,
+        )
+        # start() pickles the arguments and launches the interpreter: off the event loop.
+        await asyncio.to_thread(process.start)
+        child_conn.close()
+        worker.process = process
+        worker.conn = parent_conn
+        worker.restart_at = None
+        logger.info("Started %s with %s accounts", worker.worker_id, len(worker.accounts))
+
+    @staticmethod
+    def _stop_process(worker: _Worker) -> None:
+        # Blocking (join waits up to 5 s): called through asyncio.to_thread.
+        if worker.process is not None and worker.process.is_alive():
+            worker.process.terminate()
+            worker.process.join(timeout=5)
+        if worker.conn is not None:
+            worker.conn.close()
+
+    async def _stop_worker(self, worker: _Worker) -> None:
+        await asyncio.to_thread(self._stop_process, worker)
+        worker.process = None
+        worker.conn = None
+
+    def _assign(self) -> tuple[list[_Worker], list[_Worker], list[_Worker]]:
+        """Update worker records from the ring: (new, reassigned, removed) workers."""
+        new: list[_Worker] = []
+        reassigned: list[_Worker] = []
+        for worker_id, specs in self.assignments().items():
+            worker = self._workers.get(worker_id)
+            if worker is None:
+                worker = self._workers[worker_id] = _Worker(worker_id=worker_id, accounts=specs)
+                new.append(worker)
+            elif worker.accounts != specs:
+                worker.accounts = specs
+                worker.metrics = {}
+                reassigned.append(worker)
+        removed = [
+            self._workers.pop(worker_id)
+            for worker_id in list(self._workers)
+            if worker_id not in self._ring.nodes
+        ]
+        return new, reassigned, removed
+
+    async def _rebalance(self) -> None:
+        new, reassigned, removed = self._assign()
+        await asyncio.gather(*(self._stop_worker(w) for w in (*reassigned, *removed)))
+        if self._running:
+            await asyncio.gather(*(self._spawn(w) for w in (*new, *reassigned)))
+
+    async def add_worker(self) -> str:
+        """Add a worker process and move the accounts that now hash to it."""
+        worker_id = self._new_worker_id()
+        self._ring.add(worker_id)
+        await self._rebalance()
+        return worker_id
+
+    async def remove_worker(self, worker_id: str) -> None:
+        if worker_id not in self._ring.nodes:
+            raise KeyError(worker_id)
+        if len(self._ring.nodes) == 1:
+            raise ValueError("Cannot remove the last worker")
+        self._ring.remove(worker_id)
+        await self._rebalance()
+
+    def _drain_metrics(self, worker: _Worker) -> None:
+        conn = worker.conn
+        if conn is None:
+            return
+        try:
+            while conn.poll():
+                worker.metrics = conn.recv()
+                worker.metrics_at = time.time()
+        except (EOFError, OSError):
+            # Worker died; the liveness check restarts it.
+            pass
+
+    async def _on_exit(self, worker: _Worker, exitcode: int | None) -> None:
+        """Schedule the restart of a crashed worker, or raise if it keeps crashing."""
+        await self._stop_worker(worker)
+        now = time.monotonic()
+        worker.crashes.append(now)
+        while worker.crashes[0] <= now - self._restart_window:
+            worker.crashes.popleft()
+        if len(worker.crashes) > self._max_restarts:
+            raise KworkShardWorkerFailed(
+                f"{worker.worker_id} crashed {len(worker.crashes)} times in "
+                f"{self._restart_window:g}s (last exit code {exitcode})",
+                worker_id=worker.worker_id,
+                exitcode=exitcode,
+            )
+        delay = min(self._restart_delay * 2 ** (len(worker.crashes) - 1), self._max_restart_delay)
+        worker.restart_at = now + delay
+        logger.warning(
+            "%s exited with code %s, restarting in %.1fs", worker.worker_id, exitcode, delay
+        )
+
+    async def run(self) -> None:
+        self._running = True
+        try:
+            await asyncio.gather(
+                *(self._spawn(w) for w in self._workers.values() if w.process is None)
+            )
+            while True:
+                due: list[_Worker] = []
+                for worker in list(self._workers.values()):
+                    self._drain_metrics(worker)
+                    process = worker.process
+                    if process is not None and not process.is_alive():
+                        await self._on_exit(worker, process.exitcode)
+                    if worker.restart_at is not None and worker.restart_at <= time.monotonic():
+                        due.append(worker)
+                # Each worker waits out its own backoff; due restarts start together.
+                for worker in due:
+                    worker.restarts += 1
+                await asyncio.gather(*(self._spawn(w) for w in due))
+                await asyncio.sleep(self._poll_interval)
+        finally:
+            await self.stop()
+
+    async def stop(self) -> None:
+        self._running = False
+        for worker in self._workers.values():
+            worker.restart_at = None
+        await asyncio.gather(*(self._stop_worker(w) for w in self._workers.values()))
@@ -0,0 +1,459 @@
+"""
+In-process fake of the Kwork mobile API and the notice websocket, for tests and load tests.
+
+```python
+async with FakeKworkServer(faults=FaultConfig(latency=0.05, rate_limit_rate=0.1, seed=1)) as srv:
+    bot = KworkBot("login", "password", api_host=srv.api_host, websocket_uri=srv.websocket_uri)
+    srv.push_message(from_id=42, text="привет")
+```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import random
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Self
+
+from aiohttp import WSMsgType, web
+
+# Endpoints that answer 401 without a token issued by this server.
+_TOKEN_ENDPOINTS = frozenset({"dialogs", "inboxes", "inboxCreate", "projects", "getChannel"})
+
+
+@dataclass(slots=True)
+class FaultConfig:
+    """
+    Fault injection knobs, applied to every API request (not to websocket frames).
+
+    Rates are probabilities in [0, 1]; with a fixed `seed` the sequence of injected faults is
+    reproducible for the same sequence of requests.
+    """
+
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 500
+    rate_limit_rate: float = 0.0
+    retry_after: float | None = 1.0
+    seed: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.latency < 0 or self.latency_jitter < 0:
+            raise ValueError("latency and latency_jitter must be >= 0")
+        for name in ("error_rate", "rate_limit_rate"):
+            if not 0.0 <= getattr(self, name) <= 1.0:
+                raise ValueError(f"{name} must be in [0, 1]")
+
+
+@dataclass(slots=True)
+class EndpointStats:
+    requests: int = 0
+    rate_limited: int = 0
+    errors: int = 0
+    unauthorized: int = 0
+
+
+@dataclass(slots=True)
+class FakeUser:
+    id: int
+    username: str
+
+
+@dataclass(slots=True)
+class _StoredMessage:
+    message_id: int
+    from_id: int
+    to_id: int
+    text: str
+    time: int
+
+
+@dataclass(slots=True)
+class _Account:
+    password: str | None
+    user: FakeUser
+    tokens: set[str] = field(default_factory=set)
+
+
+# (server, request params, account for token endpoints) -> JSON body
+_Handler = Callable[..., dict[str, Any]]
+
+
+class FakeKworkServer:
+    """
+    aiohttp application implementing `signIn`, `dialogs`, `inboxes`, `inboxCreate`, `projects`,
+    `getChannel` and the `/ws/public/{channel}` notice websocket.
+
+    Pass `api_host` and `websocket_uri` to `KworkClient` / `KworkBot`. Accounts are created on
+    first `signIn` unless `accounts` (login -> password) restricts them. Messages pushed with
+    `push_message` are stored in the dialogs/inboxes of every account and broadcast as
+    `new_inbox` events to all connected websockets.
+    """
+
+    def __init__(
+        self,
+        *,
+        faults: FaultConfig | None = None,
+        accounts: dict[str, str] | None = None,
+        projects: int = 20,
+        token_lifetime: int = 3600,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.faults = faults or FaultConfig()
+        self._rng = random.Random(self.faults.seed)
+        self._host = host
+        self._port = port
+        self._token_lifetime = token_lifetime
+        self._strict_accounts = accounts is not None
+        self._accounts: dict[str, _Account] = {}
+        self._ids = itertools.count(1000)
+        for login, password in (accounts or {}).items():
+            self._add_account(login, password)
+
+        self._users: dict[int, FakeUser] = {}
+        self._messages: list[_StoredMessage] = []
+        self._projects = [self._make_project(i) for i in range(1, projects + 1)]
+        self._forced: dict[str, list[int]] = {}
+        self._sockets: set[web.WebSocketResponse] = set()
+        self._background: set[asyncio.Task[None]] = set()
+        self.stats: dict[str, EndpointStats] = {}
+        self.events_sent = 0
+
+        self._app = web.Application()
+        self._app.router.add_get("/ws/public/{channel}", self._handle_ws)
+        self._app.router.add_route("*", "/{endpoint}", self._handle_api)
+        self._runner: web.AppRunner | None = None
+        self._site_port: int | None = None
+
+    # --- lifecycle ---------------------------------------------------------------------------
+
+    async def start(self) -> None:
+        self._runner = web.AppRunner(self._app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self._host, self._port).start()
+        self._site_port = self._runner.addresses[0][1]
+
+    async def close(self) -> None:
+        for task in list(self._background):
+            task.cancel()
+        await asyncio.gather(*self._background, return_exceptions=True)
+        for ws in list(self._sockets):
+            await ws.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.close()
+
+    @property
+    def base_url(self) -> str:
+        if self._site_port is None:
+            raise RuntimeError("Server is not started")
+        return f"http://{self._host}:{self._site_port}"
+
+    @property
+    def api_host(self) -> str:
+        return self.base_url + "/{}"
+
+    @property
+    def websocket_uri(self) -> str:
+        return self.base_url.replace("http://", "ws://", 1) + "/ws/public/{}"
+
+    # --- knobs -------------------------------------------------------------------------------
+
+    def fail_next(self, endpoint: str, status: int = 500, *, times: int = 1) -> None:
+        """Answer the next `times` requests to `endpoint` with `status` (429 gets Retry-After)."""
+        self._forced.setdefault(endpoint, []).extend([status] * times)
+
+    def expire_tokens(self) -> None:
+        """Revoke all issued tokens: the next token request of every client gets HTTP 401."""
+        for account in self._accounts.values():
+            account.tokens.clear()
+
+    def add_user(self, user_id: int, username: str | None = None) -> FakeUser:
+        user = FakeUser(user_id, username or f"user{user_id}")
+        self._users[user_id] = user
+        return user
+
+    # --- events ------------------------------------------------------------------------------
+
+    @property
+    def connections(self) -> int:
+        return len(self._sockets)
+
+    async def wait_for_connections(self, n: int = 1, *, timeout: float = 5.0) -> None:
+        deadline = time.monotonic() + timeout
+        while len(self._sockets) < n:
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Expected {n} websocket connections, got {len(self._sockets)}")
+            await asyncio.sleep(0.01)
+
+    def push_message(self, from_id: int, text: str, *, username: str | None = None) -> None:
+        """Store an incoming message and broadcast it as a `new_inbox` event."""
+        user = self._users.get(from_id) or self.add_user(from_id, username)
+        message_ids: list[int] = []
+        for account in self._accounts.values():
+            message_id = next(self._ids)
+            message_ids.append(message_id)
+            self._messages.append(
+                _StoredMessage(message_id, user.id, account.user.id, text, int(time.time()))
+            )
+        self.broadcast(
+            {
+                "event": "new_inbox",
+                "data": {
+                    "from": user.id,
+                    "inboxMessage": text,
+                    "inbox_id": message_ids[0] if message_ids else None,
+                    "title": user.username,
+                },
+            }
+        )
+
+    def broadcast(self, event: dict[str, Any]) -> None:
+        """Send a raw event (`{"event": ..., "data": ...}`) to every connected websocket."""
+        frame = json.dumps({"text": json.dumps(event, ensure_ascii=False)}, ensure_ascii=False)
+        for ws in list(self._sockets):
+            if not ws.closed:
+                self._spawn(ws.send_str(frame))
+                self.events_sent += 1
+
+    def generate_messages(
+        self,
+        *,
+        rate: float,
+        count: int | None = None,
+        users: int = 100,
+        text: Callable[[int], str] = lambda n: f"message {n}",
+    ) -> asyncio.Task[None]:
+        """Push `count` (or endless) messages from `users` senders at `rate` messages/second."""
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+
+        async def _run() -> None:
+            for n in itertools.count() if count is None else range(count):
+                self.push_message(1 + n % users, text(n))
+                await asyncio.sleep(1.0 / rate)
+
+        return self._spawn(_run())
+
+    def replay(
+        self, events: Iterable[dict[str, Any]], *, rate: float | None = None
+    ) -> asyncio.Task[None]:
+        """Broadcast recorded raw events in order, `rate` per second (no pause if None)."""
+
+        async def _run() -> None:
+            for event in events:
+                self.broadcast(event)
+                await asyncio.sleep(0 if rate is None else 1.0 / rate)
+
+        return self._spawn(_run())
+
+    def _spawn(self, coro: Awaitable[Any]) -> asyncio.Task[None]:
+        async def _wrap() -> None:
+            await coro
+
+        task = asyncio.get_running_loop().create_task(_wrap())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+        return task
+
+    async def _handle_ws(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse(heartbeat=30)
+        await ws.prepare(request)
+        self._sockets.add(ws)
+        try:
+            async for msg in ws:
+                if msg.type == WSMsgType.ERROR:
+                    break
+        finally:
+            self._sockets.discard(ws)
+        return ws
+
+    # --- API ---------------------------------------------------------------------------------
+
+    async def _handle_api(self, request: web.Request) -> web.Response:
+        endpoint = request.match_info["endpoint"]
+        stats = self.stats.setdefault(endpoint, EndpointStats())
+        stats.requests += 1
+
+        faults = self.faults
+        if faults.latency or faults.latency_jitter:
+            await asyncio.sleep(faults.latency + self._rng.uniform(0.0, faults.latency_jitter))
+
+        forced = self._forced.get(endpoint)
+        status: int | None = forced.pop(0) if forced else None
+        if (
+            status is None
+            and faults.rate_limit_rate
+            and self._rng.random() < faults.rate_limit_rate
+        ):
+            status = 429
+        if status is None and faults.error_rate and self._rng.random() < faults.error_rate:
+            status = faults.error_status
+        if status == 429:
+            stats.rate_limited += 1
+            headers = {}
+            if faults.retry_after is not None:
+                headers["Retry-After"] = f"{faults.retry_after:g}"
+            return web.json_response(
+                {"success": False, "error": "Too Many Requests"}, status=429, headers=headers
+            )
+        if status is not None:
+            stats.errors += 1
+            return web.json_response({"success": False, "error": "Injected error"}, status=status)
+
+        params: dict[str, Any] = dict(request.query)
+        if request.can_read_body:
+            params.update(await request.post())
+
+        handler = self._handlers.get(endpoint)
+        if handler is None:
+            return web.json_response(
+                {"success": False, "error": f"Unknown endpoint {endpoint}"}, status=404
+            )
+
+        account: _Account | None = None
+        if endpoint in _TOKEN_ENDPOINTS:
+            account = self._account_by_token(params.get("token"))
+            if account is None:
+                stats.unauthorized += 1
+                return web.json_response({"success": False, "error": "Unauthorized"}, status=401)
+
+        return web.json_response(handler(self, params, account))
+
+    def _add_account(self, login: str, password: str | None) -> _Account:
+        account = _Account(password, FakeUser(next(self._ids), login))
+        self._accounts[login] = account
+        return account
+
+    def _account_by_token(self, token: Any) -> _Account | None:
+        if not isinstance(token, str):
+            return None
+        for account in self._accounts.values():
+            if token in account.tokens:
+                return account
+        return None
+
+    def _sign_in(self, params: dict[str, Any], _account: _Account | None) -> dict[str, Any]:
+        login = str(params.get("login", ""))
+        account = self._accounts.get(login)
+        if account is None and not self._strict_accounts:
+            account = self._add_account(login, None)
+        if account is None or (
+            account.password is not None and account.password != params.get("password")
+        ):
+            # API-level error: HTTP 200 with success=false, like the real API.
+            return {"success": False, "error": "Неверный логин или пароль"}
+        token = f"token-{account.user.id}-{next(self._ids)}"
+        account.tokens.add(token)
+        return {"success": True, "response": {"token": token, "expired": self._token_lifetime}}
+
+    def _get_channel(self, _params: dict[str, Any], account: _Account | None) -> dict[str, Any]:
+        assert account is not None
+        return {"success": True, "response": {"channel": f"channel-{account.user.id}"}}
+
+    def _dialogs(self, params: dict[str, Any], account: _Account | None) -> dict[str, Any]:
+        assert account is not None
+        if int(params.get("page", 1)) > 1:
+            return {"success": True, "response": []}
+        latest: dict[int, _StoredMessage] = {}
+        for message in self._messages:
+            if message.to_id == account.user.id:
+                latest[message.from_id] = message
+        dialogs = [
+            {
+                "user_id": m.from_id,
+                "username": self._users[m.from_id].username,
+                "last_message": m.text,
+                "time": m.time,
+                "unread": 1,
+            }
+            for m in sorted(latest.values(), key=lambda m: m.message_id, reverse=True)
+        ]
+        return {"success": True, "response": dialogs}
+
+    def _inboxes(self, params: dict[str, Any], account: _Account | None) -> dict[str, Any]:
+        assert account is not None
+        username = params.get("username")
+        peer = next((u for u in self._users.values() if u.username == username), None)
+        messages = [
+            m
+            for m in reversed(self._messages)
+            if peer is not None and {m.from_id, m.to_id} == {peer.id, account.user.id}
+        ]
+        page = int(params.get("page", 1))
+        page_size = 25
+        pages = max(1, -(-len(messages) // page_size))
+        chunk = messages[(page - 1) * page_size : page * page_size]
+        return {
+            "success": True,
+            "response": [
+                {
+                    "message_id": m.message_id,
+                    "from_id": m.from_id,
+                    "to_id": m.to_id,
+                    "message": m.text,
+                    "time": m.time,
+                }
+                for m in chunk
+            ],
+            "paging": {"page": page, "pages": pages},
+        }
+
+    def _inbox_create(self, params: dict[str, Any], account: _Account | None) -> dict[str, Any]:
+        assert account is not None
+        to_id = int(params["user_id"])
+        if to_id not in self._users:
+            self.add_user(to_id)
+        message = _StoredMessage(
+            next(self._ids), account.user.id, to_id, str(params.get("text", "")), int(time.time())
+        )
+        self._messages.append(message)
+        return {"success": True, "response": {"message_id": message.message_id}}
+
+    def _projects_page(self, params: dict[str, Any], _account: _Account | None) -> dict[str, Any]:
+        page = int(params.get("page", 1))
+        page_size = 10
+        return {
+            "success": True,
+            "response": self._projects[(page - 1) * page_size : page * page_size],
+            "connects": {"all_connects": 10, "active_connects": 10, "update_time": 0},
+            "paging": {"page": page, "pages": max(1, -(-len(self._projects) // page_size))},
+        }
+
+    @staticmethod
+    def _make_project(n: int) -> dict[str, Any]:
+        return {
+            "id": n,
+            "status": "active",
+            "user_id": 500 + n,
+            "username": f"buyer{n}",
+            "price": 1000 * n,
+            "title": f"Project {n}",
+            "description": f"Description of project {n}",
+            "offers": n % 7,
+            "time_left": 86400,
+            "parent_category_id": 11,
+            "category_id": 79,
+        }
+
+    _handlers: ClassVar[dict[str, _Handler]] = {
+        "signIn": _sign_in,
+        "getChannel": _get_channel,
+        "dialogs": _dialogs,
+        "inboxes": _inboxes,
+        "inboxCreate": _inbox_create,
+        "projects": _projects_page,
+    }
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Protocol
+
+
+@dataclass(frozen=True, slots=True)
+class StoredToken:
+    token: str
+    # Unix timestamp; None when the API didn't report the token lifetime.
+    expires_at: float | None = None
+
+    def expires_within(self, seconds: float, *, now: float | None = None) -> bool:
+        if self.expires_at is None:
+            return False
+        current = time.time() if now is None else now
+        return self.expires_at - current <= seconds
+
+
+class TokenStore(Protocol):
+    """Where `KworkAPI` keeps mobile API tokens between process starts."""
+
+    async def load(self, key: str) -> StoredToken | None: ...
+
+    async def save(self, key: str, token: StoredToken) -> None: ...
+
+    async def clear(self, key: str) -> None: ...
+
+
+class MemoryTokenStore:
+    """Process-local store; share one instance between clients of the same account."""
+
+    def __init__(self) -> None:
+        self._tokens: dict[str, StoredToken] = {}
+
+    async def load(self, key: str) -> StoredToken | None:
+        return self._tokens.get(key)
+
+    async def save(self, key: str, token: StoredToken) -> None:
+        self._tokens[key] = token
+
+    async def clear(self, key: str) -> None:
+        self._tokens.pop(key, None)
+
+
+class EncryptedFileTokenStore:
+    """
+    Tokens of any number of accounts in one Fernet-encrypted file.
+
+    `secret` is a Fernet key (`cryptography.fernet.Fernet.generate_key()`).
+    The file is written atomically and with 0600 permissions.
+    """
+
+    def __init__(self, path: str | Path, secret: str | bytes) -> None:
+        try:
+            from cryptography.fernet import Fernet  # pyright: ignore[reportMissingImports]
+        except ImportError as err:
+            msg = (
+                "Encrypted token storage requires optional dependency cryptography. "
+                'Install with: pip install "kwork[crypto]" (recommended) '
+                "or pip install cryptography"
+            )
+            raise ImportError(msg) from err
+
+        self._path = Path(path).expanduser()
+        self._fernet = Fernet(secret)
+        self._lock = asyncio.Lock()
+
+    def _read_all(self) -> dict[str, Any]:
+        from cryptography.fernet import InvalidToken  # pyright: ignore[reportMissingImports]
+
+        try:
+            blob = self._path.read_bytes()
+        except FileNotFoundError:
+            return {}
+        try:
+            parsed: Any = json.loads(self._fernet.decrypt(blob))
+        except (InvalidToken, ValueError):
+            # Wrong key or corrupted file: behave as an empty store, the next save overwrites it.
+            return {}
+        return parsed if isinstance(parsed, dict) else {}
+
+    def _write_all(self, data: dict[str, Any]) -> None:
+        blob = self._fernet.encrypt(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self._path.with_name(self._path.name + ".tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(blob)
+        os.replace(tmp, self._path)
+
+    async def load(self, key: str) -> StoredToken | None:
+        async with self._lock:
+            data = await asyncio.to_thread(self._read_all)
+        entry = data.get(key)
+        if not isinstance(entry, dict) or not isinstance(entry.get("token"), str):
+            return None
+        expires_at = entry.get("expires_at")
+        return StoredToken(
+            token=entry["token"],
+            expires_at=float(expires_at) if isinstance(expires_at, (int, float)) else None,
+        )
+
+    async def save(self, key: str, token: StoredToken) -> None:
+        async with self._lock:
+            data = await asyncio.to_thread(self._read_all)
+            data[key] = {"token": token.token, "expires_at": token.expires_at}
+            await asyncio.to_thread(self._write_all, data)
+
+    async def clear(self, key: str) -> None:
+        async with self._lock:
+            data = await asyncio.to_thread(self._read_all)
+            if data.pop(key, None) is not None:
+                await asyncio.to_thread(self._write_all, data)
@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import asyncio
+import json as jsonlib
+from collections.abc import AsyncIterator, Callable, Mapping
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from http.cookies import SimpleCookie
+from typing import TYPE_CHECKING, Any, Literal, Protocol
+from urllib.request import Request
+
+import aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+if TYPE_CHECKING:
+    import httpx
+
+HttpBackend = Literal["aiohttp", "httpx"]
+
+# Body chunks buffered between aiohttp's payload writer and httpx's request stream.
+_STREAM_QUEUE_SIZE = 4
+
+
+class Transport(Protocol):
+    """
+    What `KworkAPI` and `KworkWebClient` need from an HTTP client.
+
+    `aiohttp.ClientSession` is the default implementation; `request()` takes the
+    `ClientSession.request` keyword arguments (`params`, `headers`, `data`, `json`, `cookies`,
+    `timeout`, `allow_redirects`, `max_redirects`) and yields a response with `status`, `url`,
+    `headers`, `content_type`, `content`, `read()`, `text()` and `get_encoding()`.
+    """
+
+    @property
+    def closed(self) -> bool: ...
+
+    @property
+    def cookie_jar(self) -> Any: ...
+
+    # A property so that implementations may spell out the keyword arguments they accept.
+    @property
+    def request(self) -> Callable[..., Any]: ...
+
+    async def close(self) -> None: ...
+
+
+def _import_httpx() -> Any:
+    try:
+        import httpx  # pyright: ignore[reportMissingImports]
+    except ImportError as err:
+        msg = (
+            "The httpx backend requires optional dependency httpx. "
+            'Install with: pip install "kwork[http2]" (recommended) '
+            'or pip install "httpx[http2]"'
+        )
+        raise ImportError(msg) from err
+    return httpx
+
+
+def _httpx_timeout(httpx: Any, timeout: aiohttp.ClientTimeout | None) -> Any:
+    if timeout is None:
+        return httpx.Timeout(None)
+    # httpx has no total timeout: the transport enforces `total` itself.
+    return httpx.Timeout(
+        None,
+        connect=timeout.sock_connect or timeout.connect,
+        read=timeout.sock_read,
+    )
+
+
+class _QueueWriter:
+    """`AbstractStreamWriter` stand-in that hands aiohttp payload chunks to a queue."""
+
+    def __init__(self, queue: asyncio.Queue[bytes | None]) -> None:
+        self._queue = queue
+
+    async def write(self, chunk: bytes | bytearray | memoryview) -> None:
+        await self._queue.put(bytes(chunk))
+
+
+async def _payload_stream(payload: aiohttp.Payload) -> AsyncIterator[bytes]:
+    # Multipart bodies (incl. streamed files and upload progress) are produced by aiohttp's own
+    # payload writers, so both backends send byte-identical forms.
+    queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=_STREAM_QUEUE_SIZE)
+
+    async def _produce() -> None:
+        try:
+            await payload.write(_QueueWriter(queue))  # pyright: ignore[reportArgumentType]
+        finally:
+            await queue.put(None)
+
+    producer = asyncio.ensure_future(_produce())
+    try:
+        while (chunk := await queue.get()) is not None:
+            yield chunk
+        await producer
+    finally:
+        producer.cancel()
+
+
+def _encode_body(data: Any, json: Any, headers: dict[str, str]) -> dict[str, Any]:
+    if json is not None:
+        headers.setdefault("Content-Type", "application/json")
+        return {"content": jsonlib.dumps(json).encode()}
+    if data is None:
+        return {}
+    if isinstance(data, aiohttp.FormData):
+        payload = data()
+        headers.setdefault("Content-Type", payload.content_type)
+        if payload.size is not None:
+            headers.setdefault("Content-Length", str(payload.size))
+        return {"content": _payload_stream(payload)}
+    if isinstance(data, Mapping):
+        return {"data": {k: str(v) for k, v in data.items()}}
+    return {"content": data}
+
+
+class HttpxCookieJar:
+    """The part of the aiohttp cookie jar API used by this library, over an httpx cookie jar."""
+
+    def __init__(self, cookies: httpx.Cookies) -> None:
+        self._cookies = cookies
+
+    def filter_cookies(self, request_url: str | URL) -> SimpleCookie:
+        request = Request(str(request_url))
+        self._cookies.jar.add_cookie_header(request)
+        cookie = SimpleCookie()
+        header = request.get_header("Cookie")
+        if header:
+            cookie.load(header)
+        return cookie
+
+    def clear(self, *_args: Any) -> None:
+        self._cookies.clear()
+
+    def __iter__(self) -> Any:
+        return iter(self._cookies.jar)
+
+    def __len__(self) -> int:
+        return len(self._cookies.jar)
+
+
+class _HttpxContent:
+    def __init__(self, response: HttpxResponse) -> None:
+        self._response = response
+
+    async def iter_chunked(self, n: int) -> AsyncIterator[bytes]:
+        async with self._response._errors():
+            async for chunk in self._response._raw.aiter_bytes(n):
+                yield chunk
+
+    async def iter_any(self) -> AsyncIterator[bytes]:
+        async with self._response._errors():
+            async for chunk in self._response._raw.aiter_bytes():
+                yield chunk
+
+
+class HttpxResponse:
+    """httpx response exposing the `aiohttp.ClientResponse` attributes this library reads."""
+
+    def __init__(self, response: httpx.Response, httpx_module: Any) -> None:
+        self._raw = response
+        self._httpx = httpx_module
+        self.status: int = response.status_code
+        self.url = URL(str(response.url))
+        self.headers = CIMultiDictProxy(CIMultiDict(response.headers.multi_items()))
+        self.content = _HttpxContent(self)
+        self._body: bytes | None = None
+
+    @property
+    def content_type(self) -> str:
+        value = self.headers.get("Content-Type", "application/octet-stream")
+        return value.split(";", 1)[0].strip().lower()
+
+    def get_encoding(self) -> str:
+        return self._raw.charset_encoding or "utf-8"
+
+    @asynccontextmanager
+    async def _errors(self) -> AsyncIterator[None]:
+        try:
+            yield
+        except self._httpx.TimeoutException as e:
+            raise TimeoutError(str(e)) from e
+        except self._httpx.TransportError as e:
+            raise aiohttp.ClientPayloadError(str(e)) from e
+
+    async def read(self) -> bytes:
+        if self._body is None:
+            async with self._errors():
+                self._body = await self._raw.aread()
+        return self._body
+
+    async def text(self, encoding: str | None = None, errors: str = "strict") -> str:
+        return (await self.read()).decode(encoding or self.get_encoding(), errors=errors)
+
+    async def json(self, **_kwargs: Any) -> Any:
+        return jsonlib.loads(await self.read())
+
+
+class HttpxTransport:
+    """
+    `Transport` over `httpx.AsyncClient`, with HTTP/2 by default: concurrent requests to one
+    host are multiplexed over a single TLS connection instead of a connection per request.
+
+    Needs `pip install "kwork[http2]"`. `timeout.total` is enforced per request by the
+    transport, `max_redirects` is per client (httpx has no per-request limit).
+    """
+
+    def __init__(
+        self,
+        *,
+        http2: bool = True,
+        proxy: str | None = None,
+        timeout: aiohttp.ClientTimeout | None = None,
+        max_connections: int = 100,
+        max_redirects: int = 10,
+        verify: Any = True,
+    ) -> None:
+        httpx = _import_httpx()
+        self._httpx = httpx
+        self._timeout = timeout
+        self._client = httpx.AsyncClient(
+            http2=http2,
+            proxy=proxy,
+            timeout=_httpx_timeout(httpx, timeout),
+            limits=httpx.Limits(
+                max_connections=max_connections, max_keepalive_connections=max_connections
+            ),
+            max_redirects=max_redirects,
+            verify=verify,
+        )
+        self._cookie_jar = HttpxCookieJar(self._client.cookies)
+
+    @property
+    def closed(self) -> bool:
+        return self._client.is_closed
+
+    @property
+    def cookie_jar(self) -> HttpxCookieJar:
+        return self._cookie_jar
+
+    def request(
+        self,
+        method: str,
+        url: str | URL,
+        *,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        data: Any = None,
+        json: Any = None,
+        cookies: Mapping[str, str] | None = None,
+        timeout: aiohttp.ClientTimeout | None = None,
+        allow_redirects: bool = True,
+        max_redirects: int | None = None,
+    ) -> AbstractAsyncContextManager[HttpxResponse]:
+        return self._request(
+            method,
+            str(url),
+            params=params,
+            headers=headers,
+            data=data,
+            json=json,
+            cookies=cookies,
+            timeout=timeout or self._timeout,
+            allow_redirects=allow_redirects,
+        )
+
+    @asynccontextmanager
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Mapping[str, Any] | None,
+        headers: Mapping[str, str] | None,
+        data: Any,
+        json: Any,
+        cookies: Mapping[str, str] | None,
+        timeout: aiohttp.ClientTimeout | None,
+        allow_redirects: bool,
+    ) -> AsyncIterator[HttpxResponse]:
+        httpx = self._httpx
+        hdrs = dict(headers or {})
+        body = _encode_body(data, json, hdrs)
+        if cookies:
+            jar_cookies = self._cookie_jar.filter_cookies(url)
+            merged = {name: morsel.value for name, morsel in jar_cookies.items()}
+            merged.update(cookies)
+            hdrs["Cookie"] = "; ".join(f"{k}={v}" for k, v in merged.items())
+
+        total = timeout.total if timeout is not None else None
+        async with asyncio.timeout(total):
+            request = self._client.build_request(
+                method,
+                url,
+                params={k: str(v) for k, v in params.items()} if params else None,
+                headers=hdrs,
+                timeout=_httpx_timeout(httpx, timeout),
+                **body,
+            )
+            try:
+                raw = await self._client.send(
+                    request, stream=True, follow_redirects=allow_redirects
+                )
+            except httpx.TimeoutException as e:
+                raise TimeoutError(str(e)) from e
+            except httpx.TransportError as e:
+                raise aiohttp.ClientConnectionError(str(e)) from e
+            try:
+                yield HttpxResponse(raw, httpx)
+            finally:
+                await raw.aclose()
+
+    async def close(self) -> None:
+        await self._client.aclose()
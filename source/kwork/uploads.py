@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import mimetypes
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, cast
+
+from aiohttp.abc import AbstractStreamWriter
+from aiohttp.payload import Payload
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# (sent_bytes, total_bytes or None when unknown) for the whole multipart request.
+ProgressCallback = Callable[[int, int | None], Any]
+# Zero-argument callable returning a fresh binary file object; called once per attempt.
+Opener = Callable[[], IO[bytes]]
+
+
+class UploadProgress:
+    """Aggregates sent bytes of all file parts of one request and reports them."""
+
+    def __init__(self, callback: ProgressCallback | None, total: int | None) -> None:
+        self._callback = callback
+        self.total = total
+        self.sent = 0
+
+    def advance(self, n: int) -> None:
+        self.sent += n
+        if self._callback is not None:
+            self._callback(self.sent, self.total)
+
+
+def _open_sized(opener: Opener) -> tuple[IO[bytes], int | None]:
+    f = opener()
+    return f, _remaining_size(f)
+
+
+def _remaining_size(f: IO[bytes]) -> int | None:
+    try:
+        pos = f.tell()
+        end = f.seek(0, io.SEEK_END)
+        f.seek(pos)
+    except (OSError, ValueError, AttributeError):
+        return None
+    return end - pos
+
+
+class StreamingFilePayload(Payload):
+    """
+    Multipart part that streams a file from disk in fixed-size chunks.
+
+    The file is opened and read in a worker thread, so neither `open()` nor `read()` block the
+    event loop, and at most one chunk is held in memory regardless of the file size. The source
+    is opened at write time unless an already `opened` handle is passed, which makes a payload
+    built from a path or an opener safe to rebuild for a retry.
+    """
+
+    _autoclose = True
+
+    def __init__(
+        self,
+        opener: Opener,
+        *,
+        size: int | None,
+        progress: UploadProgress | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        close_source: bool = True,
+        filename: str | None = None,
+        content_type: str | None = None,
+        opened: IO[bytes] | None = None,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        super().__init__(opener, content_type=content_type, filename=filename)
+        self._opener = opener
+        self._size = size
+        self.progress = progress
+        self._chunk_size = chunk_size
+        self._close_source = close_source
+        self._opened = opened
+
+    def decode(self, encoding: str = "utf-8", errors: str = "strict") -> str:
+        raise TypeError("Streaming file payloads cannot be decoded to text")
+
+    async def write(self, writer: AbstractStreamWriter) -> None:
+        await self.write_with_length(writer, None)
+
+    def _close(self) -> None:
+        # A handle opened in advance whose request failed before the body was written.
+        f, self._opened = self._opened, None
+        if f is not None and self._close_source:
+            f.close()
+
+    async def write_with_length(
+        self, writer: AbstractStreamWriter, content_length: int | None
+    ) -> None:
+        f, self._opened = self._opened, None
+        if f is None:
+            f = await asyncio.to_thread(self._opener)
+        remaining = content_length
+        try:
+            while remaining is None or remaining > 0:
+                n = self._chunk_size if remaining is None else min(self._chunk_size, remaining)
+                chunk = await asyncio.to_thread(f.read, n)
+                if not chunk:
+                    break
+                await writer.write(chunk)
+                if remaining is not None:
+                    remaining -= len(chunk)
+                if self.progress is not None:
+                    self.progress.advance(len(chunk))
+        finally:
+            if self._close_source:
+                await asyncio.to_thread(f.close)
+
+
+async def build_file_part(
+    field: str,
+    spec: Any,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> tuple[StreamingFilePayload, bool]:
+    """
+    Turn a `request_multipart` file spec into a streaming payload.
+
+    Returns `(payload, reusable)`; `reusable` is False for already opened file objects, which
+    can be consumed only once and therefore must not be retried.
+    """
+    filename: str | None = None
+    content_type: str | None = None
+    value = spec
+    if isinstance(spec, tuple) and 2 <= len(spec) <= 3:
+        filename = spec[0]
+        value = spec[1]
+        content_type = spec[2] if len(spec) == 3 else None
+
+    close_source = True
+    reusable = True
+    opened: IO[bytes] | None = None
+    if isinstance(value, (str, Path)):
+        path = Path(value)
+        filename = filename or path.name
+
+        def opener() -> IO[bytes]:
+            return path.open("rb")
+
+        size = (await asyncio.to_thread(path.stat)).st_size
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        data = bytes(value)
+
+        def opener() -> IO[bytes]:
+            return io.BytesIO(data)
+
+        size = len(data)
+    elif callable(value):
+        opener = cast(Opener, value)
+        # The opener may be called only once per attempt: the size comes from the handle
+        # that is then streamed.
+        opened, size = await asyncio.to_thread(_open_sized, opener)
+    else:
+        fileobj: IO[bytes] = value
+
+        def opener() -> IO[bytes]:
+            return fileobj
+
+        size = _remaining_size(fileobj)
+        close_source = False
+        reusable = False
+        if filename is None:
+            name = getattr(fileobj, "name", None)
+            filename = Path(name).name if isinstance(name, str) else field
+
+    if filename is None:
+        filename = field
+    if content_type is None:
+        content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+    payload = StreamingFilePayload(
+        opener,
+        size=size,
+        chunk_size=chunk_size,
+        close_source=close_source,
+        filename=filename,
+        content_type=content_type,
+        opened=opened,
+    )
+    return payload, reusable
+
+
+def attach_progress(
+    parts: list[StreamingFilePayload], callback: ProgressCallback | None
+) -> UploadProgress | None:
+    if callback is None:
+        return None
+    sizes = [p.size for p in parts]
+    total = None if any(s is None for s in sizes) else sum(s for s in sizes if s is not None)
+    progress = UploadProgress(callback, total)
+    for part in parts:
+        part.progress = progress
+    return progress
+
+
+@dataclass(slots=True)
+class FileUploadResult:
+    """Outcome of one file of a bulk upload."""
+
+    path: Path
+    size: int | None
+    elapsed: float
+    response: dict[str, Any] | None = None
+    error: BaseException | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass(slots=True)
+class BulkUploadResult:
+    """Per-file results in input order plus aggregate timings."""
+
+    items: list[FileUploadResult]
+    elapsed: float
+
+    @property
+    def uploaded_bytes(self) -> int:
+        return sum(item.size or 0 for item in self.items if item.ok)
+
+    @property
+    def throughput(self) -> float:
+        """Bytes per second over the wall-clock time of the whole batch."""
+        if self.elapsed <= 0:
+            return 0.0
+        return self.uploaded_bytes / self.elapsed
+
+    @property
+    def failed(self) -> list[FileUploadResult]:
+        return [item for item in self.items if not item.ok]
@@ -1,24 +1,53 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import secrets
 import string
 import re
+import time
+from collections.abc import AsyncIterator, Callable, Coroutine, Iterable, Iterator, Mapping
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 from urllib.parse import unquote, urljoin, urlparse
 
 import aiohttp
+from multidict import CIMultiDictProxy
 from yarl import URL
 
 from kwork.api import KworkAPI
-from kwork.exceptions import KworkException
+from kwork.cookies import KworkCookieJar
+from kwork.exceptions import KworkException, KworkWebAuthError
+
+if TYPE_CHECKING:
+    from kwork.transport import Transport
 
 logger: logging.Logger = logging.getLogger(__name__)
 
 
 DEFAULT_WEB_BASE_URL = "https://kwork.ru/"
+# Where kwork.ru sends requests that need a logged-in web session.
+_LOGIN_PATHS = frozenset({"/login", "/signin"})
+
+# Best-effort: draftKey may be embedded in HTML/JS.
+_DRAFT_KEY_PATTERNS = tuple(
+    re.compile(pat, re.IGNORECASE)
+    for pat in (
+        r'draftKey["\']?\s*[:=]\s*["\']([a-z0-9]{6,64})["\']',
+        r'name=["\']draftKey["\']\s+value=["\']([a-z0-9]{6,64})["\']',
+        r'data-draft-key=["\']([a-z0-9]{6,64})["\']',
+    )
+)
+_CSRF_USER_TOKEN_PATTERNS = tuple(
+    re.compile(pat, re.IGNORECASE)
+    for pat in (
+        r'csrf_user_token["\']?\s*[:=]\s*["\']([a-f0-9]{16,128})["\']',
+        r'name=["\']csrftoken["\']\s+value=["\']([a-f0-9]{16,128})["\']',
+    )
+)
 
 
 @dataclass(frozen=True, slots=True)
@@ -31,6 +60,133 @@ class WebLoginResult:
     status: int | None
 
 
+_MISSING: Any = object()
+
+
+@lru_cache(maxsize=256)
+def _origin(url: str) -> str:
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+class WebResponse(Mapping[str, Any]):
+    """
+    Response of `KworkWebClient.request_lazy`.
+
+    A read-only mapping with the keys of the dict returned by `KworkWebClient.request`
+    (`status`, `url`, `headers`, `text`, `json`), but only the raw body is stored: `text`, `json`
+    and the plain `headers` dict are built on first access.
+    """
+
+    __slots__ = (
+        "_body",
+        "_encoding",
+        "_headers",
+        "_headers_dict",
+        "_json",
+        "_text",
+        "status",
+        "url",
+    )
+
+    _KEYS = ("status", "url", "headers", "text", "json")
+
+    def __init__(
+        self,
+        *,
+        status: int,
+        url: str,
+        headers: CIMultiDictProxy[str],
+        body: bytes,
+        encoding: str,
+    ) -> None:
+        self.status = status
+        self.url = url
+        self._headers = headers
+        self._body = body
+        self._encoding = encoding
+        self._headers_dict: dict[str, str] | None = None
+        self._text: str | None = None
+        self._json: Any = _MISSING
+
+    @property
+    def raw_headers(self) -> CIMultiDictProxy[str]:
+        return self._headers
+
+    @property
+    def headers(self) -> dict[str, str]:
+        if self._headers_dict is None:
+            self._headers_dict = {k: v for k, v in self._headers.items()}
+        return self._headers_dict
+
+    @property
+    def body(self) -> bytes:
+        return self._body
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = self._body.decode(self._encoding, errors="replace")
+        return self._text
+
+    @property
+    def json(self) -> Any | None:
+        """Parsed JSON if the response looks like JSON, else None."""
+        if self._json is _MISSING:
+            content_type = self._headers.get("Content-Type", "")
+            self._json = None
+            if "application/json" in content_type or content_type.endswith("+json"):
+                try:
+                    self._json = json.loads(self._body)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    self._json = None
+        return self._json
+
+    def to_dict(self) -> dict[str, Any]:
+        """The plain dict returned by `KworkWebClient.request`."""
+        return {key: getattr(self, key) for key in self._KEYS}
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
+    def __repr__(self) -> str:
+        return f"WebResponse(status={self.status}, url={self.url!r}, body={len(self._body)} bytes)"
+
+
+@dataclass(frozen=True, slots=True)
+class ExchangeOffer:
+    """Arguments of one `submit_exchange_offer` call for `submit_exchange_offers`."""
+
+    project_id: int
+    description: str
+    kwork_duration: int
+    kwork_price: int
+    kwork_name: str
+    offer_type: str = "custom"
+
+
+@dataclass(slots=True)
+class OfferSubmitResult:
+    """Outcome of one offer of a batch; a failure doesn't stop the other offers."""
+
+    project_id: int
+    response: dict[str, Any] | None = None
+    error: BaseException | None = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
 class KworkWebClient:
     """
     Minimal web client that reuses the authenticated mobile API session.
@@ -42,14 +198,50 @@ class KworkWebClient:
     This class implements the same flow using aiohttp.
     """
 
-    def __init__(self, api: KworkAPI, *, base_url: str = DEFAULT_WEB_BASE_URL) -> None:
+    def __init__(
+        self,
+        api: KworkAPI,
+        *,
+        base_url: str = DEFAULT_WEB_BASE_URL,
+        session: Transport | None = None,
+    ) -> None:
+        """
+        `session` gives this client its own cookie jar (see `WebSessionPool`); by default the
+        session of `api` is shared.
+        """
         self._api = api
+        self._own_session = session
         self._base_url = (base_url.rstrip("/") + "/") if base_url else DEFAULT_WEB_BASE_URL
+        # Set when a response shows that the web cookies are no longer valid.
+        self.auth_lost = False
+        # Per-login state reused by `submit_exchange_offer(reuse_session_state=True)`.
+        self._csrf_user_token: str | None = None
+        self._faq_pages: set[str] = set()
+
+    def _reset_session_state(self) -> None:
+        self._csrf_user_token = None
+        self._faq_pages.clear()
 
     @property
     def base_url(self) -> str:
         return self._base_url
 
+    @property
+    def session(self) -> Transport:
+        if self._own_session is not None:
+            return self._own_session
+        return self._api.session
+
+    def _is_login_redirect(self, url: str) -> bool:
+        parsed = urlparse(url)
+        return parsed.netloc.endswith("kwork.ru") and parsed.path.rstrip("/") in _LOGIN_PATHS
+
+    def _track_auth(self, status: int, url: str) -> None:
+        if status in {401, 403} or self._is_login_redirect(url):
+            if not self.auth_lost:
+                logger.debug("Web session looks logged out: status=%s url=%s", status, url)
+            self.auth_lost = True
+
     async def login_via_mobile_web_auth_token(
         self,
         *,
@@ -106,7 +298,7 @@ class KworkWebClient:
         if effective_timeout is not None:
             req_kwargs["timeout"] = effective_timeout
 
-        async with self._api.session.request(**req_kwargs) as resp:
+        async with self.session.request(**req_kwargs) as resp:
             # Consume body so aiohttp stores cookies from redirects/responses.
             await resp.read()
             final_url = str(resp.url)
@@ -116,7 +308,8 @@ class KworkWebClient:
         # Ensure we actually touch the target page to populate any additional cookies (e.g. XSRF-TOKEN).
         if url_to_redirect:
             target_url = urljoin(self._base_url, url_to_redirect.lstrip("/"))
-            async with self._api.session.get(
+            async with self.session.request(
+                "GET",
                 target_url,
                 headers=headers or None,
                 allow_redirects=allow_redirects,
@@ -126,6 +319,9 @@ class KworkWebClient:
                 final_url = str(resp2.url)
                 status = resp2.status
 
+        self.auth_lost = self._is_login_redirect(final_url) or status in {401, 403}
+        self._reset_session_state()
+
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug("Web login via token completed: status=%s final_url=%s", status, final_url)
 
@@ -138,13 +334,13 @@ class KworkWebClient:
             status=status,
         )
 
-    def _filtered_cookies(self, url: str) -> dict[str, str]:
+    def _filtered_cookies(self, url: str) -> Mapping[str, str]:
+        jar = self.session.cookie_jar
+        if isinstance(jar, KworkCookieJar):
+            # Cached until the jar changes: this runs for every XHR.
+            return jar.cookie_values(url)
         # `filter_cookies` returns SimpleCookie; turn into a plain dict.
-        cookies = self._api.session.cookie_jar.filter_cookies(URL(url))
-        out: dict[str, str] = {}
-        for name, morsel in cookies.items():
-            out[name] = morsel.value
-        return out
+        return {name: morsel.value for name, morsel in jar.filter_cookies(URL(url)).items()}
 
     def _maybe_add_csrf_headers(self, url: str, headers: dict[str, str]) -> None:
         """
@@ -166,8 +362,7 @@ class KworkWebClient:
 
         # XHR requests often require Origin/Referer; add defaults if missing.
         if "Origin" not in headers:
-            parsed = urlparse(url)
-            headers["Origin"] = f"{parsed.scheme}://{parsed.netloc}"
+            headers["Origin"] = _origin(url)
         if "Referer" not in headers:
             headers["Referer"] = self._base_url
 
@@ -194,52 +389,32 @@ class KworkWebClient:
 
     @staticmethod
     def _extract_draft_key(html: str) -> str | None:
-        # Best-effort: draftKey may be embedded in HTML/JS.
-        patterns = [
-            r'draftKey["\']?\s*[:=]\s*["\']([a-z0-9]{6,64})["\']',
-            r'name=["\']draftKey["\']\s+value=["\']([a-z0-9]{6,64})["\']',
-            r'data-draft-key=["\']([a-z0-9]{6,64})["\']',
-        ]
-        for pat in patterns:
-            m = re.search(pat, html, flags=re.IGNORECASE)
+        for pattern in _DRAFT_KEY_PATTERNS:
+            m = pattern.search(html)
             if m:
                 return m.group(1)
         return None
 
     @staticmethod
     def _extract_csrf_user_token(html: str) -> str | None:
-        patterns = [
-            r'csrf_user_token["\']?\s*[:=]\s*["\']([a-f0-9]{16,128})["\']',
-            r'name=["\']csrftoken["\']\s+value=["\']([a-f0-9]{16,128})["\']',
-        ]
-        for pat in patterns:
-            m = re.search(pat, html, flags=re.IGNORECASE)
+        for pattern in _CSRF_USER_TOKEN_PATTERNS:
+            m = pattern.search(html)
             if m:
                 return m.group(1)
         return None
 
-    async def request(
+    def _build_request_kwargs(
         self,
         method: str,
         path_or_url: str,
         *,
-        params: dict[str, Any] | None = None,
-        data: Any = None,
-        json_data: Any | None = None,
-        headers: dict[str, str] | None = None,
-        allow_redirects: bool = True,
-        timeout: aiohttp.ClientTimeout | float | None = None,
+        params: dict[str, Any] | None,
+        data: Any,
+        json_data: Any | None,
+        headers: dict[str, str] | None,
+        allow_redirects: bool,
+        timeout: aiohttp.ClientTimeout | float | None,
     ) -> dict[str, Any]:
-        """
-        Make a request to kwork.ru using the current aiohttp cookie jar.
-
-        Returns a dict with:
-        - status: int
-        - url: final URL
-        - headers: response headers (stringified)
-        - text: response body (decoded)
-        - json: parsed JSON if response looks like JSON, else None
-        """
         if path_or_url.startswith("http://") or path_or_url.startswith("https://"):
             url = path_or_url
         else:
@@ -264,24 +439,111 @@ class KworkWebClient:
             req_kwargs.pop("data", None)
         if effective_timeout is not None:
             req_kwargs["timeout"] = effective_timeout
+        return req_kwargs
 
-        async with self._api.session.request(**req_kwargs) as resp:
-            text = await resp.text(errors="replace")
-            content_type = resp.headers.get("Content-Type", "")
-            parsed_json: Any | None = None
-            if "application/json" in content_type or content_type.endswith("+json"):
-                try:
-                    parsed_json = json.loads(text)
-                except json.JSONDecodeError:
-                    parsed_json = None
-
-            return {
-                "status": resp.status,
-                "url": str(resp.url),
-                "headers": {k: v for k, v in resp.headers.items()},
-                "text": text,
-                "json": parsed_json,
-            }
+    async def request(
+        self,
+        method: str,
+        path_or_url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        data: Any = None,
+        json_data: Any | None = None,
+        headers: dict[str, str] | None = None,
+        allow_redirects: bool = True,
+        timeout: aiohttp.ClientTimeout | float | None = None,
+    ) -> dict[str, Any]:
+        """
+        Make a request to kwork.ru using the cookie jar of the current session.
+
+        Returns a dict with:
+        - status: int
+        - url: final URL
+        - headers: response headers (stringified)
+        - text: response body (decoded)
+        - json: parsed JSON if response looks like JSON, else None
+        """
+        resp = await self.request_lazy(
+            method,
+            path_or_url,
+            params=params,
+            data=data,
+            json_data=json_data,
+            headers=headers,
+            allow_redirects=allow_redirects,
+            timeout=timeout,
+        )
+        return resp.to_dict()
+
+    async def request_lazy(
+        self,
+        method: str,
+        path_or_url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        data: Any = None,
+        json_data: Any | None = None,
+        headers: dict[str, str] | None = None,
+        allow_redirects: bool = True,
+        timeout: aiohttp.ClientTimeout | float | None = None,
+    ) -> WebResponse:
+        """
+        Like `request`, but returns a `WebResponse`: the body is read, while `text`, `json` and
+        `headers` are only built when accessed. Cheaper when most of the response is ignored.
+        """
+        req_kwargs = self._build_request_kwargs(
+            method,
+            path_or_url,
+            params=params,
+            data=data,
+            json_data=json_data,
+            headers=headers,
+            allow_redirects=allow_redirects,
+            timeout=timeout,
+        )
+        async with self.session.request(**req_kwargs) as resp:
+            body = await resp.read()
+            self._track_auth(resp.status, str(resp.url))
+            return WebResponse(
+                status=resp.status,
+                url=str(resp.url),
+                headers=resp.headers,
+                body=body,
+                encoding=resp.get_encoding(),
+            )
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        path_or_url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        data: Any = None,
+        json_data: Any | None = None,
+        headers: dict[str, str] | None = None,
+        allow_redirects: bool = True,
+        timeout: aiohttp.ClientTimeout | float | None = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Like `request`, but yields the raw response (`aiohttp.ClientResponse` with the default
+        transport) without reading the body.
+
+        Use for large pages/downloads: `async for chunk in resp.content.iter_chunked(65536)`.
+        """
+        req_kwargs = self._build_request_kwargs(
+            method,
+            path_or_url,
+            params=params,
+            data=data,
+            json_data=json_data,
+            headers=headers,
+            allow_redirects=allow_redirects,
+            timeout=timeout,
+        )
+        async with self.session.request(**req_kwargs) as resp:
+            self._track_auth(resp.status, str(resp.url))
+            yield resp
 
     async def quick_faq_init(
         self,
@@ -367,7 +629,7 @@ class KworkWebClient:
         return resp
 
     @staticmethod
-    def _raise_on_web_error(resp: dict[str, Any], *, where: str) -> None:
+    def _raise_on_web_error(resp: Mapping[str, Any], *, where: str) -> None:
         j = resp.get("json")
         if isinstance(j, dict) and j.get("success") is False:
             msg = j.get("message") or j.get("error") or j.get("response") or "Web API error"
@@ -441,6 +703,8 @@ class KworkWebClient:
         kwork_name: str,
         user_agent: str | None = None,
         raise_on_error: bool = True,
+        reuse_session_state: bool = False,
+        concurrent_preflight: bool = False,
     ) -> dict[str, Any]:
         """
         High-level helper that replicates the browser flow for /new_offer.
@@ -450,6 +714,10 @@ class KworkWebClient:
         - POST /wants/create_offer_draft (multipart, includes csrftoken + draftKey)
         - POST /projects/check_is_template
         - POST /api/offer/createoffer (multipart)
+
+        `reuse_session_state=True` keeps the csrf token and skips `quick-faq/init` after the
+        first offer of this web login. `concurrent_preflight=True` sends the three preflight
+        XHRs at the same time instead of one after another (they only depend on the page).
         """
         referer = urljoin(self._base_url, f"new_offer?project={project_id}")
 
@@ -458,26 +726,58 @@ class KworkWebClient:
 
         # Prefer cookie; fallback to HTML parsing.
         cookies = self._filtered_cookies(self._base_url)
-        csrftoken = cookies.get("csrf_user_token") or self._extract_csrf_user_token(html or "")
+        csrftoken = cookies.get("csrf_user_token")
+        if not csrftoken and reuse_session_state:
+            csrftoken = self._csrf_user_token
         if not csrftoken:
-            raise RuntimeError("csrf_user_token cookie not found; cannot continue web offer flow")
-
-        draft_key = self._extract_draft_key(html or "") or self._gen_draft_key()
-
-        await self.quick_faq_init(referer=referer, user_agent=user_agent, page="new_offer")
-        await self.create_offer_draft(
-            project_id=project_id,
-            csrftoken=csrftoken,
-            draft_key=draft_key,
-            referer=referer,
-            user_agent=user_agent,
+            csrftoken = self._extract_csrf_user_token(html)
+        if not csrftoken:
+            self.auth_lost = True
+            raise KworkWebAuthError(
+                "csrf_user_token cookie not found; cannot continue web offer flow"
+            )
+        self._csrf_user_token = csrftoken
+
+        draft_key = self._extract_draft_key(html) or self._gen_draft_key()
+
+        # Steps are called only when they run, so a failed step leaves no coroutine unawaited.
+        preflight: list[Callable[[], Coroutine[Any, Any, Any]]] = []
+        if not reuse_session_state or "new_offer" not in self._faq_pages:
+            preflight.append(
+                lambda: self.quick_faq_init(
+                    referer=referer, user_agent=user_agent, page="new_offer"
+                )
+            )
+        preflight.append(
+            lambda: self.create_offer_draft(
+                project_id=project_id,
+                csrftoken=csrftoken,
+                draft_key=draft_key,
+                referer=referer,
+                user_agent=user_agent,
+            )
         )
-        await self.check_is_template(
-            want_id=project_id,
-            description=description,
-            referer=referer,
-            user_agent=user_agent,
+        preflight.append(
+            lambda: self.check_is_template(
+                want_id=project_id,
+                description=description,
+                referer=referer,
+                user_agent=user_agent,
+            )
         )
+        if concurrent_preflight:
+            try:
+                # A failed step cancels its siblings.
+                async with asyncio.TaskGroup() as tg:
+                    for step in preflight:
+                        tg.create_task(step())
+            except ExceptionGroup as eg:
+                raise eg.exceptions[0] from None
+        else:
+            for step in preflight:
+                await step()
+        self._faq_pages.add("new_offer")
+
         return await self.create_exchange_offer(
             want_id=project_id,
             offer_type=offer_type,
@@ -489,3 +789,63 @@ class KworkWebClient:
             referer=referer,
             raise_on_error=raise_on_error,
         )
+
+    async def _submit_offer_result(
+        self,
+        offer: ExchangeOffer,
+        *,
+        user_agent: str | None,
+        raise_on_error: bool,
+        concurrent_preflight: bool,
+    ) -> OfferSubmitResult:
+        started = time.perf_counter()
+        try:
+            resp = await self.submit_exchange_offer(
+                project_id=offer.project_id,
+                offer_type=offer.offer_type,
+                description=offer.description,
+                kwork_duration=offer.kwork_duration,
+                kwork_price=offer.kwork_price,
+                kwork_name=offer.kwork_name,
+                user_agent=user_agent,
+                raise_on_error=raise_on_error,
+                reuse_session_state=True,
+                concurrent_preflight=concurrent_preflight,
+            )
+        except Exception as e:  # noqa: BLE001 - recorded per offer
+            return OfferSubmitResult(
+                project_id=offer.project_id, error=e, elapsed=time.perf_counter() - started
+            )
+        return OfferSubmitResult(
+            project_id=offer.project_id, response=resp, elapsed=time.perf_counter() - started
+        )
+
+    async def submit_exchange_offers(
+        self,
+        offers: Iterable[ExchangeOffer],
+        *,
+        concurrency: int = 4,
+        user_agent: str | None = None,
+        raise_on_error: bool = True,
+        concurrent_preflight: bool = False,
+    ) -> list[OfferSubmitResult]:
+        """
+        Submit many offers through this web session, at most `concurrency` at a time.
+
+        Results are in input order. Session state (csrf token, FAQ init) is reused between the
+        offers, and a failed offer is reported in its result instead of raising.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(offer: ExchangeOffer) -> OfferSubmitResult:
+            async with semaphore:
+                return await self._submit_offer_result(
+                    offer,
+                    user_agent=user_agent,
+                    raise_on_error=raise_on_error,
+                    concurrent_preflight=concurrent_preflight,
+                )
+
+        return list(await asyncio.gather(*(_one(offer) for offer in offers)))
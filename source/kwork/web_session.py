@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Self, TypeVar
+
+from kwork.api import KworkAPI
+from kwork.exceptions import KworkWebAuthError
+from kwork.web_client import (
+    DEFAULT_WEB_BASE_URL,
+    ExchangeOffer,
+    KworkWebClient,
+    OfferSubmitResult,
+    WebLoginResult,
+)
+
+if TYPE_CHECKING:
+    from kwork.transport import Transport
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# `expires_at` values below this are treated as a lifetime in seconds, not a Unix timestamp.
+_TIMESTAMP_THRESHOLD = 1_000_000_000
+
+
+@dataclass(slots=True)
+class _WebSlot:
+    client: KworkWebClient
+    session: Transport
+    login: WebLoginResult | None = None
+    # time.time() after which the web cookies are considered expired.
+    expires_at: float | None = None
+    checked_at: float = 0.0
+
+
+class WebSessionPool:
+    """
+    A few independent, automatically maintained kwork.ru web sessions of one account.
+
+    Every session has its own cookie jar, so offers can be submitted concurrently. A session is
+    (re-)logged in via `getWebAuthToken` when it is first used, `refresh_margin` seconds before
+    `WebLoginResult.expires_at` (or after `max_age` when the API reports no expiry), and when a
+    response shows that it was logged out (HTTP 401/403 or a redirect to the login page). Idle
+    sessions are probed with a GET of `health_path` at most every `health_check_interval` seconds.
+    """
+
+    def __init__(
+        self,
+        api: KworkAPI,
+        *,
+        size: int = 2,
+        refresh_margin: float = 60.0,
+        max_age: float = 6 * 3600,
+        health_check_interval: float | None = 300.0,
+        health_path: str = "/",
+        base_url: str = DEFAULT_WEB_BASE_URL,
+        url_to_redirect: str | None = "/",
+        user_agent: str | None = None,
+    ) -> None:
+        if size < 1:
+            raise ValueError("size must be >= 1")
+        if refresh_margin < 0:
+            raise ValueError("refresh_margin must be >= 0")
+        if max_age <= 0:
+            raise ValueError("max_age must be > 0")
+        if health_check_interval is not None and health_check_interval <= 0:
+            raise ValueError("health_check_interval must be > 0 or None")
+
+        self._api = api
+        self._size = size
+        self._refresh_margin = refresh_margin
+        self._max_age = max_age
+        self._health_check_interval = health_check_interval
+        self._health_path = health_path
+        self._base_url = base_url
+        self._url_to_redirect = url_to_redirect
+        self._user_agent = user_agent
+
+        self._idle: asyncio.Queue[_WebSlot] = asyncio.Queue()
+        self._slots: list[_WebSlot] = []
+        self.logins = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        await asyncio.gather(
+            *(slot.session.close() for slot in self._slots), return_exceptions=True
+        )
+        self._slots.clear()
+        self._idle = asyncio.Queue()
+
+    def _new_slot(self) -> _WebSlot:
+        # Same proxy/timeout as the API session, separate cookie jar.
+        session = self._api._create_session()
+        client = KworkWebClient(self._api, base_url=self._base_url, session=session)
+        slot = _WebSlot(client=client, session=session)
+        self._slots.append(slot)
+        return slot
+
+    async def _acquire(self) -> _WebSlot:
+        if self._idle.empty() and len(self._slots) < self._size:
+            return self._new_slot()
+        return await self._idle.get()
+
+    def _expired(self, slot: _WebSlot) -> bool:
+        if slot.login is None or slot.client.auth_lost:
+            return True
+        return slot.expires_at is not None and time.time() >= slot.expires_at - self._refresh_margin
+
+    async def _login(self, slot: _WebSlot) -> None:
+        slot.session.cookie_jar.clear()
+        result = await slot.client.login_via_mobile_web_auth_token(
+            url_to_redirect=self._url_to_redirect,
+            user_agent=self._user_agent,
+        )
+        if slot.client.auth_lost:
+            raise KworkWebAuthError(f"Web login did not establish a session: {result.final_url}")
+        now = time.time()
+        slot.login = result
+        slot.checked_at = now
+        if result.expires_at is None:
+            slot.expires_at = now + self._max_age
+        elif result.expires_at < _TIMESTAMP_THRESHOLD:
+            slot.expires_at = now + result.expires_at
+        else:
+            slot.expires_at = float(result.expires_at)
+        self.logins += 1
+        logger.debug("Web session logged in, expires at %s", slot.expires_at)
+
+    async def _health_check(self, slot: _WebSlot) -> None:
+        headers = {"User-Agent": self._user_agent} if self._user_agent else None
+        await slot.client.request("GET", self._health_path, headers=headers)
+        slot.checked_at = time.time()
+
+    async def _ensure_ready(self, slot: _WebSlot) -> None:
+        if (
+            not self._expired(slot)
+            and self._health_check_interval is not None
+            and time.time() - slot.checked_at >= self._health_check_interval
+        ):
+            await self._health_check(slot)
+        if self._expired(slot):
+            await self._login(slot)
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[KworkWebClient]:
+        """Borrow a logged-in web client; other callers get other sessions meanwhile."""
+        slot = await self._acquire()
+        try:
+            await self._ensure_ready(slot)
+            yield slot.client
+        finally:
+            self._idle.put_nowait(slot)
+
+    async def run(self, func: Callable[[KworkWebClient], Awaitable[_T]]) -> _T:
+        """
+        Call `func(web_client)` with a borrowed session.
+
+        If it fails with `KworkWebAuthError`, the session is logged in again and `func` is
+        retried once.
+        """
+        async with self.session() as client:
+            try:
+                return await func(client)
+            except KworkWebAuthError:
+                logger.info("Web session lost authentication, logging in again")
+                slot = next(s for s in self._slots if s.client is client)
+                await self._login(slot)
+                return await func(client)
+
+    async def submit_exchange_offers(
+        self,
+        offers: Iterable[ExchangeOffer],
+        *,
+        user_agent: str | None = None,
+        raise_on_error: bool = True,
+        concurrent_preflight: bool = False,
+    ) -> list[OfferSubmitResult]:
+        """
+        Submit many offers spread over the sessions of the pool (one offer per session at a
+        time). Results are in input order; see `KworkWebClient.submit_exchange_offers`.
+        """
+
+        async def _one(offer: ExchangeOffer) -> OfferSubmitResult:
+            started = time.perf_counter()
+
+            async def _submit(web: KworkWebClient) -> Any:
+                return await web.submit_exchange_offer(
+                    project_id=offer.project_id,
+                    offer_type=offer.offer_type,
+                    description=offer.description,
+                    kwork_duration=offer.kwork_duration,
+                    kwork_price=offer.kwork_price,
+                    kwork_name=offer.kwork_name,
+                    user_agent=user_agent,
+                    raise_on_error=raise_on_error,
+                    reuse_session_state=True,
+                    concurrent_preflight=concurrent_preflight,
+                )
+
+            try:
+                resp = await self.run(_submit)
+            except Exception as e:  # noqa: BLE001 - recorded per offer
+                return OfferSubmitResult(
+                    project_id=offer.project_id, error=e, elapsed=time.perf_counter() - started
+                )
+            return OfferSubmitResult(
+                project_id=offer.project_id, response=resp, elapsed=time.perf_counter() - started
+            )
+
+        return list(await asyncio.gather(*(_one(offer) for offer in offers)))
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "sessions": len(self._slots),
+            "idle": self._idle.qsize() + (self._size - len(self._slots)),
+            "logins": self.logins,
+        }
@@ -185,3 +185,82 @@ def test_timeout_error_message_is_informative() -> None:
         assert "TimeoutError" in str(ctx.value)
 
     asyncio.run(_run())
+
+
+def test_auth_error_relogins_once_and_retries_with_fresh_token() -> None:
+    async def _run() -> None:
+        api = KworkAPI(
+            login="x",
+            password="y",
+            retry_max_attempts=2,
+            retry_backoff_base=0.0,
+            retry_jitter=0.0,
+            relogin_on_auth_error=True,
+        )
+        api._token = "stale"
+        session = _FakeSession(
+            [
+                _FakeResponse(status=401, body="expired", content_type="text/plain"),
+                _FakeResponse(
+                    status=200,
+                    body=json.dumps({"success": True, "response": {"token": "fresh"}}),
+                ),
+                _FakeResponse(status=200, body=json.dumps({"success": True, "response": {}})),
+            ]
+        )
+        sent_tokens: list[str | None] = []
+        orig_request = session.request
+
+        def _request(**kwargs):
+            sent_tokens.append((kwargs.get("params") or {}).get("token"))
+            return orig_request(**kwargs)
+
+        session.request = _request  # type: ignore[method-assign]
+        api._session = session  # type: ignore[assignment]
+
+        await api.request("post", "actor", use_token=True)
+
+        # actor (stale) -> signIn (no token) -> actor (fresh)
+        assert sent_tokens == ["stale", None, "fresh"]
+        assert api._token == "fresh"
+
+    asyncio.run(_run())
+
+
+def test_auth_error_relogin_resends_mutation_once() -> None:
+    async def _run() -> None:
+        api = KworkAPI(
+            login="x",
+            password="y",
+            retry_max_attempts=3,
+            retry_backoff_base=0.0,
+            retry_jitter=0.0,
+            relogin_on_auth_error=True,
+        )
+        api._token = "stale"
+        session = _FakeSession(
+            [
+                _FakeResponse(status=401, body="expired", content_type="text/plain"),
+                _FakeResponse(
+                    status=200,
+                    body=json.dumps({"success": True, "response": {"token": "fresh"}}),
+                ),
+                _FakeResponse(status=200, body=json.dumps({"success": True, "response": {}})),
+            ]
+        )
+        sent: list[tuple[str, str | None]] = []
+        orig_request = session.request
+
+        def _request(**kwargs):
+            sent.append((kwargs["url"].name, (kwargs.get("params") or {}).get("token")))
+            return orig_request(**kwargs)
+
+        session.request = _request  # type: ignore[method-assign]
+        api._session = session  # type: ignore[assignment]
+
+        # inboxCreate is not idempotent: sent once, except for the resend after relogin.
+        await api.request("post", "inboxCreate", use_token=True)
+
+        assert sent == [("inboxCreate", "stale"), ("signIn", None), ("inboxCreate", "fresh")]
+
+    asyncio.run(_run())
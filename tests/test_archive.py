@@ -0,0 +1,157 @@
+import asyncio
+from typing import Any
+
+import pytest
+from kwork.archive import MessageArchive
+from kwork.client import KworkClient
+from kwork.schema import InboxMessage, Message
+
+
+def _msg(message_id: int, text: str, *, from_id: int = 1, to_id: int = 2, t: int = 0) -> dict:
+    return {
+        "message_id": message_id,
+        "from_id": from_id,
+        "from_username": f"user{from_id}",
+        "to_id": to_id,
+        "to_username": f"user{to_id}",
+        "message": text,
+        "time": t or message_id,
+    }
+
+
+def test_search_matches_words() -> None:
+    async def _run() -> None:
+        archive = MessageArchive()
+        archive.add_messages(
+            [
+                _msg(1, "Привет, нужен логотип для кофейни"),
+                _msg(2, "Logo draft is ready", from_id=3, to_id=2),
+                InboxMessage(message_id=3, from_id=2, to_id=1, message="логотип готов", time=3),
+            ]
+        )
+        await archive.flush()
+
+        assert [m.message_id for m in await archive.search("логотип")] == [3, 1]
+        assert await archive.search("лого коф") == []
+        assert [m.message_id for m in await archive.search("лого коф", prefix=True)] == [1]
+        assert [m.message_id for m in await archive.search("LOGO")] == [2]
+        assert [m.message_id for m in await archive.search("логотип", user_id=1)] == [3, 1]
+        assert await archive.search("логотип", user_id=3) == []
+        assert [m.message_id for m in await archive.search("логотип", since=2)] == [3]
+        # FTS5 syntax in user input is matched literally instead of failing.
+        assert await archive.search('"OR ( NEAR') == []
+        assert await archive.search("   ") == []
+
+        archive.add_messages([_msg(1, "сообщение отредактировано")])
+        await archive.flush()
+        assert await archive.search("кофейни") == []
+        assert [m.text for m in await archive.search("отредактировано")] == [
+            "сообщение отредактировано"
+        ]
+        stats = await archive.stats()
+        assert (stats.messages, stats.pending) == (3, 0)
+        await archive.close()
+
+    asyncio.run(_run())
+
+
+def test_background_writer_batches_items_and_events() -> None:
+    async def _run() -> None:
+        archive = MessageArchive(flush_interval=0.01)
+        archive.add_messages([_msg(n, f"message {n}") for n in range(1, 4)])
+        archive.add_event(
+            Message(api=None, from_id=5, text="from the websocket", inbox_id=10)  # type: ignore[arg-type]
+        )
+        assert not archive.add_event(Message(api=None, from_id=5, text="no id"))  # type: ignore[arg-type]
+        await asyncio.sleep(0.1)
+        assert (await archive.stats()).messages == 4
+        assert [m.from_id for m in await archive.search("websocket")] == [5]
+        await archive.close()
+        with pytest.raises(RuntimeError):
+            archive.add_messages([_msg(20, "late")])
+
+    asyncio.run(_run())
+
+
+def test_flush_marks_dialogs_synced_with_the_last_chunk() -> None:
+    async def _run() -> None:
+        archive = MessageArchive(batch_size=2)
+        written: list[tuple[int, list[Any]]] = []
+        write = archive._write
+
+        def _write(messages: list[Any], dialogs: list[Any], synced: list[Any]) -> None:
+            written.append((len(messages), synced))
+            write(messages, dialogs, synced)
+
+        archive._write = _write  # type: ignore[method-assign]
+        archive.add_messages([_msg(n, f"message {n}", from_id=7) for n in range(1, 6)])
+        archive.mark_synced(7, "user7", last_message_id=5)
+        archive.mark_synced(7, last_message_id=3)  # never moves back
+        assert await archive.synced_until(7) == 5
+        await archive.flush()
+        assert written == [(2, []), (2, []), (1, [(7, "user7", 5)])]
+        assert await archive.synced_until(7) == 5
+        assert await archive.synced_until() == 5
+        assert (await archive.stats()).synced_dialogs == 1
+        await archive.close()
+
+    asyncio.run(_run())
+
+
+def test_client_searches_synced_dialogs_locally() -> None:
+    async def _run() -> None:
+        archive = MessageArchive()
+        client = KworkClient("login", "password", message_archive=archive)
+        calls: list[tuple[str, dict[str, Any]]] = []
+
+        async def fake_request(method: str, endpoint: str, **params: Any) -> dict[str, Any]:
+            calls.append((endpoint, params))
+            if endpoint == "inboxes":
+                return {
+                    "success": True,
+                    "response": [
+                        _msg(1, "нужен сайт", from_id=7),
+                        _msg(2, "когда готов сайт?", to_id=7),
+                    ],
+                    "paging": {"pages": 1},
+                }
+            if endpoint == "searchInboxes" and params["userId"] == 7:
+                # An old message (already archived, edited since) and one after the sync.
+                return {
+                    "success": True,
+                    "response": [_msg(60, "сайт готов", from_id=7), _msg(1, "сайт", from_id=7)],
+                }
+            if endpoint == "searchInboxes":
+                return {"success": True, "response": [_msg(50, "сайт на тильде", from_id=9)]}
+            raise AssertionError(endpoint)
+
+        client.request = fake_request  # type: ignore[method-assign]
+
+        await client.get_dialog_with_user("user7")
+        assert await archive.synced_until(7) == 2
+        assert await archive.synced_until(9) is None
+        # A synced dialog is answered by the archive alone.
+        found = await client.search_archived_messages("сайт", user_id=7)
+        assert [m.message_id for m in found] == [2, 1]
+        assert [endpoint for endpoint, _ in calls] == ["inboxes"]
+
+        # On request the API supplies messages newer than the watermark only.
+        found = await client.search_archived_messages("сайт", user_id=7, remote_fallback=True)
+        assert [m.message_id for m in found] == [60, 2, 1]
+        assert found[-1].text == "нужен сайт"
+        assert [endpoint for endpoint, _ in calls] == ["inboxes", "searchInboxes"]
+        assert (
+            len(await client.search_archived_messages("сайт", user_id=7, remote_fallback=False))
+            == 3
+        )
+
+        # Dialogs that aren't archived yet fall back to the API and get archived on the way.
+        found = await client.search_archived_messages("сайт", user_id=9)
+        assert [m.message_id for m in found] == [50]
+        assert calls[-1] == ("searchInboxes", {"use_token": True, "query": "сайт", "userId": 9})
+        await archive.flush()
+        assert (await archive.stats()).messages == 4
+        await client.close()
+        await archive.close()
+
+    asyncio.run(_run())
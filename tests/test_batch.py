@@ -0,0 +1,94 @@
+import asyncio
+from typing import Any
+
+import pytest
+from kwork.batch import LookupCache, batch_lookup
+from kwork.client import KworkClient
+from kwork.schema import User
+
+
+def test_batch_lookup_dedupes_bounds_concurrency_and_keeps_order() -> None:
+    calls: list[int] = []
+    in_flight = 0
+    peak = 0
+
+    async def fetch(item_id: int) -> dict[str, Any]:
+        nonlocal in_flight, peak
+        calls.append(item_id)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if item_id == 3:
+            raise RuntimeError("boom")
+        return {"id": item_id}
+
+    async def _run() -> None:
+        result = await batch_lookup([5, 1, 3, 5, 2, 4], fetch, dict, concurrency=2)
+        assert sorted(calls) == [1, 2, 3, 4, 5]
+        assert peak == 2
+        assert [item.id for item in result.items] == [5, 1, 3, 5, 2, 4]
+        assert result.items[0] is result.items[3]
+        assert set(result.values) == {1, 2, 4, 5}
+        assert isinstance(result.errors[3], RuntimeError)
+        assert [item.id for item in result.failed] == [3]
+
+    asyncio.run(_run())
+
+
+def test_batch_lookup_uses_cache_and_skips_failures() -> None:
+    cache: LookupCache[int, dict[str, Any]] = LookupCache(maxsize=10, ttl=None)
+    cache.set(1, {"id": 1})
+    calls: list[int] = []
+
+    async def fetch(item_id: int) -> dict[str, Any]:
+        calls.append(item_id)
+        if item_id == 3:
+            raise RuntimeError("boom")
+        return {"id": item_id}
+
+    async def _run() -> None:
+        result = await batch_lookup([1, 2, 3], fetch, dict, cache=cache)
+        assert calls == [2, 3]
+        assert [item.cached for item in result.items] == [True, False, False]
+        assert cache.get(2) == {"id": 2}
+        assert cache.get(3) is None
+
+    asyncio.run(_run())
+
+
+def test_lookup_cache_expires_and_evicts() -> None:
+    now = 0.0
+    cache: LookupCache[int, str] = LookupCache(maxsize=2, ttl=10, clock=lambda: now)
+    cache.set(1, "a")
+    cache.set(2, "b")
+    assert cache.get(1) == "a"  # 1 becomes most recently used
+    cache.set(3, "c")
+    assert cache.get(2) is None
+    now = 11.0
+    assert cache.get(1) is None
+    assert len(cache) == 1
+
+    with pytest.raises(ValueError):
+        LookupCache(ttl=0)
+
+
+def test_client_get_users_builds_models_and_caches() -> None:
+    client = KworkClient(login="x", password="y")
+    calls: list[dict[str, Any]] = []
+
+    async def fake_request(method: str, endpoint: str, **params: Any) -> dict[str, Any]:
+        calls.append(params)
+        return {"success": True, "response": {"id": params["id"], "username": f"u{params['id']}"}}
+
+    client.request = fake_request  # type: ignore[method-assign]
+
+    async def _run() -> None:
+        first = await client.get_users([2, 1, 2])
+        assert [u.username for u in first.values.values()] == ["u2", "u1"]
+        assert all(isinstance(item.value, User) for item in first.items)
+        second = await client.get_users([1, 3])
+        assert [item.cached for item in second.items] == [True, False]
+
+    asyncio.run(_run())
+    assert [c["id"] for c in calls] == [2, 1, 3]
@@ -0,0 +1,81 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+from kwork.cassette import Cassette
+from kwork.client import KworkClient
+from kwork.exceptions import KworkException
+from kwork.testing import FakeKworkServer, FaultConfig
+
+
+async def _exercise(client: KworkClient) -> tuple[list[int | None], str]:
+    projects = await client.get_projects([11])
+    channel = await client.get_channel()
+    return [p.id for p in projects], channel
+
+
+def test_record_then_replay_without_network(tmp_path: Path) -> None:
+    path = tmp_path / "session.jsonl.gz"
+
+    async def _record() -> tuple[list[int | None], str]:
+        async with (
+            FakeKworkServer(faults=FaultConfig(latency=0.02)) as server,
+            KworkClient(
+                "me", "secret", api_host=server.api_host, cassette=Cassette.record(path)
+            ) as client,
+        ):
+            return await _exercise(client)
+
+    async def _replay(time_scale: float) -> tuple[tuple[list[int | None], str], float]:
+        cassette = Cassette.replay(path, time_scale=time_scale)
+        # Unreachable host: replay must not open connections.
+        async with KworkClient(
+            "me", "secret", api_host="http://127.0.0.1:9/{}", cassette=cassette
+        ) as client:
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            out = await _exercise(client)
+            assert cassette.remaining() == 0
+            return out, loop.time() - started
+
+    recorded = asyncio.run(_record())
+    replayed, fast = asyncio.run(_replay(0))
+    assert replayed == recorded
+    _, original = asyncio.run(_replay(1.0))
+    assert original >= 0.05 > fast
+
+
+def test_cassette_is_redacted_and_compact(tmp_path: Path) -> None:
+    path = tmp_path / "session.jsonl"
+
+    async def _run() -> None:
+        async with (
+            FakeKworkServer() as server,
+            KworkClient(
+                "me", "secret", api_host=server.api_host, cassette=Cassette.record(path)
+            ) as client,
+        ):
+            await client.get_channel()
+
+    asyncio.run(_run())
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [(line["method"], line["endpoint"]) for line in lines] == [
+        ("POST", "signIn"),
+        ("POST", "getChannel"),
+    ]
+    assert "secret" not in path.read_text(encoding="utf-8")
+    assert json.loads(lines[0]["body"])["response"]["token"] == "<redacted>"
+    assert lines[1]["params"]["token"] == "<redacted>"
+
+
+def test_replay_runs_out_of_responses(tmp_path: Path) -> None:
+    path = tmp_path / "empty.jsonl"
+    path.write_text("", encoding="utf-8")
+
+    async def _run() -> None:
+        async with KworkClient("me", "pw", cassette=Cassette.replay(path)) as client:
+            with pytest.raises(KworkException, match="No recorded response"):
+                await client.request("post", "ping")
+
+    asyncio.run(_run())
@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+from kwork.circuit import CircuitBreaker
+from kwork.client import KworkClient
+from kwork.exceptions import KworkCircuitOpen, KworkHTTPException
+from kwork.testing import FakeKworkServer
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_breaker_opens_on_failure_ratio_and_closes_after_trial() -> None:
+    clock = _Clock()
+    changes: list[tuple[str, str, str]] = []
+    breaker = CircuitBreaker(
+        failure_ratio=0.5,
+        min_calls=4,
+        window=4,
+        open_for=10.0,
+        clock=clock,
+        on_state_change=lambda key, old, new: changes.append((key, old, new)),
+    )
+    key = breaker.key("api.kwork.ru", "projects")
+    assert key == "api.kwork.ru/projects"
+
+    breaker.acquire(key).success()
+    breaker.acquire(key).failure()
+    breaker.acquire(key).success()
+    assert breaker.state(key).state == "closed"
+    breaker.acquire(key).failure()
+    assert breaker.state(key).state == "open"
+
+    with pytest.raises(KworkCircuitOpen) as exc_info:
+        breaker.acquire(key)
+    assert exc_info.value.retry_after == pytest.approx(10.0)
+    # Other endpoints are not affected.
+    breaker.acquire(breaker.key("api.kwork.ru", "actor")).success()
+
+    clock.now = 10.0
+    trial = breaker.acquire(key)
+    assert breaker.state(key).state == "half_open"
+    with pytest.raises(KworkCircuitOpen):
+        breaker.acquire(key)  # only one trial at a time
+    trial.failure()
+    assert breaker.state(key).state == "open"
+
+    clock.now = 20.0
+    breaker.acquire(key).success()
+    state = breaker.state(key)
+    assert (state.state, state.calls, state.rejected) == ("closed", 0, 2)
+    assert [c[2] for c in changes] == ["open", "half_open", "open", "half_open", "closed"]
+
+
+def test_released_trial_permit_frees_the_slot() -> None:
+    clock = _Clock()
+    breaker = CircuitBreaker(min_calls=1, window=1, open_for=1.0, clock=clock)
+    breaker.acquire("k").failure()
+    clock.now = 1.0
+    permit = breaker.acquire("k")
+    permit.release()  # e.g. cancelled
+    permit.success()  # ignored after release
+    assert breaker.state("k").state == "half_open"
+    breaker.acquire("k").success()
+    assert breaker.state("k").state == "closed"
+
+
+def test_client_fails_fast_while_circuit_is_open() -> None:
+    async def _run() -> None:
+        async with FakeKworkServer(projects=5) as server:
+            breaker = CircuitBreaker(min_calls=2, window=2, open_for=60.0, scope="host")
+            async with KworkClient(
+                "me",
+                "pw",
+                api_host=server.api_host,
+                retry_max_attempts=5,
+                retry_backoff_base=0,
+                circuit_breaker=breaker,
+            ) as client:
+                await client.get_token()
+                server.fail_next("projects", 503, times=10)
+                with pytest.raises(KworkCircuitOpen):
+                    await client.get_projects([11])
+                # signIn succeeded and projects failed: 1 of 2 is enough, retries are cut short.
+                assert server.stats["projects"].requests == 1
+
+                with pytest.raises(KworkCircuitOpen):
+                    await client.get_connects()
+                assert client.circuit_breaker is breaker
+                (state,) = breaker.states().values()
+                assert state.state == "open"
+                assert state.rejected == 2
+
+            breaker.reset()
+            async with KworkClient(
+                "me", "pw", api_host=server.api_host, circuit_breaker=breaker
+            ) as client:
+                # The request that opens the circuit still gets its own error.
+                with pytest.raises(KworkHTTPException):
+                    await client.get_projects([11])
+                (state,) = breaker.states().values()
+                assert (state.state, state.calls, state.failures) == ("open", 2, 1)
+
+    asyncio.run(_run())
@@ -0,0 +1,71 @@
+import asyncio
+import time
+
+import pytest
+from kwork.client import KworkClient
+from kwork.deadline import current_deadline, deadline, time_left
+from kwork.exceptions import KworkDeadlineExceeded, KworkRetryExceeded
+from kwork.testing import FakeKworkServer, FaultConfig
+
+
+def test_deadline_scopes_nest_and_only_shorten() -> None:
+    assert current_deadline() is None
+    with deadline(10) as outer:
+        assert outer is not None
+        with deadline(100) as inner:
+            assert inner == outer
+        with deadline(1) as inner:
+            assert inner is not None and inner < outer
+            left = time_left()
+            assert left is not None and 0 < left <= 1
+        with deadline(None) as same:
+            assert same == outer
+        assert current_deadline() == outer
+    assert time_left() is None
+
+    with pytest.raises(ValueError), deadline(-1):
+        pass
+
+
+def test_retries_and_backoff_stop_at_the_deadline() -> None:
+    async def _run() -> None:
+        async with (
+            FakeKworkServer(projects=5) as server,
+            KworkClient(
+                "me",
+                "pw",
+                api_host=server.api_host,
+                retry_max_attempts=10,
+                retry_backoff_base=0.2,
+                retry_backoff_max=0.2,
+                retry_jitter=0,
+            ) as client,
+        ):
+            await client.get_token()
+            server.fail_next("projects", 503, times=10)
+            started = time.monotonic()
+            with pytest.raises(KworkDeadlineExceeded) as exc_info:
+                await client.request("post", "projects", use_token=True, deadline=0.5)
+            assert time.monotonic() - started < 0.5
+            assert isinstance(exc_info.value, KworkRetryExceeded)
+            # 0s, 0.2s, 0.4s; a fourth attempt would start after the deadline.
+            assert exc_info.value.attempts == 3
+            assert server.stats["projects"].requests == 3
+
+    asyncio.run(_run())
+
+
+def test_context_deadline_clips_attempt_timeouts_of_nested_calls() -> None:
+    async def _run() -> None:
+        async with (
+            FakeKworkServer(faults=FaultConfig(latency=2.0)) as server,
+            KworkClient("me", "pw", api_host=server.api_host, timeout=30) as client,
+        ):
+            started = time.monotonic()
+            with pytest.raises(KworkDeadlineExceeded) as exc_info, deadline(0.3):
+                # signIn (called from get_token) inherits the deadline too.
+                await client.get_all_dialogs()
+            assert time.monotonic() - started < 1.5
+            assert isinstance(exc_info.value.last_error, asyncio.TimeoutError)
+
+    asyncio.run(_run())
@@ -0,0 +1,157 @@
+import asyncio
+import importlib.util
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+import aiohttp
+import pytest
+from kwork.api import KworkAPI
+from kwork.endpoint_policy import EndpointPolicies
+from kwork.exceptions import KworkRetryExceeded
+from kwork.openapi_policies import ENDPOINT_POLICIES
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _load_generator() -> Any:
+    path = ROOT / "scripts" / "generate_openapi_mixin.py"
+    spec = importlib.util.spec_from_file_location("generate_openapi_mixin", path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class _Response:
+    status = 200
+    content_type = "application/json"
+    headers: dict[str, str] = {}  # noqa: RUF012
+
+    async def text(self, *, errors: str = "strict") -> str:
+        return json.dumps({"success": True, "response": [{"id": 1}]})
+
+
+class _Ctx:
+    def __init__(self, outcome: _Response | BaseException) -> None:
+        self._outcome = outcome
+
+    async def __aenter__(self) -> _Response:
+        if isinstance(self._outcome, BaseException):
+            raise self._outcome
+        return self._outcome
+
+    async def __aexit__(self, *_exc: object) -> bool:
+        return False
+
+
+class _Session:
+    closed = False
+
+    def __init__(self, outcomes: list[_Response | BaseException]) -> None:
+        self._outcomes = outcomes
+        self.calls: list[dict[str, Any]] = []
+
+    def request(self, **kwargs: Any) -> _Ctx:
+        self.calls.append(kwargs)
+        return _Ctx(self._outcomes.pop(0))
+
+
+def _api(session: _Session, policies: EndpointPolicies) -> KworkAPI:
+    api = KworkAPI("login", "password", retry_backoff_base=0.0, endpoint_policies=policies)
+    api._session = session  # type: ignore[assignment]
+    api._token = "tok"
+    return api
+
+
+def test_registry_is_generated_from_spec() -> None:
+    gen = _load_generator()
+    spec = gen.load_spec()
+    endpoints = sorted(endpoint for _, _, endpoint, _ in gen.iter_operations(spec))
+    assert sorted(ENDPOINT_POLICIES) == endpoints
+
+    assert ENDPOINT_POLICIES["projects"].idempotent
+    assert ENDPOINT_POLICIES["projects"].auth == "token"
+    assert not ENDPOINT_POLICIES["projects"].cacheable
+    assert ENDPOINT_POLICIES["categories"].cacheable
+    assert not ENDPOINT_POLICIES["inboxCreate"].idempotent
+    assert ENDPOINT_POLICIES["inboxCreate"].content == "form"
+    assert ENDPOINT_POLICIES["notificationsFetch"].rate_limit == "write"
+    upload = ENDPOINT_POLICIES["fileUpload"]
+    assert (upload.content, upload.rate_limit, upload.timeout) == ("multipart", "upload", 120.0)
+    assert ENDPOINT_POLICIES["signIn"].rate_limit == "auth"
+    assert not ENDPOINT_POLICIES["signIn"].cacheable
+
+
+def test_reads_are_retried_and_mutations_sent_once() -> None:
+    async def _run() -> None:
+        session = _Session([aiohttp.ClientConnectionError("reset"), _Response()])
+        api = _api(session, EndpointPolicies(read_max_attempts=2))
+        assert (await api.request("post", "projects", use_token=True))["success"]
+        assert len(session.calls) == 2
+
+        session = _Session([aiohttp.ClientConnectionError("reset")])
+        api = _api(session, EndpointPolicies(read_max_attempts=2))
+        with pytest.raises(KworkRetryExceeded):
+            await api.request("post", "inboxCreate", use_token=True, user_id=1, text="hi")
+        assert len(session.calls) == 1
+
+        # Explicit opt-in still wins for mutations; unknown endpoints count as mutations.
+        session = _Session([aiohttp.ClientConnectionError("reset"), _Response()])
+        api = _api(session, EndpointPolicies())
+        await api.request("post", "inboxCreate", use_token=True, max_attempts=2)
+        assert len(session.calls) == 2
+        assert not api.endpoint_policies.get("someNewEndpoint").idempotent  # type: ignore[union-attr]
+
+    asyncio.run(_run())
+
+
+def test_default_client_sends_mutations_once() -> None:
+    async def _run() -> None:
+        session = _Session([aiohttp.ClientConnectionError("reset")] * 3)
+        api = KworkAPI("login", "password", retry_max_attempts=3, retry_backoff_base=0.0)
+        api._session = session  # type: ignore[assignment]
+        api._token = "tok"
+        with pytest.raises(KworkRetryExceeded):
+            await api.request("post", "inboxCreate", use_token=True, user_id=1, text="hi")
+        assert len(session.calls) == 1
+
+        # Reads keep `retry_max_attempts`, and nothing is cached without explicit policies.
+        session._outcomes = [aiohttp.ClientConnectionError("reset"), *[_Response()] * 3]
+        await api.request("post", "projects", use_token=True)
+        await api.request("post", "categories")
+        await api.request("post", "categories")
+        assert len(session.calls) == 5
+
+    asyncio.run(_run())
+
+
+def test_public_reads_are_cached_and_copied() -> None:
+    async def _run() -> None:
+        session = _Session([_Response(), _Response(), _Response()])
+        policies = EndpointPolicies()
+        policies.override("categories", timeout=5.0)
+        api = _api(session, policies)
+
+        first = await api.request("post", "categories")
+        first["response"].append("mutated")
+        second = await api.request("post", "categories")
+        assert second["response"] == [{"id": 1}]
+        assert len(session.calls) == 1
+        assert session.calls[0]["timeout"].total == 5.0
+
+        # Different params, or a token, bypass the cached entry.
+        await api.request("post", "categories", lang="en")
+        await api.request("post", "categories", use_token=True)
+        assert len(session.calls) == 3
+
+    asyncio.run(_run())
+
+
+def test_validation() -> None:
+    with pytest.raises(ValueError):
+        EndpointPolicies(read_max_attempts=0)
+    with pytest.raises(ValueError):
+        EndpointPolicies(cache_ttl=0)
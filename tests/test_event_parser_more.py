@@ -2,7 +2,7 @@ import asyncio
 import json
 from unittest.mock import AsyncMock
 
-from kwork.event_parser import EventParser, _parse_event_text_payload
+from kwork.event_parser import EventParser, LatestMessageResolver, _parse_event_text_payload
 from kwork.schema import BaseEvent, DialogMessage, EventType, InboxMessage, Message
 
 
@@ -49,10 +49,11 @@ def test_extract_message_notify_from_dialogs_uses_last_dialog() -> None:
 
 def test_extract_message_notify_from_dialog_data_fetches_dialog_messages() -> None:
     class _Client:
-        get_dialog_with_user = AsyncMock(
-            return_value=[
-                InboxMessage(message_id=11, from_id=3, to_id=4, message="hey"),
-            ]
+        get_dialog_with_user_page = AsyncMock(
+            return_value=(
+                [InboxMessage(message_id=11, from_id=3, to_id=4, message="hey")],
+                {"pages": 40},
+            )
         )
 
     client = _Client()
@@ -69,14 +70,16 @@ def test_extract_message_notify_from_dialog_data_fetches_dialog_messages() -> No
     assert msg.text == "hey"
     assert msg.to_user_id == 4
     assert msg.inbox_id == 11
+    client.get_dialog_with_user_page.assert_awaited_once_with("u1", page=1)
 
 
 def test_extract_message_popup_notify_fetches_dialog_messages() -> None:
     class _Client:
-        get_dialog_with_user = AsyncMock(
-            return_value=[
-                InboxMessage(message_id=12, from_id=5, to_id=6, message="yo"),
-            ]
+        get_dialog_with_user_page = AsyncMock(
+            return_value=(
+                [InboxMessage(message_id=12, from_id=5, to_id=6, message="yo")],
+                {"pages": 40},
+            )
         )
 
     client = _Client()
@@ -91,3 +94,54 @@ def test_extract_message_popup_notify_fetches_dialog_messages() -> None:
     assert msg is not None
     assert msg.from_id == 5
     assert msg.text == "yo"
+    client.get_dialog_with_user_page.assert_awaited_once_with("u1", page=1)
+
+
+def test_latest_message_resolver_single_flights_and_drops_repeats() -> None:
+    calls: list[str] = []
+    latest = {"u1": 101, "u2": 102}
+
+    class _Client:
+        async def get_dialog_with_user_page(
+            self, login: str, *, page: int
+        ) -> tuple[list[InboxMessage], dict[str, int]]:
+            calls.append(login)
+            await asyncio.sleep(0.01)
+            message = InboxMessage(message_id=latest[login], from_id=3, message=f"m{latest[login]}")
+            return [message], {"pages": 9}
+
+    async def _run() -> None:
+        resolver = LatestMessageResolver(_Client())  # type: ignore[arg-type]
+        first, second = await asyncio.gather(resolver.resolve("u1"), resolver.resolve("u1"))
+        assert calls == ["u1"]
+        # Both lookups shared the request; the message is returned once.
+        assert [m.message_id for m in (first, second) if m is not None] == [101]
+
+        # Two distinct messages in quick succession: the second is fetched, not served stale.
+        latest["u1"] = 103
+        third = await resolver.resolve("u1")
+        assert third is not None and (third.message_id, third.message) == (103, "m103")
+        assert await resolver.resolve("u1") is None
+        assert calls == ["u1", "u1", "u1"]
+        assert resolver.latest_message_id("u1") == 103
+        resolver.invalidate("u1")
+        assert (await resolver.resolve("u1")).message_id == 103  # type: ignore[union-attr]
+
+        # A notify + pop_up_notify pair for the same message costs one request and one event.
+        parser = EventParser(_Client())  # type: ignore[arg-type]
+        notify = BaseEvent(
+            event=EventType.NOTIFY,
+            data={"new_message": True, "dialog_data": [{"login": "u2"}]},
+        )
+        popup = BaseEvent(
+            event=EventType.POP_UP_NOTIFY,
+            data={"pop_up_notify": {"data": {"username": "u2"}}},
+        )
+        messages = await asyncio.gather(
+            parser.extract_message(notify), parser.extract_message(popup)
+        )
+        assert [m.inbox_id for m in messages if m is not None] == [102]
+        assert parser.latest_messages.latest_message_id("u2") == 102
+        assert calls.count("u2") == 1
+
+    asyncio.run(_run())
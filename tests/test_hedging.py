@@ -0,0 +1,103 @@
+import asyncio
+import time
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from kwork.api import KworkAPI
+from kwork.hedging import RequestHedger
+
+
+def test_delay_follows_latency_percentile() -> None:
+    hedger = RequestHedger(
+        min_samples=5, window=10, initial_delay=0.5, min_delay=0.01, max_delay=1.0
+    )
+    assert hedger.delay("dialogs") == 0.5
+    for elapsed in (0.1, 0.2, 0.3, 0.4, 5.0):
+        hedger._observe("dialogs", elapsed)
+    # p95 of 5 samples is the 4th smallest; 5.0 would be clipped to max_delay anyway.
+    assert hedger.delay("dialogs") == 0.4
+    assert hedger.stats().delays == {"dialogs": 0.4}
+    assert hedger.applies("inboxes")
+    assert not hedger.applies("offerCreate")
+    # Only the first page of a paginated read is hedged.
+    assert hedger.applies("dialogs", {"page": 1, "token": "t"})
+    assert hedger.applies("dialogs", {"page": "1"})
+    assert not hedger.applies("dialogs", {"page": 2})
+
+
+def test_slow_read_is_hedged_and_rate_capped() -> None:
+    calls: list[str] = []
+
+    async def handler(request: web.Request) -> web.Response:
+        calls.append(request.match_info["endpoint"])
+        n = len(calls)
+        if n in (1, 3):  # the first request of the dialogs and inboxes calls is slow
+            await asyncio.sleep(0.5)
+        return web.json_response({"success": True, "n": n})
+
+    async def _run() -> None:
+        app = web.Application()
+        app.router.add_post("/{endpoint}", handler)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            hedger = RequestHedger(initial_delay=0.05, max_ratio=0.0, burst=1.0)
+            async with KworkAPI(
+                "x", "y", api_host=str(server.make_url("/")) + "{}", hedging=hedger
+            ) as api:
+                started = time.monotonic()
+                data = await api.request("post", "dialogs")
+                assert time.monotonic() - started < 0.4
+                assert data["n"] == 2  # the hedge answered first
+
+                # The only hedge token is spent: the next slow call just waits.
+                data = await api.request("post", "inboxes")
+                assert data["n"] == 3
+
+                # Not a hedged endpoint.
+                data = await api.request("post", "offerCreate")
+                assert data["n"] == 4
+
+                stats = hedger.stats()
+                assert (stats.requests, stats.hedged, stats.hedge_wins, stats.rate_limited) == (
+                    2,
+                    1,
+                    1,
+                    1,
+                )
+        finally:
+            await server.close()
+
+    asyncio.run(_run())
+
+
+def test_error_status_does_not_win_the_race() -> None:
+    calls: list[int] = []
+
+    async def handler(request: web.Request) -> web.Response:
+        calls.append(len(calls) + 1)
+        if len(calls) == 1:
+            await asyncio.sleep(0.2)
+            return web.json_response({"success": True, "n": 1})
+        return web.json_response({"success": False}, status=502)
+
+    async def _run() -> None:
+        app = web.Application()
+        app.router.add_post("/{endpoint}", handler)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            hedger = RequestHedger(initial_delay=0.02)
+            async with KworkAPI(
+                "x", "y", api_host=str(server.make_url("/")) + "{}", hedging=hedger
+            ) as api:
+                # The hedge fails fast with 502; the slow first request still wins.
+                data = await api.request("post", "dialogs")
+                assert data["n"] == 1
+                assert calls == [1, 2]
+                stats = hedger.stats()
+                assert (stats.hedged, stats.hedge_wins) == (1, 0)
+        finally:
+            await server.close()
+
+    asyncio.run(_run())
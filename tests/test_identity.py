@@ -0,0 +1,80 @@
+import asyncio
+import gc
+from typing import Any
+
+import pytest
+from kwork.client import KworkClient
+from kwork.identity import IdentityMap
+from kwork.schema import DialogMessage, KworkObject, WantWorker
+
+
+def _dialog(user_id: int, **fields: Any) -> dict[str, Any]:
+    return {
+        "user_id": user_id,
+        # Built at runtime, like decoded JSON: equal strings are distinct objects.
+        "username": f"user{user_id}",
+        "profilepicture": f"https://cdn.kwork.ru/{user_id}.jpg",
+        **fields,
+    }
+
+
+def test_canonical_instances_are_updated_in_place() -> None:
+    identity = IdentityMap()
+    first = identity.canonical(DialogMessage.model_validate(_dialog(1, unread_count=2)))
+    second = identity.canonical(DialogMessage.model_validate(_dialog(1, last_message="hi")))
+
+    assert second is first
+    assert (first.unread_count, first.last_message) == (2, "hi")
+    assert {"unread_count", "last_message"} <= first.model_fields_set
+    assert (identity.hits, identity.misses, len(identity)) == (1, 1, 1)
+
+    # Strings are shared across endpoints and models.
+    user_id = 1
+    want = identity.canonical(
+        WantWorker.model_validate({"id": 5, "user_id": user_id, "username": f"user{user_id}"})
+    )
+    assert want.username is first.username
+    assert identity.get(WantWorker, 5) is want
+    assert identity.get(DialogMessage, 2) is None
+
+    # Models without an id are interned but not registered.
+    anonymous = identity.canonical(DialogMessage(username=f"user{user_id}"))
+    assert anonymous.username is first.username
+    assert len(identity) == 2
+
+
+def test_nested_models_are_canonical_and_released() -> None:
+    identity = IdentityMap()
+    worker = {"id": 7, "username": "worker"}
+    first = identity.canonical(KworkObject.model_validate({"id": 1, "worker": worker}))
+    second = identity.canonical(KworkObject.model_validate({"id": 2, "worker": worker}))
+    assert first.worker is second.worker
+    assert len(identity) == 3
+
+    del first, second
+    gc.collect()
+    assert len(identity) == 0
+
+    with pytest.raises(ValueError):
+        IdentityMap(max_intern_length=-1)
+
+
+def test_client_returns_shared_models() -> None:
+    async def _run() -> None:
+        client = KworkClient("login", "password", identity_map=IdentityMap())
+
+        async def fake_request(method: str, endpoint: str, **params: Any) -> dict[str, Any]:
+            return {"success": True, "response": [_dialog(1), _dialog(2)]}
+
+        client.request = fake_request  # type: ignore[method-assign]
+
+        first = await client.get_dialogs_page()
+        second = await client.get_dialogs_page()
+        assert all(a is b for a, b in zip(first, second, strict=True))
+        # Lazy wrappers bypass the map.
+        lazy = await client.get_dialogs_page(lazy=True)
+        assert lazy[0] is not first[0]
+        assert client.identity_map is not None and len(client.identity_map) == 2
+        await client.close()
+
+    asyncio.run(_run())
@@ -0,0 +1,45 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import kwork
+from kwork.bot import KworkBot
+from kwork.client import KworkClient
+
+SOURCE = Path(__file__).resolve().parents[1] / "source"
+
+
+def _loaded_after(stmt: str) -> set[str]:
+    code = f"import sys; {stmt}; print('\\n'.join(sys.modules))"
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        env={"PYTHONPATH": str(SOURCE)},
+        text=True,
+    )
+    return set(out.stdout.split())
+
+
+def test_import_kwork_does_not_load_heavy_modules() -> None:
+    loaded = _loaded_after("import kwork")
+    heavy = {"kwork.client", "kwork.bot", "kwork.openapi_mixin", "websockets", "aiohttp"}
+    assert not heavy & loaded
+
+
+def test_client_does_not_load_bot_or_web_client() -> None:
+    loaded = _loaded_after("from kwork import Kwork")
+    assert "kwork.client" in loaded
+    assert not {"kwork.bot", "kwork.web_client", "websockets"} & loaded
+
+
+def test_lazy_attributes_resolve_to_real_objects() -> None:
+    assert kwork.Kwork is KworkClient
+    assert kwork.KworkBot is KworkBot
+    assert set(kwork.__all__) <= set(dir(kwork))
+
+
+def test_web_client_is_created_on_first_access() -> None:
+    client = KworkClient(login="x", password="y")
+    assert client._web_client is None
+    assert client.web is client.web
@@ -0,0 +1,89 @@
+import asyncio
+import copy
+import pickle
+from typing import Any
+
+import pytest
+from kwork.client import KworkClient
+from kwork.schema import Actor, DialogMessage, WantWorker
+from kwork.schema.lazy import LazyModel
+from pydantic import ValidationError
+
+
+def test_lazy_model_validates_fields_on_access_with_aliases_and_defaults() -> None:
+    item = LazyModel(
+        DialogMessage,
+        {"user_id": "42", "username": "bob", "lastMessage": {"fromUserId": 7, "message": "hi"}},
+    )
+
+    assert item.user_id == 42
+    assert item.username == "bob"
+    assert item.last_message_obj.from_user_id == 7
+    assert item.archived is None
+    assert item._values is not None and set(item._values) == {
+        "user_id",
+        "username",
+        "last_message_obj",
+        "archived",
+    }
+    with pytest.raises(AttributeError):
+        _ = item.no_such_field
+
+
+def test_lazy_model_validate_returns_full_model() -> None:
+    raw = {"id": 1, "title": "t", "kworks": [{"id": 5, "title": "k"}]}
+    item = LazyModel(Actor, raw)
+
+    full = item.validate()
+    assert isinstance(full, Actor)
+    assert full is item.validate()
+    assert item.kworks[0].id == 5
+    assert item.model_dump()["id"] == 1
+    assert item.raw is raw
+
+
+def test_lazy_model_raises_validation_error_only_for_accessed_bad_field() -> None:
+    item = LazyModel(WantWorker, {"id": 1, "price": "not-a-number"})
+    assert item.id == 1
+    with pytest.raises(ValidationError):
+        _ = item.price
+
+
+def test_lazy_model_copies_and_pickles() -> None:
+    item = LazyModel(DialogMessage, {"user_id": "42", "username": "bob"})
+    assert item.user_id == 42
+    for clone in (copy.copy(item), copy.deepcopy(item), pickle.loads(pickle.dumps(item))):
+        assert clone is not item
+        assert clone.raw == item.raw
+        assert (clone.user_id, clone.username) == (42, "bob")
+    assert copy.deepcopy(item).raw is not item.raw
+
+    item.validate()
+    assert pickle.loads(pickle.dumps(item)).validate() == item.validate()
+    with pytest.raises(AttributeError):
+        _ = item.__no_such_dunder__
+
+
+class _Client(KworkClient):
+    def __init__(self, response: Any, **kwargs: Any) -> None:
+        super().__init__(login="x", password="y", **kwargs)
+        self._response = response
+
+    async def request(self, method: str, endpoint: str, use_token: bool = False, **params: Any):
+        return {"success": True, "response": self._response}
+
+
+def test_client_lazy_mode_per_client_and_per_call() -> None:
+    raw = [{"id": 1, "title": "a"}, {"id": 2, "title": "b"}]
+
+    lazy_client = _Client(raw, lazy_models=True)
+    projects = asyncio.run(lazy_client.get_projects([]))
+    assert all(isinstance(p, LazyModel) for p in projects)
+    assert [p.title for p in projects] == ["a", "b"]
+
+    eager = asyncio.run(lazy_client.get_projects([], lazy=False))
+    assert all(isinstance(p, WantWorker) for p in eager)
+
+    eager_client = _Client(raw)
+    assert isinstance(asyncio.run(eager_client.get_projects([]))[0], WantWorker)
+    assert isinstance(asyncio.run(eager_client.get_projects([], lazy=True))[0], LazyModel)
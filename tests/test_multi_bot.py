@@ -0,0 +1,112 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from kwork.bot import KworkBot
+from kwork.event_parser import EventParser
+from kwork.exceptions import KworkBotException, KworkException
+from kwork.multi_bot import KworkMultiBot
+from kwork.schema import BaseEvent, Message
+
+
+def test_handlers_are_shared_between_accounts() -> None:
+    runner = KworkMultiBot()
+    a = runner.add_account("a", "pa")
+    b = runner.add_account("b", "pb", account="second")
+
+    @runner.message_handler(text="hi")
+    async def _hi(message: Message) -> None:  # pragma: no cover - not called
+        pass
+
+    assert runner.accounts == ("a", "second")
+    assert a._handlers is b._handlers
+    assert len(a._handlers) == 1
+
+
+def test_add_bot_keeps_handlers_registered_on_the_bot() -> None:
+    runner = KworkMultiBot()
+
+    @runner.message_handler(text="hi")
+    async def _hi(message: Message) -> None:  # pragma: no cover - not called
+        pass
+
+    bot = KworkBot("a", "p")
+
+    @bot.message_handler(text_contains="order")
+    async def _order(message: Message) -> None:  # pragma: no cover - not called
+        pass
+
+    runner.add_bot(bot)
+    other = runner.add_account("b", "p")
+    assert [h.func for h in other._handlers] == [_hi, _order]
+    assert bot._handlers is other._handlers
+
+
+def test_duplicate_account_is_rejected() -> None:
+    runner = KworkMultiBot()
+    runner.add_account("a", "p")
+    with pytest.raises(KworkBotException):
+        runner.add_account("a", "p")
+
+
+def test_event_parser_attaches_account_to_message() -> None:
+    bot = KworkBot(login="x", password="y", account="acc-1")
+    parser = EventParser(bot, account=bot.account)
+    event = BaseEvent(event="new_inbox", data={"from": 5, "inboxMessage": "hi"})
+
+    message = asyncio.run(parser.extract_message(event))
+
+    assert message is not None
+    assert message.account == "acc-1"
+
+
+def test_run_account_dispatches_and_reconnects_with_stagger() -> None:
+    async def _run() -> None:
+        runner = KworkMultiBot(start_stagger=0.0, reconnect_delay=0.0)
+        bot = runner.add_account("a", "p")
+        received: list[tuple[str | None, str]] = []
+
+        @runner.message_handler()
+        async def _any(message: Message) -> None:
+            received.append((message.account, message.text))
+            if message.text == "boom":
+                raise RuntimeError("handler failed")
+
+        connects = 0
+
+        async def _loop():
+            nonlocal connects
+            connects += 1
+            if connects == 1:
+                yield Message(api=bot, from_id=1, text="boom", account=bot.account)
+                yield Message(api=bot, from_id=1, text="ok", account=bot.account)
+                raise KworkException("WebSocket connection closed")
+            await asyncio.Event().wait()
+
+        bot._websocket_loop = _loop  # type: ignore[method-assign]
+
+        task = asyncio.create_task(runner._run_account(bot, delay=0.0))
+        for _ in range(10):
+            await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        stats = runner.metrics()["a"]
+        assert received == [("a", "boom"), ("a", "ok")]
+        assert stats.messages == 2
+        assert stats.handler_errors == 1
+        assert stats.reconnects == 1
+        assert stats.connects == 2
+
+    asyncio.run(_run())
+
+
+def test_run_requires_accounts_and_handlers() -> None:
+    runner = KworkMultiBot()
+    with pytest.raises(KworkBotException):
+        asyncio.run(runner.run())
+
+    runner.message_handler()(AsyncMock())
+    with pytest.raises(KworkBotException):
+        asyncio.run(runner.run())
@@ -0,0 +1,63 @@
+import asyncio
+import importlib.util
+import sys
+from pathlib import Path
+from typing import Any
+
+from kwork.client import KworkClient
+from kwork.openapi_mixin import OpenAPIMethodsMixin
+from kwork.openapi_typed_mixin import OpenAPITypedMethodsMixin
+from kwork.schema import openapi_models as m
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _load_generator() -> Any:
+    path = ROOT / "scripts" / "generate_openapi_mixin.py"
+    spec = importlib.util.spec_from_file_location("generate_openapi_mixin", path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_generator_covers_checked_in_mixins() -> None:
+    gen = _load_generator()
+    spec = gen.load_spec()
+    renderer = gen.ModelRenderer(spec["components"]["schemas"])
+
+    names = [name for name, *_ in gen.iter_operations(spec)]
+    raw = [n for n in vars(OpenAPIMethodsMixin) if not n.startswith("_")]
+    assert names == raw
+
+    typed = {
+        f"{name}_typed"
+        for name, _method, _endpoint, op in gen.iter_operations(spec)
+        if gen.typed_response(op, renderer) is not None
+    }
+    assert typed == {n for n in vars(OpenAPITypedMethodsMixin) if n.endswith("_typed")}
+
+
+def test_models_are_slotted_and_accept_aliases() -> None:
+    user = m.User(id=1, username="bob")
+    assert not hasattr(user, "__dict__")
+    assert user.username == "bob"
+
+    # "price-from" isn't a valid identifier: the field is renamed and keeps the API key as alias.
+    wants_filter = m.WantsFilter(**{"price-from": 100})  # type: ignore[arg-type]
+    assert wants_filter.price_from == 100
+
+
+def test_typed_wrapper_validates_response() -> None:
+    client = KworkClient(login="x", password="y")
+    calls: list[tuple[str, dict[str, Any]]] = []
+
+    async def fake_request(method: str, endpoint: str, **params: Any) -> dict[str, Any]:
+        calls.append((endpoint, params))
+        return {"success": True, "response": [{"id": "5", "username": "a", "unknown": 1}]}
+
+    client.request = fake_request  # type: ignore[method-assign]
+    out = asyncio.run(client.user_search_typed(query="a"))
+    assert [u.id for u in out] == [5]
+    assert calls[0][0] == "userSearch"
@@ -0,0 +1,88 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any, ClassVar
+
+from kwork.api import AUTH_HEADER, KworkAPI
+from kwork.deadline import current_deadline, deadline
+from kwork.token_store import StoredToken
+from yarl import URL
+
+
+class _Response:
+    status = 200
+    content_type = "application/json"
+    headers: ClassVar[dict[str, str]] = {}
+
+    async def text(self, *, errors: str = "strict") -> str:
+        return '{"success": true, "response": []}'
+
+
+class _Transport:
+    closed = False
+    cookie_jar = None
+
+    def __init__(self) -> None:
+        self.calls: list[dict[str, Any]] = []
+
+    @asynccontextmanager
+    async def request(self, **kwargs: Any) -> AsyncIterator[_Response]:
+        self.calls.append(kwargs)
+        yield _Response()
+
+    async def close(self) -> None:
+        pass
+
+
+def test_urls_headers_and_timeouts_are_reused() -> None:
+    async def _run() -> None:
+        api = KworkAPI("login", "password", api_host="https://api.example.test/{}")
+        transport = _Transport()
+        api._session = transport  # type: ignore[assignment]
+        api._token = "tok"
+
+        await api.request("post", "projects", use_token=True, timeout=5)
+        await api.request("post", "projects", page=None, timeout=5.0)
+        await api.request("post", "user", _headers={"X-Extra": "1"})
+
+        first, second, third = transport.calls
+        assert first["url"] == URL("https://api.example.test/projects")
+        assert first["url"] is second["url"]
+        assert first["params"] == {"token": "tok"}
+        assert second["params"] == {}
+        assert first["headers"] is second["headers"]
+        assert first["timeout"] is second["timeout"]
+        assert first["timeout"].total == 5.0
+        assert third["headers"] == {"Authorization": AUTH_HEADER, "X-Extra": "1"}
+        # Extra headers never leak into the shared default headers.
+        assert first["headers"] == {"Authorization": AUTH_HEADER}
+
+    asyncio.run(_run())
+
+
+def test_token_with_expiry_is_still_checked() -> None:
+    async def _run() -> None:
+        api = KworkAPI("login", "password")
+        api._token = "plain"
+        assert await api.get_token() == "plain"
+
+        signed_in: list[str] = []
+
+        async def _sign_in() -> StoredToken:
+            signed_in.append("x")
+            return StoredToken("fresh", None)
+
+        api._sign_in = _sign_in  # type: ignore[method-assign]
+        api._token_expires_at = 0.0  # long expired
+        assert await api.get_token() == "fresh"
+        assert signed_in == ["x"]
+
+    asyncio.run(_run())
+
+
+def test_deadline_none_keeps_outer_scope() -> None:
+    with deadline(None) as none_at:
+        assert none_at is None
+    with deadline(10) as at, deadline(None) as inner:
+        assert inner == at == current_deadline()
+    assert current_deadline() is None
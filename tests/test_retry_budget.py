@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+from kwork.client import KworkClient
+from kwork.exceptions import KworkHTTPException
+from kwork.retry_budget import RetryBudget
+from kwork.testing import FakeKworkServer
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_budget_spends_share_of_successes_and_refills_over_time() -> None:
+    clock = _Clock()
+    budget = RetryBudget(ratio=0.5, min_per_second=0.1, max_tokens=2, clock=clock)
+
+    assert budget.try_withdraw()
+    assert budget.try_withdraw()
+    assert not budget.try_withdraw()
+
+    budget.deposit()
+    assert not budget.try_withdraw()  # 0.5 tokens
+    budget.deposit()
+    assert budget.try_withdraw()
+
+    clock.now = 10.0  # +1 token from min_per_second
+    assert budget.try_withdraw()
+    stats = budget.stats()
+    assert (stats.successes, stats.retries, stats.rejected) == (2, 4, 2)
+    assert stats.tokens == pytest.approx(0.0)
+
+    with pytest.raises(ValueError):
+        RetryBudget(max_tokens=0.5)
+
+
+def test_client_stops_retrying_when_budget_is_exhausted() -> None:
+    async def _run() -> None:
+        async with FakeKworkServer(projects=5) as server:
+            budget = RetryBudget(ratio=0.1, min_per_second=0, max_tokens=2)
+            async with KworkClient(
+                "me",
+                "pw",
+                api_host=server.api_host,
+                retry_max_attempts=5,
+                retry_backoff_base=0,
+                retry_budget=budget,
+            ) as client:
+                server.fail_next("projects", 503, times=10)
+                with pytest.raises(KworkHTTPException) as exc_info:
+                    await client.get_projects([11])
+                assert exc_info.value.status == 503
+                # The first attempt plus two budgeted retries instead of five attempts.
+                assert server.stats["projects"].requests == 3
+                assert client.retry_budget is budget
+                stats = budget.stats()
+                assert (stats.successes, stats.retries, stats.rejected) == (1, 2, 1)
+
+    asyncio.run(_run())
@@ -1,4 +1,7 @@
+import json
+
 from kwork.schema import Category, DialogMessage, ParentCategory, SubCategory
+from kwork.schema.adapters import list_adapter, parse_list, parse_list_json
 from kwork.schema.kwork_object import KworkObject
 
 
@@ -75,3 +78,13 @@ def test_kwork_object_parses_nested_models() -> None:
     assert obj.activity is not None
     assert obj.activity.views == 10
     assert obj.is_subscription is True
+
+
+def test_list_adapter_is_cached_and_matches_per_item_validation() -> None:
+    items = [{"user_id": 1, "lastMessage": {"fromUserId": 2}}, {"user_id": 3}]
+
+    assert list_adapter(DialogMessage) is list_adapter(DialogMessage)
+    assert parse_list(DialogMessage, items) == [DialogMessage(**d) for d in items]
+    assert parse_list_json(DialogMessage, json.dumps(items).encode()) == parse_list(
+        DialogMessage, items
+    )
@@ -0,0 +1,150 @@
+import asyncio
+import time
+from collections.abc import Callable
+
+import pytest
+from kwork.exceptions import KworkShardWorkerFailed
+from kwork.multi_bot import KworkMultiBot
+from kwork.schema import Message
+from kwork.sharding import AccountSpec, HashRing, ShardSupervisor
+from kwork.testing import FakeKworkServer
+
+
+def _setup(runner: KworkMultiBot) -> None:
+    @runner.message_handler()
+    async def _noop(message: Message) -> None:
+        pass
+
+
+def _broken_setup(runner: KworkMultiBot) -> None:
+    raise RuntimeError("bad handler config")
+
+
+def _accounts(n: int) -> list[AccountSpec]:
+    return [AccountSpec(login=f"user{i}", password="p") for i in range(n)]
+
+
+def test_hash_ring_is_stable_and_moves_few_keys_on_add() -> None:
+    ring = HashRing(["w0", "w1", "w2"])
+    keys = [f"acc{i}" for i in range(1000)]
+    before = {k: ring.get(k) for k in keys}
+    assert before == {k: HashRing(["w2", "w0", "w1"]).get(k) for k in keys}
+
+    ring.add("w3")
+    after = {k: ring.get(k) for k in keys}
+    moved = [k for k in keys if before[k] != after[k]]
+    # Only keys that now belong to the new node move.
+    assert all(after[k] == "w3" for k in moved)
+    assert 100 < len(moved) < 450
+
+
+def test_hash_ring_remove_restores_previous_mapping() -> None:
+    ring = HashRing(["a", "b"])
+    before = {str(i): ring.get(str(i)) for i in range(200)}
+    ring.add("c")
+    ring.remove("c")
+    assert {str(i): ring.get(str(i)) for i in range(200)} == before
+    with pytest.raises(LookupError):
+        HashRing().get("x")
+
+
+def test_supervisor_assigns_every_account_once_and_rebalances() -> None:
+    async def _run() -> None:
+        sup = ShardSupervisor(_accounts(50), _setup, workers=2)
+        assignments = sup.assignments()
+        assert set(assignments) == {"worker-0", "worker-1"}
+        assert sorted(s.key for specs in assignments.values() for s in specs) == sorted(
+            f"user{i}" for i in range(50)
+        )
+
+        new_id = await sup.add_worker()
+        rebalanced = sup.assignments()
+        assert new_id in rebalanced
+        for worker_id in ("worker-0", "worker-1"):
+            assert set(rebalanced[worker_id]) <= set(assignments[worker_id])
+
+        await sup.remove_worker(new_id)
+        assert sup.assignments() == assignments
+
+    asyncio.run(_run())
+
+
+def test_supervisor_rejects_duplicate_accounts() -> None:
+    with pytest.raises(ValueError):
+        ShardSupervisor(_accounts(1) * 2, _setup)
+
+
+def test_workers_serve_their_accounts_and_restart_after_crash() -> None:
+    async def _run() -> None:
+        async with FakeKworkServer() as server:
+            sup = ShardSupervisor(
+                _accounts(2),
+                _setup,
+                workers=1,
+                metrics_interval=0.05,
+                poll_interval=0.02,
+                restart_delay=0.0,
+                bot_kwargs={"api_host": server.api_host, "websocket_uri": server.websocket_uri},
+                runner_kwargs={"start_stagger": 0.0, "reconnect_delay": 0.05},
+            )
+            task = asyncio.create_task(sup.run())
+
+            async def _wait_for(cond: Callable[[], bool], timeout: float = 20.0) -> None:
+                deadline = time.monotonic() + timeout
+                while not cond():
+                    assert time.monotonic() < deadline
+                    await asyncio.sleep(0.05)
+
+            def _messages(account: str) -> int:
+                accounts = sup.metrics()["workers"]["worker-0"]["accounts"]
+                return accounts.get(account, {}).get("messages", 0)
+
+            try:
+                # Both accounts signed in, got their channel and listen on the websocket.
+                await server.wait_for_connections(2, timeout=20.0)
+                server.push_message(7, "hello")
+                await _wait_for(lambda: _messages("user0") == 1 and _messages("user1") == 1)
+                assert server.stats["signIn"].requests == 2
+
+                worker = sup._workers["worker-0"]
+                assert worker.process is not None
+                worker.process.kill()
+                await _wait_for(lambda: sup.metrics()["workers"]["worker-0"]["restarts"] == 1)
+                # The restarted process reports fresh counters, then reconnects both accounts.
+                await _wait_for(lambda: _messages("user0") == 0 and _messages("user1") == 0)
+                await _wait_for(lambda: server.connections == 2)
+                server.push_message(7, "again")
+                await _wait_for(lambda: _messages("user0") == 1 and _messages("user1") == 1)
+            finally:
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+
+            assert sup._workers["worker-0"].process is None
+
+    asyncio.run(_run())
+
+
+def test_worker_failing_on_startup_backs_off_and_surfaces_the_failure() -> None:
+    async def _run() -> None:
+        sup = ShardSupervisor(
+            _accounts(1),
+            _broken_setup,
+            workers=1,
+            poll_interval=0.02,
+            restart_delay=0.05,
+            max_restarts=2,
+        )
+        started = time.monotonic()
+        with pytest.raises(KworkShardWorkerFailed) as exc_info:
+            await asyncio.wait_for(sup.run(), timeout=30.0)
+
+        assert exc_info.value.worker_id == "worker-0"
+        assert exc_info.value.exitcode == 1
+        worker = sup._workers["worker-0"]
+        # Two restarts, 0.05 s and then 0.1 s after the crashes; the third crash gives up.
+        assert worker.restarts == 2
+        assert time.monotonic() - started >= 0.15
+        assert worker.process is None
+
+    asyncio.run(_run())
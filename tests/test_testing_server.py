@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+from kwork.bot import KworkBot
+from kwork.client import KworkClient
+from kwork.exceptions import KworkException
+from kwork.schema import Message
+from kwork.testing import FakeKworkServer, FaultConfig
+
+
+def test_client_round_trip_against_fake_server() -> None:
+    async def _run() -> None:
+        async with FakeKworkServer(projects=15) as server:
+            server.add_user(42, "alice")
+            async with KworkClient("me", "pw", api_host=server.api_host) as client:
+                projects = await client.get_projects([11])
+                assert [p.id for p in projects] == list(range(1, 11))
+                assert (await client.get_connects()).all_connects == 10
+
+                await client.send_message(42, "hello")
+                server.push_message(42, "hi back")
+
+                dialogs = await client.get_dialogs_page()
+                assert [(d.user_id, d.last_message) for d in dialogs] == [(42, "hi back")]
+                inbox = await client.get_dialog_with_user("alice")
+                assert [m.message for m in inbox] == ["hi back", "hello"]
+                assert await client.get_channel() == f"channel-{inbox[1].from_id}"
+
+            assert server.stats["signIn"].requests == 1
+
+    asyncio.run(_run())
+
+
+def test_sign_in_rejects_unknown_credentials() -> None:
+    async def _run() -> None:
+        async with (
+            FakeKworkServer(accounts={"me": "secret"}) as server,
+            KworkClient("me", "wrong", api_host=server.api_host) as client,
+        ):
+            with pytest.raises(KworkException):
+                await client.get_token()
+
+    asyncio.run(_run())
+
+
+def test_fault_injection_exercises_retries_and_relogin() -> None:
+    async def _run() -> None:
+        async with (
+            FakeKworkServer(faults=FaultConfig(retry_after=0)) as server,
+            KworkClient(
+                "me",
+                "pw",
+                api_host=server.api_host,
+                retry_max_attempts=3,
+                retry_backoff_base=0,
+                relogin_on_auth_error=True,
+            ) as client,
+        ):
+            server.fail_next("projects", 429)
+            server.fail_next("projects", 503)
+            assert await client.get_projects([11])
+            stats = server.stats["projects"]
+            assert (stats.requests, stats.rate_limited, stats.errors) == (3, 1, 1)
+
+            server.expire_tokens()
+            assert await client.get_channel()
+            assert server.stats["getChannel"].unauthorized == 1
+            assert server.stats["signIn"].requests == 2
+
+    asyncio.run(_run())
+
+
+def test_seeded_faults_are_reproducible() -> None:
+    async def _statuses() -> list[int]:
+        faults = FaultConfig(error_rate=0.3, rate_limit_rate=0.2, seed=7)
+        async with (
+            FakeKworkServer(faults=faults) as server,
+            KworkClient("me", "pw", api_host=server.api_host) as client,
+        ):
+            out: list[int] = []
+            for _ in range(20):
+                try:
+                    await client.request("post", "signIn", login="me", password="pw")
+                    out.append(200)
+                except KworkException as e:
+                    out.append(getattr(e, "status", 0))
+            return out
+
+    first = asyncio.run(_statuses())
+    assert first == asyncio.run(_statuses())
+    assert {200, 429, 500} <= set(first)
+
+
+def test_bot_receives_generated_messages_over_websocket() -> None:
+    async def _run() -> None:
+        async with FakeKworkServer() as server:
+            bot = KworkBot("me", "pw", api_host=server.api_host, websocket_uri=server.websocket_uri)
+            received: list[Message] = []
+            done = asyncio.Event()
+
+            @bot.message_handler()
+            async def on_message(message: Message) -> None:
+                received.append(message)
+                if len(received) == 5:
+                    done.set()
+
+            task = asyncio.create_task(bot.run())
+            await server.wait_for_connections(1)
+            server.generate_messages(rate=1000, count=5, users=2)
+            await asyncio.wait_for(done.wait(), timeout=5)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+            assert [m.text for m in received] == [f"message {n}" for n in range(5)]
+            assert {m.from_id for m in received} == {1, 2}
+
+    asyncio.run(_run())
@@ -0,0 +1,108 @@
+import asyncio
+import json
+import time
+from typing import Any
+
+import pytest
+from kwork.api import KworkAPI
+from kwork.token_store import MemoryTokenStore, StoredToken
+
+
+class _SignInCounter(KworkAPI):
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(login="x", password="y", **kwargs)
+        self.sign_ins = 0
+        self.lifetime: int | None = 3600
+
+    async def request_with_body(self, endpoint: str, **kwargs: Any) -> dict[str, Any]:
+        assert endpoint == "signIn"
+        self.sign_ins += 1
+        await asyncio.sleep(0)
+        payload: dict[str, Any] = {"token": f"t{self.sign_ins}"}
+        if self.lifetime is not None:
+            payload["expired"] = self.lifetime
+        return {"success": True, "response": payload}
+
+
+def test_concurrent_get_token_signs_in_once() -> None:
+    async def _run() -> None:
+        api = _SignInCounter()
+        tokens = await asyncio.gather(*(api.get_token() for _ in range(20)))
+        assert set(tokens) == {"t1"}
+        assert api.sign_ins == 1
+
+    asyncio.run(_run())
+
+
+def test_token_store_is_used_before_sign_in() -> None:
+    async def _run() -> None:
+        store = MemoryTokenStore()
+        first = _SignInCounter(token_store=store)
+        assert await first.get_token() == "t1"
+
+        second = _SignInCounter(token_store=store)
+        assert await second.get_token() == "t1"
+        assert second.sign_ins == 0
+
+    asyncio.run(_run())
+
+
+def test_proactive_refresh_before_expiry() -> None:
+    async def _run() -> None:
+        api = _SignInCounter(token_refresh_margin=600)
+        api.lifetime = 300  # already inside the refresh margin
+        assert await api.get_token() == "t1"
+        assert await api.get_token() == "t2"
+
+        api.lifetime = 3600
+        assert await api.get_token() == "t3"
+        assert await api.get_token() == "t3"
+
+    asyncio.run(_run())
+
+
+def test_expired_stored_token_is_ignored() -> None:
+    async def _run() -> None:
+        store = MemoryTokenStore()
+        api = _SignInCounter(token_store=store)
+        await store.save(api._token_store_key, StoredToken("old", expires_at=time.time() - 1))
+        assert await api.get_token() == "t1"
+        assert (await store.load(api._token_store_key)) == StoredToken("t1", api._token_expires_at)
+
+    asyncio.run(_run())
+
+
+def test_invalidate_token_ignores_stale_token() -> None:
+    async def _run() -> None:
+        store = MemoryTokenStore()
+        api = _SignInCounter(token_store=store)
+        await api.get_token()
+
+        await api.invalidate_token("not-current")
+        assert api._token == "t1"
+
+        await api.invalidate_token("t1")
+        assert api._token is None
+        assert await store.load(api._token_store_key) is None
+
+    asyncio.run(_run())
+
+
+def test_encrypted_file_store_roundtrip(tmp_path) -> None:
+    fernet = pytest.importorskip("cryptography.fernet")
+    from kwork.token_store import EncryptedFileTokenStore
+
+    async def _run() -> None:
+        path = tmp_path / "tokens.bin"
+        store = EncryptedFileTokenStore(path, fernet.Fernet.generate_key())
+        await store.save("acc", StoredToken("secret-token", 123.0))
+
+        assert b"secret-token" not in path.read_bytes()
+        assert await store.load("acc") == StoredToken("secret-token", 123.0)
+        with pytest.raises(json.JSONDecodeError):
+            json.loads(path.read_bytes())
+
+        await store.clear("acc")
+        assert await store.load("acc") is None
+
+    asyncio.run(_run())
@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from kwork.api import KworkAPI
+from kwork.exceptions import KworkHTTPException, KworkRetryExceeded
+from kwork.web_client import KworkWebClient
+
+
+async def _handler(request: web.Request) -> web.Response:
+    endpoint = request.match_info["endpoint"]
+    if endpoint == "slow":
+        await asyncio.sleep(1)
+    if endpoint == "missing":
+        return web.json_response({"success": False}, status=404)
+    if request.content_type.startswith("multipart/"):
+        form = await request.post()
+        fields = {
+            k: (v.file.read().decode() if isinstance(v, web.FileField) else v)
+            for k, v in form.items()
+        }
+    else:
+        fields = dict(await request.post())
+    resp = web.json_response(
+        {
+            "success": True,
+            "query": dict(request.query),
+            "fields": fields,
+            "csrf": request.headers.get("X-CSRF-Token"),
+        }
+    )
+    resp.set_cookie("csrf_token", "from-server")
+    return resp
+
+
+@pytest.mark.parametrize("backend", ["aiohttp", "httpx"])
+def test_backends_send_the_same_requests(backend: str) -> None:
+    if backend == "httpx":
+        pytest.importorskip("httpx")
+
+    async def _run() -> None:
+        app = web.Application()
+        app.router.add_route("*", "/{endpoint}", _handler)
+        server = TestServer(app)
+        await server.start_server()
+        base = str(server.make_url("/"))
+        try:
+            async with KworkAPI(
+                "x", "y", api_host=base + "{}", http_backend=backend, timeout=0.3
+            ) as api:
+                data = await api.request("post", "plain", page=2)
+                assert data["query"] == {"page": "2"}
+
+                data = await api.request_with_body("body", body={"text": "hi"})
+                assert data["fields"] == {"text": "hi"}
+
+                data = await api.request_multipart(
+                    "upload", fields={"a": "1"}, files={"file": ("f.txt", b"payload")}
+                )
+                assert data["fields"] == {"a": "1", "file": "payload"}
+
+                with pytest.raises(KworkHTTPException) as exc_info:
+                    await api.request("post", "missing")
+                assert exc_info.value.status == 404
+
+                with pytest.raises(KworkRetryExceeded) as retry_info:
+                    await api.request("post", "slow")
+                assert isinstance(retry_info.value.last_error, asyncio.TimeoutError)
+
+                if backend == "aiohttp":
+                    return
+                web_client = KworkWebClient(api, base_url=base)
+                await web_client.request("GET", "page")
+                resp = await web_client.request(
+                    "POST", "xhr", headers={"X-Requested-With": "XMLHttpRequest"}
+                )
+                assert resp["json"] is not None and resp["json"]["csrf"] == "from-server"
+                async with web_client.stream("GET", "big") as raw:
+                    chunks = [chunk async for chunk in raw.content.iter_chunked(8)]
+                assert b"".join(chunks).startswith(b"{")
+        finally:
+            await server.close()
+
+    asyncio.run(_run())
+
+
+def test_unknown_backend_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        KworkAPI("x", "y", http_backend="requests")  # type: ignore[arg-type]
@@ -0,0 +1,195 @@
+import asyncio
+import io
+from pathlib import Path
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from kwork.api import KworkAPI
+from kwork.uploads import build_file_part
+
+
+async def _start_upload_server(statuses: list[int]) -> tuple[TestServer, list[dict[str, bytes]]]:
+    received: list[dict[str, bytes]] = []
+
+    async def handler(request: web.Request) -> web.Response:
+        reader = await request.multipart()
+        parts: dict[str, bytes] = {}
+        async for part in reader:
+            parts[f"{part.name}:{part.filename}"] = await part.read()  # type: ignore[union-attr]
+        received.append(parts)
+        status = statuses.pop(0) if statuses else 200
+        return web.json_response({"success": status == 200, "response": {}}, status=status)
+
+    app = web.Application()
+    app.router.add_post("/{endpoint}", handler)
+    server = TestServer(app)
+    await server.start_server()
+    return server, received
+
+
+def _api(server: TestServer, **kwargs) -> KworkAPI:
+    return KworkAPI(
+        login="x",
+        password="y",
+        api_host=f"http://{server.host}:{server.port}/{{}}",
+        retry_backoff_base=0.0,
+        retry_jitter=0.0,
+        **kwargs,
+    )
+
+
+def test_multipart_streams_file_in_chunks_and_reports_progress(tmp_path: Path) -> None:
+    payload = bytes(range(256)) * 1200  # ~300 KB
+    path = tmp_path / "photo.png"
+    path.write_bytes(payload)
+
+    async def _run() -> None:
+        server, received = await _start_upload_server([])
+        api = _api(server)
+        calls: list[tuple[int, int | None]] = []
+        try:
+            await api.request_multipart(
+                "uploadPortfolioFile",
+                fields={"type": "photo"},
+                files={"file": path, "extra": ("notes.txt", b"hello")},
+                progress=lambda sent, total: calls.append((sent, total)),
+                chunk_size=64 * 1024,
+            )
+        finally:
+            await api.close()
+            await server.close()
+
+        assert received[0]["file:photo.png"] == payload
+        assert received[0]["extra:notes.txt"] == b"hello"
+        total = len(payload) + 5
+        assert calls[-1] == (total, total)
+        # 5 chunks for the file + 1 for the bytes part.
+        assert len(calls) == 6
+
+    asyncio.run(_run())
+
+
+def test_multipart_retry_reopens_path_and_opener(tmp_path: Path) -> None:
+    path = tmp_path / "a.bin"
+    path.write_bytes(b"x" * 1000)
+    opened: list[io.BytesIO] = []
+
+    def opener() -> io.BytesIO:
+        opened.append(io.BytesIO(b"y" * 10))
+        return opened[-1]
+
+    async def _run() -> None:
+        server, received = await _start_upload_server([503, 200])
+        api = _api(server)
+        try:
+            data = await api.request_multipart(
+                "fileUpload",
+                files={"a": path, "b": ("b.bin", opener)},
+                max_attempts=2,
+            )
+        finally:
+            await api.close()
+            await server.close()
+
+        assert data["success"] is True
+        assert len(received) == 2
+        assert received[0] == received[1] == {"a:a.bin": b"x" * 1000, "b:b.bin": b"y" * 10}
+
+    asyncio.run(_run())
+    # Exactly one open per attempt; the size is taken from the streamed handle.
+    assert len(opened) == 2
+    assert all(f.closed for f in opened)
+
+
+def test_multipart_file_object_cannot_be_retried() -> None:
+    async def _run() -> None:
+        api = KworkAPI(login="x", password="y")
+        with pytest.raises(ValueError):
+            await api.request_multipart(
+                "fileUpload", files={"f": io.BytesIO(b"data")}, max_attempts=2
+            )
+
+    asyncio.run(_run())
+
+
+def test_multipart_file_object_is_streamed_and_left_open() -> None:
+    fileobj = io.BytesIO(b"stream me")
+
+    async def _run() -> None:
+        server, received = await _start_upload_server([])
+        api = _api(server)
+        try:
+            await api.request_multipart("fileUpload", files={"f": fileobj})
+        finally:
+            await api.close()
+            await server.close()
+        assert received == [{"f:f": b"stream me"}]
+
+    asyncio.run(_run())
+    assert not fileobj.closed
+
+
+def test_upload_portfolio_files_bounded_concurrency_and_input_order(tmp_path: Path) -> None:
+    from kwork.client import KworkClient
+
+    paths = []
+    for i in range(6):
+        path = tmp_path / f"{i}.jpg"
+        path.write_bytes(b"z" * (100 * (i + 1)))
+        paths.append(path)
+    missing = tmp_path / "missing.jpg"
+
+    async def _run() -> None:
+        client = KworkClient(login="x", password="y")
+        active = 0
+        peak = 0
+
+        async def _fake_upload(**kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            try:
+                path = kwargs["files"]["file"]
+                assert kwargs["retry"] is True
+                # Finish in reverse order to prove results are re-ordered.
+                await asyncio.sleep(0.01 * (10 - int(path.stem)) if path.stem.isdigit() else 0)
+                if not path.exists():
+                    raise FileNotFoundError(path)
+                kwargs["progress"](path.stat().st_size, path.stat().st_size)
+                return {"success": True, "response": {"name": path.name}}
+            finally:
+                active -= 1
+
+        client.upload_portfolio_file = _fake_upload  # type: ignore[method-assign]
+        seen: list[tuple[int, int | None]] = []
+        result = await client.upload_portfolio_files(
+            [*paths, missing],
+            concurrency=2,
+            progress=lambda sent, total: seen.append((sent, total)),
+        )
+
+        assert peak == 2
+        assert [item.path for item in result.items] == [*paths, missing]
+        assert [item.ok for item in result.items] == [True] * 6 + [False]
+        assert isinstance(result.failed[0].error, FileNotFoundError)
+        assert result.items[0].response == {"success": True, "response": {"name": "0.jpg"}}
+        assert result.uploaded_bytes == sum(100 * (i + 1) for i in range(6))
+        assert result.throughput > 0
+        # Total is unknown because one file can't be stat'ed.
+        assert seen[-1] == (result.uploaded_bytes, None)
+
+    asyncio.run(_run())
+
+
+def test_opener_part_closes_a_handle_that_was_never_sent() -> None:
+    handle = io.BytesIO(b"z" * 5)
+
+    async def _run() -> None:
+        part, reusable = await build_file_part("f", ("f.bin", lambda: handle))
+        assert reusable
+        assert part.size == 5
+        await part.close()
+
+    asyncio.run(_run())
+    assert handle.closed
@@ -1,4 +1,14 @@
-from kwork.web_client import KworkWebClient
+import asyncio
+import json
+
+import pytest
+from aiohttp import ClientSession, web
+from aiohttp.test_utils import TestServer
+from kwork.api import KworkAPI
+from kwork.cookies import KworkCookieJar
+from kwork.exceptions import KworkException
+from kwork.web_client import ExchangeOffer, KworkWebClient
+from yarl import URL
 
 
 def test_extract_draft_key_from_common_patterns() -> None:
@@ -54,3 +64,153 @@ def test_maybe_add_csrf_headers_does_not_override_existing_csrf_header() -> None
     headers = {"X-Requested-With": "XMLHttpRequest", "X-CSRF-Token": "already"}
     wc._maybe_add_csrf_headers("https://kwork.ru/x", headers)
     assert headers["X-CSRF-Token"] == "already"
+
+
+def test_cookie_jar_caches_lookups_until_modified() -> None:
+    async def _run() -> None:
+        jar = KworkCookieJar()
+        url = URL("https://kwork.ru/api/offer/createoffer")
+        jar.update_cookies({"csrf_token": "one"}, URL("https://kwork.ru/"))
+        first = jar.cookie_values(url)
+        assert dict(first) == {"csrf_token": "one"}
+        assert jar.cookie_values(url) is first
+
+        jar.update_cookies({"csrf_token": "two"}, URL("https://kwork.ru/"))
+        assert jar.cookie_values(url)["csrf_token"] == "two"
+        jar.clear()
+        assert dict(jar.cookie_values(url)) == {}
+
+    asyncio.run(_run())
+
+
+def test_request_lazy_defers_decoding_and_stream_skips_body() -> None:
+    async def handler(request: web.Request) -> web.Response:
+        resp = web.json_response({"success": True, "csrf": request.headers.get("X-CSRF-Token")})
+        resp.set_cookie("csrf_token", "from-server")
+        return resp
+
+    async def _run() -> None:
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", handler)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            async with KworkAPI("x", "y") as api:
+                # The test server listens on an IP address: allow cookies for it.
+                api._session = ClientSession(cookie_jar=KworkCookieJar(unsafe=True))
+                wc = KworkWebClient(api, base_url=str(server.make_url("/")))
+                first = await wc.request_lazy(
+                    "POST", "xhr", headers={"X-Requested-With": "XMLHttpRequest"}
+                )
+                assert first.status == 200
+                assert first["json"] == {"success": True, "csrf": None}
+                assert first._text is None  # text not decoded until asked for
+                assert '"success"' in first["text"]
+                assert set(first) == {"status", "url", "headers", "text", "json"}
+
+                # `request` keeps returning a plain, mutable dict.
+                second = await wc.request(
+                    "POST", "xhr", headers={"X-Requested-With": "XMLHttpRequest"}
+                )
+                assert type(second) is dict
+                assert second["json"] == {"success": True, "csrf": "from-server"}
+                assert json.loads(json.dumps(second))["status"] == 200
+
+                async with wc.stream("GET", "big") as resp:
+                    chunks = [chunk async for chunk in resp.content.iter_chunked(4)]
+                assert b"".join(chunks).startswith(b"{")
+        finally:
+            await server.close()
+
+    asyncio.run(_run())
+
+
+def test_submit_exchange_offers_reuses_session_state() -> None:
+    hits: dict[str, int] = {}
+    token = "a" * 32
+
+    async def handler(request: web.Request) -> web.Response:
+        path = request.path.strip("/")
+        hits[path] = hits.get(path, 0) + 1
+        if path == "new_offer":
+            return web.Response(text=f'<script>csrf_user_token="{token}"</script>')
+        if path == "api/offer/createoffer" and request.query["wantId"] == "3":
+            return web.json_response({"success": False, "message": "closed"})
+        return web.json_response({"success": True})
+
+    async def _run() -> None:
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", handler)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            async with KworkAPI("x", "y") as api:
+                wc = KworkWebClient(api, base_url=str(server.make_url("/")))
+                offers = [
+                    ExchangeOffer(
+                        project_id=pid,
+                        description="d",
+                        kwork_duration=1,
+                        kwork_price=500,
+                        kwork_name="n",
+                    )
+                    for pid in (1, 2, 3)
+                ]
+                results = await wc.submit_exchange_offers(offers, concurrency=2)
+                assert [r.project_id for r in results] == [1, 2, 3]
+                assert [r.ok for r in results] == [True, True, False]
+                assert "closed" in str(results[2].error)
+                assert results[0].response is not None and results[0].response["status"] == 200
+        finally:
+            await server.close()
+
+        assert hits["new_offer"] == 3
+        assert hits["wants/create_offer_draft"] == 3
+        assert hits["projects/check_is_template"] == 3
+        # Offers 1 and 2 start together; offer 3 reuses the FAQ init of this session.
+        assert hits["quick-faq/init"] == 2
+
+    asyncio.run(_run())
+
+
+def test_submit_exchange_offer_stops_preflight_on_failure() -> None:
+    async def _run(*, concurrent: bool) -> list[str]:
+        events: list[str] = []
+
+        async def open_page(**_kwargs: object) -> dict[str, object]:
+            return {"status": 200, "text": f'csrf_user_token="{"a" * 32}"'}
+
+        async def quick_faq_init(**_kwargs: object) -> None:
+            events.append("faq")
+            raise KworkException("quick-faq/init: down")
+
+        async def slow_step(**_kwargs: object) -> None:
+            events.append("started")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                events.append("cancelled")
+                raise
+
+        async with KworkAPI("x", "y") as api:
+            wc = KworkWebClient(api)
+            wc.open_new_offer_page = open_page  # type: ignore[method-assign]
+            wc.quick_faq_init = quick_faq_init  # type: ignore[method-assign]
+            wc.create_offer_draft = slow_step  # type: ignore[method-assign]
+            wc.check_is_template = slow_step  # type: ignore[method-assign]
+            with pytest.raises(KworkException, match="down"):
+                await wc.submit_exchange_offer(
+                    project_id=1,
+                    description="d",
+                    kwork_duration=1,
+                    kwork_price=500,
+                    kwork_name="n",
+                    concurrent_preflight=concurrent,
+                )
+        return events
+
+    # Sequential: later steps are never even created.
+    assert asyncio.run(_run(concurrent=False)) == ["faq"]
+    # Concurrent: the sibling requests are cancelled.
+    events = asyncio.run(_run(concurrent=True))
+    assert events.count("cancelled") == events.count("started") == 2
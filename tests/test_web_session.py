@@ -0,0 +1,118 @@
+import asyncio
+import time
+from typing import Any
+
+import pytest
+from kwork.api import KworkAPI
+from kwork.exceptions import KworkWebAuthError
+from kwork.web_client import KworkWebClient, WebLoginResult
+from kwork.web_session import WebSessionPool
+
+
+def _patch_web(monkeypatch: pytest.MonkeyPatch, *, expires_at: int | None = None) -> dict[str, Any]:
+    calls: dict[str, Any] = {"logins": 0, "requests": []}
+
+    async def fake_login(self: KworkWebClient, **kwargs: Any) -> WebLoginResult:
+        calls["logins"] += 1
+        await asyncio.sleep(0)
+        self.auth_lost = False
+        return WebLoginResult(
+            token="t",
+            expires_at=expires_at,
+            login_url="https://kwork.ru/login-by-token",
+            url_to_redirect="/",
+            final_url="https://kwork.ru/",
+            status=200,
+        )
+
+    async def fake_request(self: KworkWebClient, method: str, path: str, **kwargs: Any) -> Any:
+        calls["requests"].append(path)
+        url = calls.get("redirect_to", "https://kwork.ru/")
+        self._track_auth(200, url)
+        return {"status": 200, "url": url}
+
+    monkeypatch.setattr(KworkWebClient, "login_via_mobile_web_auth_token", fake_login)
+    monkeypatch.setattr(KworkWebClient, "request", fake_request)
+    return calls
+
+
+def test_pool_logs_in_each_session_once_and_runs_in_parallel(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls = _patch_web(monkeypatch)
+
+    async def _run() -> None:
+        api = KworkAPI("x", "y")
+        async with WebSessionPool(api, size=2, health_check_interval=None) as pool:
+            active = 0
+            peak = 0
+            clients: set[int] = set()
+
+            async def job(web: KworkWebClient) -> None:
+                nonlocal active, peak
+                clients.add(id(web))
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+            await asyncio.gather(*(pool.run(job) for _ in range(6)))
+            assert peak == 2
+            assert len(clients) == 2
+            assert calls["logins"] == 2
+            assert pool.stats() == {"sessions": 2, "idle": 2, "logins": 2}
+        await api.close()
+
+    asyncio.run(_run())
+
+
+def test_pool_relogs_before_expiry_and_after_auth_loss(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = _patch_web(monkeypatch, expires_at=int(time.time()) + 30)
+
+    async def _run() -> None:
+        api = KworkAPI("x", "y")
+        async with WebSessionPool(
+            api, size=1, refresh_margin=60, health_check_interval=None
+        ) as pool:
+            async with pool.session():
+                pass
+            async with pool.session():
+                pass
+            # expires_at is inside refresh_margin: every borrow logs in again.
+            assert calls["logins"] == 2
+
+        calls["logins"] = 0
+        async with WebSessionPool(api, size=1, health_check_interval=None) as pool:
+            attempts = 0
+
+            async def flaky(web: KworkWebClient) -> str:
+                nonlocal attempts
+                attempts += 1
+                if attempts == 1:
+                    raise KworkWebAuthError("csrf_user_token cookie not found")
+                return "ok"
+
+            assert await pool.run(flaky) == "ok"
+            assert calls["logins"] == 2
+        await api.close()
+
+    asyncio.run(_run())
+
+
+def test_health_check_detects_login_redirect(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = _patch_web(monkeypatch)
+
+    async def _run() -> None:
+        api = KworkAPI("x", "y")
+        async with WebSessionPool(api, size=1, health_check_interval=0.01) as pool:
+            async with pool.session():
+                pass
+            await asyncio.sleep(0.02)
+            calls["redirect_to"] = "https://kwork.ru/login?redirect=%2F"
+            async with pool.session() as web:
+                assert calls["requests"] == ["/"]
+                assert calls["logins"] == 2
+                assert not web.auth_lost
+        await api.close()
+
+    asyncio.run(_run())